@@ -0,0 +1,193 @@
+# array_scoring.py
+
+import sys
+import numpy as np
+from nltk.corpus.reader.wordnet import ADJ, VERB, NOUN, ADV
+from preprocessing import tokenize_clean_text
+from sentiment_lexicon import get_tagger, get_wordnet_pos, disambiguate, senti_scores
+
+# Etiquetas de WordNet codificadas como enteros (0 = categoría no relevante)
+WN_TAGS = (None, NOUN, VERB, ADJ, ADV)
+WN_CODES = {tag: code for code, tag in enumerate(WN_TAGS)}
+
+# Ventana de contexto de Lesk: tokens[max(0, i - 5):i + 5], igual que 'score_tagged_tokens'
+CONTEXT_BEFORE = 5
+CONTEXT_AFTER = 5
+
+class EncodedCorpus:
+    """
+    Corpus tokenizado y etiquetado codificado con enteros en formato CSR: los
+    tokens de todos los textos en un único arreglo de ids de vocabulario, y
+    'offsets' con la posición donde empieza cada texto (el texto i ocupa
+    token_ids[offsets[i]:offsets[i + 1]]).
+    """
+
+    def __init__(self):
+        self.vocabulary = []
+        self.word_ids = {}
+        self.token_ids = np.empty(0, dtype=np.int32)
+        self.pos_codes = np.empty(0, dtype=np.int8)
+        self.offsets = np.zeros(1, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def nbytes(self):
+        """
+        Memoria aproximada del corpus codificado.
+
+        Returns:
+            int: Bytes de los arreglos y de las cadenas del vocabulario.
+        """
+        strings = sum(sys.getsizeof(word) for word in self.vocabulary)
+        return self.token_ids.nbytes + self.pos_codes.nbytes + self.offsets.nbytes + strings
+
+def encode_corpus(texts, batch_size=1000):
+    """
+    Tokeniza, etiqueta y codifica con enteros una lista de textos preprocesados.
+
+    Args:
+        texts (list): Textos preprocesados.
+        batch_size (int): Textos etiquetados por bloque.
+
+    Returns:
+        EncodedCorpus: Corpus codificado.
+    """
+    corpus = EncodedCorpus()
+    word_ids = corpus.word_ids
+    tag = get_tagger().tag
+    # Etiquetas de Treebank ya convertidas a códigos de WordNet
+    tag_codes = {}
+    token_chunks, code_chunks, lengths = [], [], []
+
+    for start in range(0, len(texts), batch_size):
+        ids, codes = [], []
+        for text in texts[start:start + batch_size]:
+            tokens = tokenize_clean_text(text)
+            for word, treebank_tag in tag(tokens):
+                word_id = word_ids.get(word)
+                if word_id is None:
+                    word_id = word_ids[word] = len(word_ids)
+                    corpus.vocabulary.append(word)
+                code = tag_codes.get(treebank_tag)
+                if code is None:
+                    code = tag_codes[treebank_tag] = WN_CODES[get_wordnet_pos(treebank_tag)]
+                ids.append(word_id)
+                codes.append(code)
+            lengths.append(len(tokens))
+        token_chunks.append(np.array(ids, dtype=np.int32))
+        code_chunks.append(np.array(codes, dtype=np.int8))
+
+    if token_chunks:
+        corpus.token_ids = np.concatenate(token_chunks)
+        corpus.pos_codes = np.concatenate(code_chunks)
+    corpus.offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=corpus.offsets[1:])
+    return corpus
+
+def context_signatures(corpus, positions):
+    """
+    Calcula una firma canónica del contexto de Lesk de cada token: los ids
+    distintos de su ventana, ordenados y completados con un valor de relleno.
+    Dos tokens con la misma firma tienen el mismo conjunto de palabras de contexto.
+
+    Args:
+        corpus (EncodedCorpus): Corpus codificado.
+        positions (numpy.array): Posiciones de los tokens en 'corpus.token_ids'.
+
+    Returns:
+        numpy.array: Matriz (len(positions) x 10) de ids de contexto.
+    """
+    width = CONTEXT_BEFORE + CONTEXT_AFTER
+    padding = len(corpus.vocabulary)
+    text_index = np.searchsorted(corpus.offsets, positions, side='right') - 1
+    text_start = corpus.offsets[text_index]
+    text_end = corpus.offsets[text_index + 1]
+
+    window = positions[:, None] - CONTEXT_BEFORE + np.arange(width)
+    valid = (window >= text_start[:, None]) & (window < text_end[:, None])
+    ids = np.where(valid, corpus.token_ids[np.clip(window, 0, max(len(corpus.token_ids) - 1, 0))], padding)
+
+    # Conjunto de ids: ordenar, reemplazar repetidos por el relleno y volver a ordenar
+    ids.sort(axis=1)
+    repeated = np.zeros_like(valid)
+    repeated[:, 1:] = ids[:, 1:] == ids[:, :-1]
+    ids[repeated] = padding
+    ids.sort(axis=1)
+    return ids
+
+def resolve_senses(corpus, keys, cache):
+    """
+    Desambigua y puntúa cada clave distinta (palabra, categoría, contexto).
+
+    Args:
+        corpus (EncodedCorpus): Corpus codificado.
+        keys (numpy.array): Matriz de claves distintas: id de palabra, código de
+                            WordNet y firma de contexto ('context_signatures').
+        cache (dict): Puntajes ya resueltos por clave, compartido entre bloques.
+
+    Returns:
+        numpy.array: Matriz (len(keys) x 2) de puntajes positivo y negativo.
+    """
+    vocabulary = corpus.vocabulary
+    padding = len(vocabulary)
+    scores = np.zeros((len(keys), 2))
+    for row, key in enumerate(keys):
+        signature = key.tobytes()
+        result = cache.get(signature)
+        if result is None:
+            word, wn_tag = vocabulary[key[0]], WN_TAGS[key[1]]
+            context = [vocabulary[word_id] for word_id in key[2:] if word_id != padding]
+            synset = disambiguate(context, word, wn_tag)
+            result = senti_scores(synset) if synset is not None else None
+            result = cache[signature] = result or (0.0, 0.0)
+        scores[row] = result
+    return scores
+
+def score_corpus(corpus, chunk_tokens=1 << 20):
+    """
+    Calcula los puntajes de sentimiento de un corpus codificado.
+
+    Cada (palabra, categoría, conjunto de contexto) distinto se resuelve una sola
+    vez; luego los puntajes de los tokens se obtienen por indexación y se suman por
+    texto con 'np.add.reduceat'.
+
+    Args:
+        corpus (EncodedCorpus): Corpus codificado.
+        chunk_tokens (int): Tokens relevantes procesados por bloque, limita la memoria.
+
+    Returns:
+        tuple: Arreglos (pos_scores, neg_scores), uno por texto.
+    """
+    token_scores = np.zeros((len(corpus.token_ids), 2))
+    relevant = np.flatnonzero(corpus.pos_codes)
+    cache = {}
+    for start in range(0, len(relevant), chunk_tokens):
+        positions = relevant[start:start + chunk_tokens]
+        keys = np.column_stack([corpus.token_ids[positions], corpus.pos_codes[positions],
+                                context_signatures(corpus, positions)]).astype(np.int32)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        token_scores[positions] = resolve_senses(corpus, unique_keys, cache)[inverse.reshape(-1)]
+
+    lengths = np.diff(corpus.offsets)
+    text_scores = np.zeros((len(corpus), 2))
+    non_empty = lengths > 0
+    if non_empty.any():
+        # 'reduceat' necesita índices de inicio válidos: solo los textos con tokens
+        text_scores[non_empty] = np.add.reduceat(token_scores, corpus.offsets[:-1][non_empty], axis=0)
+    return text_scores[:, 0], text_scores[:, 1]
+
+def score_texts_array(texts, batch_size=1000):
+    """
+    Alternativa a 'sentiment_lexicon.score_texts' sobre el corpus codificado con
+    enteros; devuelve los mismos puntajes.
+
+    Args:
+        texts (list): Textos preprocesados.
+        batch_size (int): Textos etiquetados por bloque.
+
+    Returns:
+        list: Lista de tuplas (pos_score, neg_score), en el mismo orden que 'texts'.
+    """
+    pos_scores, neg_scores = score_corpus(encode_corpus(texts, batch_size))
+    return list(zip(pos_scores.tolist(), neg_scores.tolist()))
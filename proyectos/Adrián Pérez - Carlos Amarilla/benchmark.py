@@ -1,5 +1,19 @@
 # benchmark.py
 
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+import pandas as pd
+from fuzzy_logic import (
+    create_membership_functions,
+    fuzzy_inference_batch,
+    fuzzy_inference_analytic,
+    get_sentiment_label
+)
+
 def calculate_benchmarks(df):
     """
     Calcula y muestra estadísticas sobre el análisis de sentimiento realizado,
@@ -14,24 +28,692 @@ def calculate_benchmarks(df):
         df (pd.DataFrame): DataFrame que contiene los resultados del análisis,
                            incluyendo las columnas 'sentiment_label' y 'execution_time'.
     """
-    # Calcular el total de tweets por categoría de sentimiento
-    total_positive = len(df[df['sentiment_label'] == 'positive'])
-    total_negative = len(df[df['sentiment_label'] == 'negative'])
-    total_neutral = len(df[df['sentiment_label'] == 'neutral'])
+    print_benchmarks(summarize_benchmarks(df))
+
+def summarize_benchmarks(df):
+    """
+    Resume los resultados del análisis en totales por categoría de sentimiento:
+    cantidad de tweets y suma de tiempos de ejecución. Los resúmenes de varios
+    bloques pueden combinarse con 'merge_benchmark_summaries'.
+
+    Args:
+        df (pd.DataFrame): DataFrame con columnas 'sentiment_label' y 'execution_time'.
+
+    Returns:
+        dict: Para cada etiqueta, un diccionario con 'count' y 'time'.
+    """
+    # Una sola agrupación en lugar de una máscara booleana por estadística
+    grouped = df.groupby('sentiment_label', observed=True)['execution_time'].agg(['count', 'sum'])
+    return {label: {'count': int(row['count']), 'time': float(row['sum'])}
+            for label, row in grouped.iterrows()}
+
+def merge_benchmark_summaries(summary, other):
+    """
+    Combina dos resúmenes creados por 'summarize_benchmarks'.
+
+    Args:
+        summary (dict or None): Resumen acumulado (None si todavía no hay ninguno).
+        other (dict): Resumen a agregar.
+
+    Returns:
+        dict: Resumen combinado.
+    """
+    merged = {label: dict(values) for label, values in (summary or {}).items()}
+    for label, values in other.items():
+        totals = merged.setdefault(label, {'count': 0, 'time': 0.0})
+        totals['count'] += values['count']
+        totals['time'] += values['time']
+    return merged
+
+def print_benchmarks(summary):
+    """
+    Muestra los totales y tiempos promedio de ejecución de un resumen de resultados.
+
+    Args:
+        summary (dict): Resumen creado por 'summarize_benchmarks'.
+    """
+    labels = {'positive': 'positivos', 'negative': 'negativos', 'neutral': 'neutrales'}
+
+    # Total de tweets por categoría de sentimiento
+    for label, name in labels.items():
+        print(f"Total de tweets {name}: {summary.get(label, {}).get('count', 0)}")
+
+    # Tiempo promedio de ejecución por categoría
+    for label, name in labels.items():
+        values = summary.get(label, {'count': 0, 'time': 0.0})
+        average = values['time'] / values['count'] if values['count'] else float('nan')
+        print(f"Tiempo promedio de ejecución para tweets {name}: {average:.6f} segundos")
+
+    # Tiempo promedio total de ejecución
+    total_count = sum(values['count'] for values in summary.values())
+    total_time = sum(values['time'] for values in summary.values())
+    total_average = total_time / total_count if total_count else float('nan')
+    print(f"Tiempo promedio total de ejecución: {total_average:.6f} segundos")
+
+def compare_fuzzy_engines(df):
+    """
+    Compara la inferencia difusa discretizada ('fuzzy_inference' + 'defuzzify',
+    en su versión vectorizada) con la inferencia analítica sobre los mismos puntajes,
+    mostrando las diferencias de puntaje, la coincidencia de etiquetas y los tiempos.
+
+    Args:
+        df (pd.DataFrame): DataFrame con columnas 'positive_score' y 'negative_score'.
+    """
+    pos_scores = df['positive_score'].to_numpy()
+    neg_scores = df['negative_score'].to_numpy()
+    mf = create_membership_functions(pos_scores.min(), pos_scores.max(),
+                                     neg_scores.min(), neg_scores.max())
+
+    start_time = time.perf_counter()
+    discrete = fuzzy_inference_batch(pos_scores, neg_scores, mf)
+    discrete_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    analytic = fuzzy_inference_analytic(pos_scores, neg_scores, mf)
+    analytic_time = time.perf_counter() - start_time
+
+    difference = np.abs(discrete - analytic)
+    same_label = np.mean([get_sentiment_label(a) == get_sentiment_label(b)
+                          for a, b in zip(discrete, analytic)])
+
+    print(f"Diferencia máxima entre centroide discretizado y analítico: {difference.max():.6f}")
+    print(f"Diferencia promedio entre centroide discretizado y analítico: {difference.mean():.6f}")
+    print(f"Coincidencia de etiquetas entre ambos motores: {same_label:.2%}")
+    print(f"Tiempo del motor discretizado: {discrete_time:.6f} segundos")
+    print(f"Tiempo del motor analítico: {analytic_time:.6f} segundos")
+
+def collect_lesk_calls(texts):
+    """
+    Reúne las llamadas a Lesk (contexto, palabra, pos) que realiza
+    'calculate_sentiment_scores' sobre una lista de textos preprocesados.
+
+    Args:
+        texts (iterable): Textos preprocesados.
+
+    Returns:
+        list: Lista de tuplas (contexto, palabra, etiqueta POS de WordNet).
+    """
+    from preprocessing import tokenize_clean_text
+    from sentiment_lexicon import get_wordnet_pos, tag_token_lists
+
+    calls = []
+    token_lists = [tokenize_clean_text(text) for text in texts]
+    for tokens, pos_tags in zip(token_lists, tag_token_lists(token_lists)):
+        for i, (word, tag) in enumerate(pos_tags):
+            wn_tag = get_wordnet_pos(tag)
+            if wn_tag is not None:
+                calls.append((tokens[max(0, i - 5):i + 5], word, wn_tag))
+    return calls
+
+def benchmark_lesk(csv_path='sentiment140.csv'):
+    """
+    Compara el tiempo de 'nltk.wsd.lesk' con el de 'fast_lesk' sobre las mismas
+    llamadas que genera el análisis del dataset, verificando que ambos elijan
+    exactamente los mismos synsets.
+
+    Se mide el índice en frío (construyendo las firmas de glosas) y en caliente
+    (con todas las firmas ya construidas, como al cargarlo desde disco).
+
+    Args:
+        csv_path (str): Ruta del dataset con la columna 'sentence'.
+    """
+    from nltk.wsd import lesk
+    from fast_lesk import LeskIndex
+    from preprocessing import preprocess_text
+
+    texts = pd.read_csv(csv_path)['sentence'].fillna('').astype(str).apply(preprocess_text)
+    calls = collect_lesk_calls(texts)
+
+    start_time = time.perf_counter()
+    expected = [lesk(context, word, pos=pos) for context, word, pos in calls]
+    nltk_time = time.perf_counter() - start_time
+
+    index = LeskIndex()
+    start_time = time.perf_counter()
+    cold = [index.lesk_name(context, word, pos) for context, word, pos in calls]
+    cold_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    warm = [index.lesk_name(context, word, pos) for context, word, pos in calls]
+    warm_time = time.perf_counter() - start_time
+
+    expected_names = [synset.name() if synset is not None else None for synset in expected]
+    mismatches = sum(a != b for a, b in zip(expected_names, cold)) + sum(a != b for a, b in zip(expected_names, warm))
+
+    print(f"Llamadas a Lesk: {len(calls)}")
+    print(f"Tiempo de nltk.wsd.lesk: {nltk_time:.4f} segundos")
+    print(f"Tiempo de fast_lesk (índice en frío): {cold_time:.4f} segundos ({nltk_time / cold_time:.1f}x)")
+    print(f"Tiempo de fast_lesk (índice en caliente): {warm_time:.4f} segundos ({nltk_time / warm_time:.1f}x)")
+    print(f"Synsets distintos entre ambas implementaciones: {mismatches}")
+
+def benchmark_preprocessing(csv_path='sentiment140.csv', repeat=10):
+    """
+    Compara 'preprocess_text' seguido de 'nltk.word_tokenize' con la versión
+    fusionada 'preprocess_and_tokenize', verificando que produzcan exactamente
+    los mismos textos y tokens sobre el dataset.
+
+    Args:
+        csv_path (str): Ruta del dataset con la columna 'sentence'.
+        repeat (int): Veces que se repite el dataset para que los tiempos sean medibles.
+    """
+    from nltk.tokenize import word_tokenize
+    from preprocessing import preprocess_text, preprocess_and_tokenize
+
+    texts = pd.read_csv(csv_path)['sentence'].fillna('').astype(str).tolist() * repeat
+
+    start_time = time.perf_counter()
+    expected_texts = [preprocess_text(text) for text in texts]
+    expected_tokens = [word_tokenize(text) for text in expected_texts]
+    reference_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    clean_texts, token_lists = preprocess_and_tokenize(texts)
+    fused_time = time.perf_counter() - start_time
+
+    mismatches = sum(a != b for a, b in zip(expected_texts, clean_texts))
+    mismatches += sum(a != b for a, b in zip(expected_tokens, token_lists))
+
+    print(f"Textos procesados: {len(texts)}")
+    print(f"Tiempo de preprocess_text + word_tokenize: {reference_time:.4f} segundos")
+    print(f"Tiempo de preprocess_and_tokenize: {fused_time:.4f} segundos ({reference_time / fused_time:.1f}x)")
+    print(f"Textos o tokens distintos entre ambas versiones: {mismatches}")
+
+def benchmark_tagging(csv_path='sentiment140.csv'):
+    """
+    Compara el etiquetado POS tweet por tweet con 'nltk.pos_tag' con el etiquetado
+    en bloque de 'tag_token_lists', verificando que las etiquetas sean idénticas.
+
+    Args:
+        csv_path (str): Ruta del dataset con la columna 'sentence'.
+    """
+    from nltk import pos_tag
+    from preprocessing import preprocess_and_tokenize
+    from sentiment_lexicon import tag_token_lists
+
+    _, token_lists = preprocess_and_tokenize(pd.read_csv(csv_path)['sentence'].fillna('').astype(str))
+
+    start_time = time.perf_counter()
+    expected = [pos_tag(tokens) for tokens in token_lists]
+    per_tweet_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    tagged = tag_token_lists(token_lists)
+    batch_time = time.perf_counter() - start_time
+
+    mismatches = sum(a != b for a, b in zip(expected, tagged))
+    print(f"Tweets etiquetados: {len(token_lists)}")
+    print(f"Tiempo por tweet con nltk.pos_tag: {per_tweet_time / len(token_lists) * 1000:.4f} ms")
+    print(f"Tiempo por tweet con tag_token_lists: {batch_time / len(token_lists) * 1000:.4f} ms "
+          f"({per_tweet_time / batch_time:.1f}x)")
+    print(f"Tweets con etiquetas distintas: {mismatches}")
+
+def benchmark_scorers(csv_path='sentiment140.csv'):
+    """
+    Compara el motor de puntuación token por token ('score_texts') con el motor
+    sobre el corpus codificado con enteros ('score_texts_array'), verificando que
+    den los mismos puntajes, y compara la memoria del corpus codificado con la de
+    los textos como cadenas de Python.
+
+    Args:
+        csv_path (str): Ruta del dataset con la columna 'sentence'.
+    """
+    from preprocessing import preprocess_texts
+    from sentiment_lexicon import score_texts, clear_caches
+    from array_scoring import encode_corpus, score_corpus
+
+    texts = preprocess_texts(pd.read_csv(csv_path)['sentence'].fillna('').astype(str))
+    # Cargar los recursos fuera de la medición
+    score_texts(['good morning'])
+
+    clear_caches()
+    start_time = time.perf_counter()
+    expected = score_texts(texts)
+    token_time = time.perf_counter() - start_time
+
+    clear_caches()
+    start_time = time.perf_counter()
+    corpus = encode_corpus(texts)
+    pos_scores, neg_scores = score_corpus(corpus)
+    array_time = time.perf_counter() - start_time
+
+    mismatches = sum(a != b for a, b in zip(expected, zip(pos_scores.tolist(), neg_scores.tolist())))
+    string_bytes = sum(sys.getsizeof(text) for text in texts)
+    print(f"Tweets puntuados: {len(texts)}")
+    print(f"Tiempo con score_texts: {token_time:.2f} s")
+    print(f"Tiempo con score_texts_array: {array_time:.2f} s ({token_time / array_time:.1f}x)")
+    print(f"Tweets con puntajes distintos: {mismatches}")
+    print(f"Memoria del corpus codificado: {corpus.nbytes() / 1e6:.2f} MB "
+          f"(textos como cadenas: {string_bytes / 1e6:.2f} MB)")
+
+def benchmark_approximate(csv_path='sentiment140.csv', output_path=None):
+    """
+    Mide el compromiso entre velocidad y exactitud de los modos aproximados
+    ('first-sense' y 'mean-sense') frente a Lesk ('nltk'): tweets por segundo de la
+    puntuación, y concordancia de las etiquetas finales con las de Lesk y con la
+    columna 'sentiment' del dataset. Cada modo usa sus propios mínimos y máximos
+    para las funciones de membresía, como en una ejecución normal. Todos se miden
+    en frío: con los cachés vacíos y un índice de Lesk nuevo, sin las firmas
+    construidas por el modo anterior ni las guardadas en disco.
+
+    Args:
+        csv_path (str): Dataset con las columnas 'sentence' y 'sentiment'.
+        output_path (str, opcional): Archivo JSON donde guardar los resultados.
+
+    Returns:
+        dict: Resultados por motor de puntuación.
+    """
+    from main import prepare_dataset
+    from sentiment_lexicon import get_scorer, clear_caches
+    from fast_lesk import reset_index
+
+    df = prepare_dataset(pd.read_csv(csv_path))
+    texts = df['clean_text'].tolist()
+    targets = df['target'].to_numpy(dtype=object)
+
+    results = {}
+    labels = {}
+    for name in ('nltk', 'first-sense', 'mean-sense'):
+        score = get_scorer(name)
+        # Cargar los recursos fuera de la medición
+        score(['good morning'])
+        clear_caches()
+        reset_index()
+        start_time = time.perf_counter()
+        scores = np.array(score(texts), dtype=float).reshape(-1, 2)
+        elapsed = time.perf_counter() - start_time
+
+        mf = create_membership_functions(scores[:, 0].min(), scores[:, 0].max(),
+                                         scores[:, 1].min(), scores[:, 1].max())
+        labels[name] = np.array([get_sentiment_label(value)
+                                 for value in fuzzy_inference_batch(scores[:, 0], scores[:, 1], mf)])
+        results[name] = {
+            'seconds': elapsed,
+            'throughput_tweets_per_second': len(texts) / elapsed if elapsed else None,
+            'agreement_with_lesk': float(np.mean(labels[name] == labels['nltk'])),
+            'agreement_with_target': float(np.mean(labels[name] == targets)),
+        }
+
+    print(f"Tweets puntuados: {len(texts)}")
+    for name, result in results.items():
+        line = (f"{name:<12} {result['seconds']:8.2f} s, {result['throughput_tweets_per_second']:10.1f} tweets/s, "
+                f"{result['seconds'] and results['nltk']['seconds'] / result['seconds']:5.1f}x; "
+                f"concordancia con Lesk {result['agreement_with_lesk']:.1%}, "
+                f"con 'sentiment' {result['agreement_with_target']:.1%}")
+        print(line)
+
+    if output_path:
+        with open(output_path, 'w') as f:
+            json.dump({'dataset': os.path.abspath(csv_path), 'tweets': len(texts), 'scorers': results}, f, indent=2)
+        print(f"Resultados guardados en {output_path}")
+    return results
+
+def measure_import_time(module='main', repeat=5):
+    """
+    Mide el tiempo de 'import <module>' en procesos nuevos de Python, es decir,
+    el costo de arranque que paga cada ejecución y cada proceso de trabajo.
+
+    Args:
+        module (str): Módulo a importar.
+        repeat (int): Cantidad de procesos a lanzar; se informa la mediana.
+
+    Returns:
+        float: Mediana del tiempo de importación en segundos.
+    """
+    import subprocess
+
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    times = [float(subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                                  check=True).stdout.strip().splitlines()[-1])
+             for _ in range(repeat)]
+    median = float(np.median(times))
+    print(f"Tiempo de 'import {module}' (mediana de {repeat} procesos): {median * 1000:.1f} ms")
+    return median
+
+# Etapas medidas por la suite de benchmarks
+STAGES = ('preprocess', 'tokenize', 'tag', 'lesk', 'sentiwordnet', 'fuzzify', 'defuzzify', 'io')
+
+def make_synthetic_dataset(csv_path, size, seed=0):
+    """
+    Genera un dataset sintético de 'size' tweets remuestreando (con reemplazo)
+    las filas de un dataset real.
+
+    Args:
+        csv_path (str): Ruta del dataset original con columnas 'sentence' y 'sentiment'.
+        size (int): Cantidad de tweets a generar.
+        seed (int): Semilla del generador aleatorio.
+
+    Returns:
+        pd.DataFrame: Dataset sintético con las mismas columnas que el original.
+    """
+    source = pd.read_csv(csv_path)[['sentence', 'sentiment']]
+    return source.sample(n=size, replace=True, random_state=seed).reset_index(drop=True)
+
+def score_with_timings(texts, timings, latencies):
+    """
+    Preprocesa y puntúa una lista de textos como 'score_texts', acumulando el tiempo
+    de cada etapa y la latencia de cada tweet medidos con 'time.perf_counter'.
+
+    Args:
+        texts (iterable): Textos originales.
+        timings (dict): Tiempos acumulados por etapa (se actualiza).
+        latencies (list): Latencias por tweet en segundos (se agregan al final).
+
+    Returns:
+        list: Lista de tuplas (pos_score, neg_score).
+    """
+    from preprocessing import clean_text, tokenize_clean_text
+    from sentiment_lexicon import get_tagger, get_wordnet_pos, disambiguate, senti_scores
+
+    tag = get_tagger().tag
+    perf_counter = time.perf_counter
+    scores = []
+    for text in texts:
+        start = perf_counter()
+        clean = clean_text(text)
+        preprocessed = perf_counter()
+        tokens = tokenize_clean_text(clean)
+        tokenized = perf_counter()
+        pos_tags = tag(tokens)
+        tagged = perf_counter()
+
+        pos_score = neg_score = 0.0
+        lesk_time = swn_time = 0.0
+        for i, (word, treebank_tag) in enumerate(pos_tags):
+            wn_tag = get_wordnet_pos(treebank_tag)
+            if wn_tag is None:
+                continue
+            before = perf_counter()
+            synset = disambiguate(tokens[max(0, i - 5):i + 5], word, wn_tag)
+            after = perf_counter()
+            lesk_time += after - before
+            if synset is not None:
+                synset_scores = senti_scores(synset)
+                swn_time += perf_counter() - after
+                if synset_scores is not None:
+                    pos_score += synset_scores[0]
+                    neg_score += synset_scores[1]
+        end = perf_counter()
+
+        timings['preprocess'] += preprocessed - start
+        timings['tokenize'] += tokenized - preprocessed
+        timings['tag'] += tagged - tokenized
+        timings['lesk'] += lesk_time
+        timings['sentiwordnet'] += swn_time
+        latencies.append(end - start)
+        scores.append((pos_score, neg_score))
+    return scores
+
+def peak_memory_mb():
+    """
+    Devuelve el pico de memoria residente (RSS) del proceso actual.
+
+    Returns:
+        float or None: Pico de RSS en MB, o None si el sistema no lo informa.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    # En Linux 'ru_maxrss' está en KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_size_benchmark(csv_path, size, seed=0, lexicon_path=None, chunk_size=16384):
+    """
+    Ejecuta el análisis completo sobre un dataset sintético de 'size' tweets y mide
+    cada etapa. Se ejecuta en un proceso propio para que el pico de memoria
+    corresponda solo a este tamaño.
+
+    Args:
+        csv_path (str): Dataset real a remuestrear.
+        size (int): Cantidad de tweets.
+        seed (int): Semilla del remuestreo.
+        lexicon_path (str, opcional): Léxico compilado a usar.
+        chunk_size (int): Tamaño de bloque de la inferencia difusa.
+
+    Returns:
+        dict: Tiempos por etapa, rendimiento, percentiles de latencia y pico de memoria.
+    """
+    import tempfile
+    from fuzzy_logic import aggregate_rules_batch, defuzzify_batch
+    from sentiment_lexicon import load_compiled_lexicon, score_texts
+
+    if lexicon_path:
+        load_compiled_lexicon(lexicon_path)
+    # Cargar los recursos fuera de la medición
+    score_texts(['good morning'])
 
-    print(f"Total de tweets positivos: {total_positive}")
-    print(f"Total de tweets negativos: {total_negative}")
-    print(f"Total de tweets neutrales: {total_neutral}")
+    timings = dict.fromkeys(STAGES, 0.0)
+    latencies = []
+    with tempfile.TemporaryDirectory(prefix='benchmark_') as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'input.csv')
+        make_synthetic_dataset(csv_path, size, seed).to_csv(input_path, index=False)
 
-    # Calcular el tiempo promedio de ejecución por categoría
-    avg_time_positive = df[df['sentiment_label'] == 'positive']['execution_time'].mean()
-    avg_time_negative = df[df['sentiment_label'] == 'negative']['execution_time'].mean()
-    avg_time_neutral = df[df['sentiment_label'] == 'neutral']['execution_time'].mean()
+        start = time.perf_counter()
+        df = pd.read_csv(input_path)
+        timings['io'] += time.perf_counter() - start
 
-    print(f"Tiempo promedio de ejecución para tweets positivos: {avg_time_positive:.6f} segundos")
-    print(f"Tiempo promedio de ejecución para tweets negativos: {avg_time_negative:.6f} segundos")
-    print(f"Tiempo promedio de ejecución para tweets neutrales: {avg_time_neutral:.6f} segundos")
+        texts = df['sentence'].fillna('').astype(str).tolist()
+        scores = np.array(score_with_timings(texts, timings, latencies), dtype=float).reshape(-1, 2)
+
+        mf = create_membership_functions(scores[:, 0].min(), scores[:, 0].max(),
+                                         scores[:, 1].min(), scores[:, 1].max())
+        sentiment_scores = np.empty(size)
+        for begin in range(0, size, chunk_size):
+            stop = begin + chunk_size
+            start = time.perf_counter()
+            aggregated = aggregate_rules_batch(scores[begin:stop, 0], scores[begin:stop, 1], mf)
+            aggregated_at = time.perf_counter()
+            sentiment_scores[begin:stop] = defuzzify_batch(aggregated, mf['x_op'])
+            timings['fuzzify'] += aggregated_at - start
+            timings['defuzzify'] += time.perf_counter() - aggregated_at
+
+        labels = [get_sentiment_label(score) for score in sentiment_scores]
+        start = time.perf_counter()
+        pd.DataFrame({'text': texts, 'positive_score': scores[:, 0], 'negative_score': scores[:, 1],
+                      'sentiment_score': sentiment_scores, 'sentiment_label': labels}
+                     ).to_csv(os.path.join(tmp_dir, 'output.csv'), index=False)
+        timings['io'] += time.perf_counter() - start
+
+    # La inferencia difusa es vectorizada: su costo se reparte entre todos los tweets
+    fuzzy_per_tweet = (timings['fuzzify'] + timings['defuzzify']) / size
+    latencies = (np.array(latencies) + fuzzy_per_tweet) * 1000
+    total = sum(timings.values())
+    return {
+        'size': size,
+        'stages_seconds': timings,
+        'total_seconds': total,
+        'throughput_tweets_per_second': size / total if total else None,
+        'latency_ms': {
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+            'p99': float(np.percentile(latencies, 99)),
+        },
+        'peak_memory_mb': peak_memory_mb(),
+    }
+
+def run_benchmark_suite(csv_path='sentiment140.csv', sizes=(1000, 10000, 100000, 1000000),
+                        seed=0, lexicon_path=None, output_path=None):
+    """
+    Ejecuta 'run_size_benchmark' para cada tamaño, cada uno en un proceso nuevo,
+    y muestra la curva de escalado.
+
+    Args:
+        csv_path (str): Dataset real a remuestrear.
+        sizes (iterable): Cantidades de tweets a medir.
+        seed (int): Semilla del remuestreo.
+        lexicon_path (str, opcional): Léxico compilado a usar.
+        output_path (str, opcional): Archivo JSON donde guardar los resultados.
+
+    Returns:
+        dict: Resultados con los metadatos del entorno y una corrida por tamaño.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    results = {
+        'meta': {
+            'dataset': os.path.abspath(csv_path),
+            'seed': seed,
+            'lexicon': lexicon_path,
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'runs': [],
+    }
+    # 'spawn' garantiza un proceso limpio por tamaño para medir su pico de memoria
+    context = multiprocessing.get_context('spawn')
+    for size in sizes:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            run = executor.submit(run_size_benchmark, csv_path, size, seed, lexicon_path).result()
+        results['runs'].append(run)
+        print_size_benchmark(run)
+
+    if output_path:
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Resultados guardados en {output_path}")
+    return results
+
+def print_size_benchmark(run):
+    """
+    Muestra los resultados de 'run_size_benchmark' para un tamaño.
+
+    Args:
+        run (dict): Resultados de una corrida.
+    """
+    print(f"\n{run['size']} tweets: {run['total_seconds']:.2f} s, "
+          f"{run['throughput_tweets_per_second']:.1f} tweets/s")
+    for stage, seconds in run['stages_seconds'].items():
+        share = seconds / run['total_seconds'] * 100 if run['total_seconds'] else 0.0
+        print(f"  {stage:<13} {seconds:10.3f} s ({share:5.1f} %)")
+    latency = run['latency_ms']
+    print(f"  Latencia por tweet: p50 {latency['p50']:.3f} ms, p95 {latency['p95']:.3f} ms, "
+          f"p99 {latency['p99']:.3f} ms")
+    if run['peak_memory_mb'] is not None:
+        print(f"  Pico de memoria: {run['peak_memory_mb']:.1f} MB")
+
+def compare_benchmark_results(baseline, candidate, threshold=0.10):
+    """
+    Compara dos resultados de 'run_benchmark_suite' y detecta regresiones: menor
+    rendimiento, o mayor latencia, tiempo por etapa o pico de memoria que 'threshold'.
+
+    Args:
+        baseline (dict): Resultados de referencia.
+        candidate (dict): Resultados a evaluar.
+        threshold (float): Variación relativa tolerada (0.10 = 10 %).
+
+    Returns:
+        list: Descripciones de las regresiones encontradas (vacía si no hay).
+    """
+    def check(size, metric, before, after, higher_is_better=False):
+        if not before or after is None:
+            return
+        change = (after - before) / before
+        if (-change if higher_is_better else change) > threshold:
+            regressions.append(f"{size} tweets, {metric}: {before:.4g} -> {after:.4g} ({change:+.1%})")
+
+    regressions = []
+    baseline_runs = {run['size']: run for run in baseline['runs']}
+    for run in candidate['runs']:
+        reference = baseline_runs.get(run['size'])
+        if reference is None:
+            continue
+        size = run['size']
+        check(size, 'throughput', reference['throughput_tweets_per_second'],
+              run['throughput_tweets_per_second'], higher_is_better=True)
+        for percentile, value in run['latency_ms'].items():
+            check(size, f'latencia {percentile}', reference['latency_ms'].get(percentile), value)
+        for stage, seconds in run['stages_seconds'].items():
+            check(size, f'etapa {stage}', reference['stages_seconds'].get(stage), seconds)
+        check(size, 'pico de memoria', reference['peak_memory_mb'], run['peak_memory_mb'])
+    return regressions
+
+def parse_args(argv=None):
+    """
+    Interpreta los argumentos de la línea de comandos de los benchmarks.
+
+    Args:
+        argv (list, opcional): Argumentos a interpretar; por defecto los de 'sys.argv'.
+
+    Returns:
+        argparse.Namespace: Argumentos interpretados.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmarks del análisis de sentimiento.")
+    subparsers = parser.add_subparsers(dest='command')
+
+    suite = subparsers.add_parser('suite', help="Tiempos por etapa, percentiles y curva de escalado.")
+    suite.add_argument('--input', default='sentiment140.csv', help="Dataset real a remuestrear.")
+    suite.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000, 1000000],
+                       help="Cantidades de tweets a medir.")
+    suite.add_argument('--seed', type=int, default=0, help="Semilla del remuestreo.")
+    suite.add_argument('--lexicon', help="Léxico compilado a usar.")
+    suite.add_argument('--output', help="Archivo JSON donde guardar los resultados.")
+
+    compare = subparsers.add_parser('compare', help="Compara dos resultados de 'suite'.")
+    compare.add_argument('baseline', help="Resultados de referencia (JSON).")
+    compare.add_argument('candidate', help="Resultados a evaluar (JSON).")
+    compare.add_argument('--threshold', type=float, default=0.10,
+                         help="Variación relativa tolerada (por defecto 0.10).")
+
+    approximate = subparsers.add_parser('approximate',
+                                        help="Velocidad y concordancia de los modos aproximados frente a Lesk.")
+    approximate.add_argument('--input', default='sentiment140.csv', help="Dataset con 'sentence' y 'sentiment'.")
+    approximate.add_argument('--output', help="Archivo JSON donde guardar los resultados.")
+
+    for name, help_text in (('lesk', "Lesk de NLTK contra el índice de glosas."),
+                            ('preprocessing', "Preprocesamiento original contra el combinado."),
+                            ('tagging', "Etiquetado con 'nltk.pos_tag' contra el compartido."),
+                            ('scorers', "Puntuación token por token contra el corpus codificado."),
+                            ('startup', "Tiempo de importación de 'main'.")):
+        subparsers.add_parser(name, help=help_text)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Punto de entrada de los benchmarks. Sin subcomando ejecuta las comparaciones puntuales.
+
+    Args:
+        argv (list, opcional): Argumentos de la línea de comandos.
+
+    Returns:
+        int: Código de salida (1 si 'compare' encuentra regresiones).
+    """
+    args = parse_args(argv)
+    if args.command == 'suite':
+        run_benchmark_suite(args.input, args.sizes, args.seed, args.lexicon, args.output)
+    elif args.command == 'compare':
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.candidate) as f:
+            candidate = json.load(f)
+        regressions = compare_benchmark_results(baseline, candidate, args.threshold)
+        if regressions:
+            print("Regresiones encontradas:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("Sin regresiones.")
+    elif args.command == 'lesk':
+        benchmark_lesk()
+    elif args.command == 'preprocessing':
+        benchmark_preprocessing()
+    elif args.command == 'tagging':
+        benchmark_tagging()
+    elif args.command == 'scorers':
+        benchmark_scorers()
+    elif args.command == 'approximate':
+        benchmark_approximate(args.input, args.output)
+    elif args.command == 'startup':
+        measure_import_time()
+    else:
+        measure_import_time()
+        benchmark_preprocessing()
+        benchmark_tagging()
+        benchmark_lesk()
+    return 0
 
-    # Calcular el tiempo promedio total de ejecución
-    total_avg_time = df['execution_time'].mean()
-    print(f"Tiempo promedio total de ejecución: {total_avg_time:.6f} segundos")
+if __name__ == '__main__':
+    sys.exit(main())
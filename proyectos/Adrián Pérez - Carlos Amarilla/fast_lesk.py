@@ -0,0 +1,233 @@
+# fast_lesk.py
+
+import os
+import pickle
+import tempfile
+import nltk
+from nltk.corpus import wordnet
+
+# Archivo por defecto donde se guarda el índice de firmas de glosas, junto al módulo
+# (no en el directorio de trabajo, para no cargar un índice ajeno)
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lesk_index.pkl')
+
+# Versión del formato del índice: debe incrementarse si cambia el contenido de las entradas
+INDEX_FORMAT_VERSION = 2
+
+class LeskIndex:
+    """
+    Índice de firmas de glosas para el algoritmo de Lesk.
+
+    Para cada par (palabra, pos) guarda la lista de synsets candidatos, en el mismo
+    orden en que los devuelve 'wordnet.synsets', junto con el conjunto de tokens de
+    su definición. Las entradas se construyen bajo demanda la primera vez que se
+    consulta una palabra y pueden guardarse en disco para reutilizarlas entre ejecuciones.
+    """
+
+    def __init__(self, path=None):
+        """
+        Args:
+            path (str, opcional): Archivo desde donde cargar (y donde guardar) el índice.
+        """
+        self.path = path
+        self.entries = {}
+        # Claves agregadas desde la última llamada a 'take_new_entries'
+        self.new_keys = []
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def candidates(self, word, pos=None):
+        """
+        Obtiene los synsets candidatos de una palabra con sus firmas de glosa.
+
+        Args:
+            word (str): Palabra a desambiguar.
+            pos (str, opcional): Etiqueta POS de WordNet ('n', 'v', 'a', 'r').
+
+        Returns:
+            list: Lista de tuplas (nombre del synset, frozenset de tokens de la definición).
+        """
+        key = (word, pos)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        # Mismo filtrado que 'nltk.wsd.lesk': todos los synsets de la palabra y luego por POS
+        synsets = wordnet.synsets(word)
+        if pos:
+            synsets = [ss for ss in synsets if str(ss.pos()) == pos]
+        entry = [(ss.name(), frozenset(ss.definition().split())) for ss in synsets]
+        self.entries[key] = entry
+        self.new_keys.append(key)
+        self.dirty = True
+        return entry
+
+    def take_new_entries(self):
+        """
+        Devuelve las entradas construidas desde la llamada anterior, para que un
+        proceso de trabajo las envíe al proceso principal (ver 'merge').
+
+        Returns:
+            dict: Entradas nuevas por (palabra, pos).
+        """
+        new_entries = {key: self.entries[key] for key in self.new_keys}
+        self.new_keys = []
+        return new_entries
+
+    def merge(self, entries):
+        """
+        Agrega entradas construidas en otro proceso.
+
+        Args:
+            entries (dict): Entradas por (palabra, pos), como las de 'take_new_entries'.
+        """
+        for key, entry in entries.items():
+            if key not in self.entries:
+                self.entries[key] = entry
+                self.dirty = True
+
+    def lesk_name(self, context_sentence, ambiguous_word, pos=None):
+        """
+        Desambigua una palabra con el algoritmo de Lesk y devuelve el nombre del synset.
+
+        Args:
+            context_sentence (iterable): Palabras del contexto.
+            ambiguous_word (str): Palabra a desambiguar.
+            pos (str, opcional): Etiqueta POS de WordNet.
+
+        Returns:
+            str or None: Nombre del synset con mayor solapamiento (por ejemplo 'good.a.01'),
+                         o None si la palabra no tiene synsets para esa categoría.
+        """
+        candidates = self.candidates(ambiguous_word, pos)
+        if not candidates:
+            return None
+
+        context = set(context_sentence)
+        # Igual que 'max' en 'nltk.wsd.lesk': ante empates gana el primer synset
+        best_name, best_overlap = None, -1
+        for name, signature in candidates:
+            overlap = len(signature & context)
+            if overlap > best_overlap:
+                best_name, best_overlap = name, overlap
+        return best_name
+
+    def lesk(self, context_sentence, ambiguous_word, pos=None):
+        """
+        Equivalente a 'nltk.wsd.lesk' usando el índice de firmas precalculadas.
+
+        Args:
+            context_sentence (iterable): Palabras del contexto.
+            ambiguous_word (str): Palabra a desambiguar.
+            pos (str, opcional): Etiqueta POS de WordNet.
+
+        Returns:
+            Synset or None: Synset con mayor solapamiento entre su definición y el contexto.
+        """
+        name = self.lesk_name(context_sentence, ambiguous_word, pos)
+        return wordnet.synset(name) if name is not None else None
+
+    def load(self, path):
+        """
+        Carga un índice guardado. Si fue construido con otra versión del índice, de
+        NLTK o de WordNet, o si el archivo no se puede leer, se descarta y se
+        reconstruirá bajo demanda (el próximo 'save' lo reemplaza).
+
+        Args:
+            path (str): Archivo del índice.
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception as error:
+            print(f"Advertencia: se descarta el índice de Lesk ilegible '{path}' ({error}).")
+            return
+        if (isinstance(data, dict) and data.get('version') == index_version()
+                and isinstance(data.get('entries'), dict)):
+            self.entries = data['entries']
+            self.dirty = False
+
+    def save(self, path=None):
+        """
+        Guarda el índice en disco si tiene entradas nuevas. Cada llamada escribe en
+        su propio archivo temporal y lo reemplaza de forma atómica, por lo que varios
+        procesos (por ejemplo, los nodos de 'sharding') pueden guardar a la vez sin
+        dejar un archivo corrupto; queda el índice del último en guardar.
+
+        Args:
+            path (str, opcional): Archivo de destino; por defecto el usado al crear el índice.
+        """
+        path = path or self.path
+        if not path or not self.dirty:
+            return
+        fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                        dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'version': index_version(), 'entries': self.entries}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.dirty = False
+
+def index_version():
+    """
+    Identifica la versión de los datos con que se construye el índice.
+
+    Returns:
+        tuple: Versión del formato del índice, de NLTK y de WordNet.
+    """
+    return (INDEX_FORMAT_VERSION, nltk.__version__, wordnet.get_version())
+
+# Índice compartido por el módulo, creado en el primer uso
+_default_index = None
+
+def get_index(path=DEFAULT_INDEX_PATH):
+    """
+    Obtiene el índice compartido, cargándolo desde disco la primera vez.
+
+    Args:
+        path (str): Archivo del índice persistente.
+
+    Returns:
+        LeskIndex: Índice de firmas de glosas.
+    """
+    global _default_index
+    if _default_index is None:
+        _default_index = LeskIndex(path)
+    return _default_index
+
+def reset_index():
+    """
+    Reemplaza el índice compartido por uno vacío que no se carga desde disco ni se
+    guarda, para medir el costo en frío de construir las firmas de glosas.
+    """
+    global _default_index
+    _default_index = LeskIndex()
+
+def lesk(context_sentence, ambiguous_word, pos=None):
+    """
+    Reemplazo de 'nltk.wsd.lesk' que usa el índice compartido de firmas de glosas.
+
+    Args:
+        context_sentence (iterable): Palabras del contexto.
+        ambiguous_word (str): Palabra a desambiguar.
+        pos (str, opcional): Etiqueta POS de WordNet.
+
+    Returns:
+        Synset or None: Synset elegido, idéntico al que devuelve 'nltk.wsd.lesk'.
+    """
+    return get_index().lesk(context_sentence, ambiguous_word, pos)
+
+def save_index():
+    """
+    Guarda en disco el índice compartido si se agregaron entradas nuevas.
+    """
+    if _default_index is not None:
+        _default_index.save()
@@ -1,7 +1,9 @@
 # fuzzy_logic.py
 
+import json
 import numpy as np
 import skfuzzy as fuzz
+from skfuzzy.defuzzify.exceptions import EmptyMembershipError
 
 def create_membership_functions(pos_min, pos_max, neg_min, neg_max):
     """
@@ -22,20 +24,33 @@ def create_membership_functions(pos_min, pos_max, neg_min, neg_max):
     x_neg = np.linspace(neg_min, neg_max, 100)  # Universo de discurso para puntajes negativos
     x_op = np.linspace(0, 10, 100)              # Universo de discurso para la salida (0 a 10)
 
+    # Vértices [a, b, c] de cada función de membresía triangular
+    triangles = {
+        'pos_lo': [pos_min, pos_min, (pos_min + pos_max)/2],
+        'pos_md': [pos_min, (pos_min + pos_max)/2, pos_max],
+        'pos_hi': [(pos_min + pos_max)/2, pos_max, pos_max],
+        'neg_lo': [neg_min, neg_min, (neg_min + neg_max)/2],
+        'neg_md': [neg_min, (neg_min + neg_max)/2, neg_max],
+        'neg_hi': [(neg_min + neg_max)/2, neg_max, neg_max],
+        'op_negative': [0, 0, 5],    # Sentimiento negativo
+        'op_neutral': [0, 5, 10],    # Sentimiento neutral
+        'op_positive': [5, 10, 10],  # Sentimiento positivo
+    }
+
     # Funciones de membresía triangulares para puntajes positivos
-    pos_lo = fuzz.trimf(x_pos, [pos_min, pos_min, (pos_min + pos_max)/2])
-    pos_md = fuzz.trimf(x_pos, [pos_min, (pos_min + pos_max)/2, pos_max])
-    pos_hi = fuzz.trimf(x_pos, [(pos_min + pos_max)/2, pos_max, pos_max])
+    pos_lo = fuzz.trimf(x_pos, triangles['pos_lo'])
+    pos_md = fuzz.trimf(x_pos, triangles['pos_md'])
+    pos_hi = fuzz.trimf(x_pos, triangles['pos_hi'])
 
     # Funciones de membresía triangulares para puntajes negativos
-    neg_lo = fuzz.trimf(x_neg, [neg_min, neg_min, (neg_min + neg_max)/2])
-    neg_md = fuzz.trimf(x_neg, [neg_min, (neg_min + neg_max)/2, neg_max])
-    neg_hi = fuzz.trimf(x_neg, [(neg_min + neg_max)/2, neg_max, neg_max])
+    neg_lo = fuzz.trimf(x_neg, triangles['neg_lo'])
+    neg_md = fuzz.trimf(x_neg, triangles['neg_md'])
+    neg_hi = fuzz.trimf(x_neg, triangles['neg_hi'])
 
     # Funciones de membresía triangulares para la salida (sentimiento)
-    op_negative = fuzz.trimf(x_op, [0, 0, 5])    # Sentimiento negativo
-    op_neutral = fuzz.trimf(x_op, [0, 5, 10])    # Sentimiento neutral
-    op_positive = fuzz.trimf(x_op, [5, 10, 10])  # Sentimiento positivo
+    op_negative = fuzz.trimf(x_op, triangles['op_negative'])
+    op_neutral = fuzz.trimf(x_op, triangles['op_neutral'])
+    op_positive = fuzz.trimf(x_op, triangles['op_positive'])
 
     # Almacenar todas las funciones de membresía y universos en un diccionario
     membership_functions = {
@@ -50,7 +65,8 @@ def create_membership_functions(pos_min, pos_max, neg_min, neg_max):
         'neg_hi': neg_hi,
         'op_negative': op_negative,
         'op_neutral': op_neutral,
-        'op_positive': op_positive
+        'op_positive': op_positive,
+        'triangles': triangles
     }
 
     return membership_functions
@@ -176,6 +192,9 @@ def defuzzify(aggregated, x_op):
     sentiment_score = fuzz.defuzz(x_op, aggregated, 'centroid')
     return sentiment_score
 
+# Etiquetas de sentimiento posibles (también las del dataset original)
+SENTIMENT_LABELS = ('negative', 'neutral', 'positive')
+
 def get_sentiment_label(score):
     """
     Asigna una etiqueta de sentimiento ('negative', 'neutral', 'positive') basada en el puntaje numérico.
@@ -192,3 +211,559 @@ def get_sentiment_label(score):
         return 'positive'
     else:
         return 'neutral'
+
+def fuzzy_inference_batch(pos_scores, neg_scores, mf, chunk_size=16384):
+    """
+    Aplica el sistema de inferencia difusa y la defuzzificación por centroide a
+    muchos tweets a la vez, operando sobre arreglos de NumPy en lugar de fila por fila.
+
+    Produce los mismos puntajes que 'fuzzy_inference' seguido de 'defuzzify'
+    (con diferencias del orden del redondeo de punto flotante), pero procesa
+    bloques de 'chunk_size' tweets con operaciones sobre matrices (chunk_size x 100).
+
+    Args:
+        pos_scores (array-like): Puntajes positivos de los textos.
+        neg_scores (array-like): Puntajes negativos de los textos.
+        mf (dict): Diccionario de funciones de membresía y universos creado por 'create_membership_functions'.
+        chunk_size (int): Cantidad máxima de tweets procesados por bloque, limita el uso de memoria.
+
+    Returns:
+        numpy.array: Puntajes numéricos de sentimiento, uno por tweet.
+    """
+    pos_scores = np.asarray(pos_scores, dtype=float)
+    neg_scores = np.asarray(neg_scores, dtype=float)
+    sentiment_scores = np.empty(len(pos_scores))
+
+    for start in range(0, len(pos_scores), chunk_size):
+        stop = start + chunk_size
+        aggregated = aggregate_rules_batch(pos_scores[start:stop], neg_scores[start:stop], mf)
+        sentiment_scores[start:stop] = defuzzify_batch(aggregated, mf['x_op'])
+
+    return sentiment_scores
+
+def aggregate_rules_batch(pos_scores, neg_scores, mf):
+    """
+    Fuzzifica los puntajes, aplica las nueve reglas difusas y agrega sus salidas
+    para un bloque de tweets.
+
+    Args:
+        pos_scores (numpy.array): Puntajes positivos del bloque.
+        neg_scores (numpy.array): Puntajes negativos del bloque.
+        mf (dict): Diccionario de funciones de membresía y universos creado por 'create_membership_functions'.
+
+    Returns:
+        numpy.array: Matriz (N x len(x_op)) con la función de membresía agregada de cada tweet.
+    """
+    # Fuzzificación vectorizada (misma interpolación que 'fuzz.interp_membership')
+    pos_levels = [fuzz.interp_membership(mf['x_pos'], mf[name], pos_scores)
+                  for name in ('pos_lo', 'pos_md', 'pos_hi')]
+    neg_levels = [fuzz.interp_membership(mf['x_neg'], mf[name], neg_scores)
+                  for name in ('neg_lo', 'neg_md', 'neg_hi')]
+
+    negative_strength, neutral_strength, positive_strength = fire_rules_batch(pos_levels, neg_levels)
+
+    # Recorte de los conjuntos de salida y agregación (una fila por tweet)
+    aggregated = np.fmin(negative_strength[:, None], mf['op_negative'])
+    np.fmax(aggregated, np.fmin(neutral_strength[:, None], mf['op_neutral']), out=aggregated)
+    np.fmax(aggregated, np.fmin(positive_strength[:, None], mf['op_positive']), out=aggregated)
+    return aggregated
+
+def fire_rules_batch(pos_levels, neg_levels):
+    """
+    Aplica las nueve reglas difusas a los grados de pertenencia de un bloque de tweets
+    y devuelve la fuerza con la que se activa cada conjunto de salida.
+
+    Args:
+        pos_levels (list): Grados de pertenencia (bajo, medio, alto) de los puntajes positivos.
+        neg_levels (list): Grados de pertenencia (bajo, medio, alto) de los puntajes negativos.
+
+    Returns:
+        tuple: Fuerzas de activación de los conjuntos negativo, neutral y positivo.
+    """
+    pos_level_lo, pos_level_md, pos_level_hi = pos_levels
+    neg_level_lo, neg_level_md, neg_level_hi = neg_levels
+
+    # Fuerza de activación de cada conjunto de salida. Como min(max(a, b), c) == max(min(a, c), min(b, c)),
+    # recortar cada conjunto con el máximo de sus reglas equivale a agregar las nueve reglas por separado.
+    # Reglas 4, 7 y 8 -> Sentimiento Negativo
+    negative_strength = np.fmax(
+        np.fmin(pos_level_lo, neg_level_md),
+        np.fmax(np.fmin(pos_level_lo, neg_level_hi), np.fmin(pos_level_md, neg_level_hi))
+    )
+    # Reglas 1, 5 y 9 -> Sentimiento Neutral
+    neutral_strength = np.fmax(
+        np.fmin(pos_level_lo, neg_level_lo),
+        np.fmax(np.fmin(pos_level_md, neg_level_md), np.fmin(pos_level_hi, neg_level_hi))
+    )
+    # Reglas 2, 3 y 6 -> Sentimiento Positivo
+    positive_strength = np.fmax(
+        np.fmin(pos_level_md, neg_level_lo),
+        np.fmax(np.fmin(pos_level_hi, neg_level_lo), np.fmin(pos_level_hi, neg_level_md))
+    )
+    return negative_strength, neutral_strength, positive_strength
+
+def defuzzify_batch(aggregated, x_op):
+    """
+    Defuzzifica por el método del centroide cada fila de una matriz de funciones agregadas.
+
+    Replica el cálculo de 'fuzz.defuzz(..., 'centroid')': integra exactamente cada
+    tramo lineal entre puntos consecutivos del universo de salida.
+
+    Args:
+        aggregated (numpy.array): Matriz (N x len(x_op)) de funciones de membresía agregadas.
+        x_op (numpy.array): Universo de discurso de la salida.
+
+    Returns:
+        numpy.array: Puntajes numéricos de sentimiento, uno por fila.
+
+    Raises:
+        EmptyMembershipError: Si alguna fila tiene área nula, igual que 'fuzz.defuzz'.
+    """
+    if np.any(aggregated.sum(axis=1) == 0):
+        raise EmptyMembershipError()
+
+    dx = np.diff(x_op)
+    y1 = aggregated[:, :-1]
+    y2 = aggregated[:, 1:]
+
+    # Área y momento de cada trapecio: área = dx*(y1+y2)/2, momento*área = área*x1 + dx²*(y2 + y1/2)/3
+    area = 0.5 * dx * (y1 + y2)
+    moment_area = area * x_op[:-1] + (dx * dx / 3.0) * (y2 + 0.5 * y1)
+
+    return moment_area.sum(axis=1) / np.fmax(area.sum(axis=1), np.finfo(float).eps)
+
+def build_inference_table(mf, resolution=512, chunk_size=16384):
+    """
+    Precalcula la superficie de inferencia del sistema difuso sobre una grilla
+    regular de (resolution x resolution) pares (puntaje positivo, puntaje negativo).
+
+    Una vez fijados los límites de las funciones de membresía, el sistema es una
+    función fija de dos entradas, por lo que cada tweet puede obtener su puntaje
+    mediante interpolación bilineal en la tabla ('lookup_inference_table').
+
+    Args:
+        mf (dict): Diccionario de funciones de membresía y universos creado por 'create_membership_functions'.
+        resolution (int): Cantidad de puntos de la grilla en cada eje.
+        chunk_size (int): Tamaño de bloque usado por 'fuzzy_inference_batch'.
+
+    Returns:
+        dict: Tabla con las grillas 'pos_grid' y 'neg_grid', la matriz 'values'
+              (indexada como values[i_pos, i_neg]), el error máximo estimado
+              'max_error' frente a la inferencia exacta y la cantidad de puntos
+              evaluados para estimarlo, 'error_samples' (ver 'estimate_table_error').
+    """
+    pos_grid = np.linspace(mf['x_pos'][0], mf['x_pos'][-1], resolution)
+    neg_grid = np.linspace(mf['x_neg'][0], mf['x_neg'][-1], resolution)
+
+    pos_mesh, neg_mesh = np.meshgrid(pos_grid, neg_grid, indexing='ij')
+    values = fuzzy_inference_batch(pos_mesh.ravel(), neg_mesh.ravel(), mf, chunk_size)
+
+    table = {
+        'pos_grid': pos_grid,
+        'neg_grid': neg_grid,
+        'values': values.reshape(resolution, resolution),
+    }
+    table['max_error'], table['error_samples'] = estimate_table_error(table, mf, chunk_size=chunk_size)
+    return table
+
+def lookup_inference_table(table, pos_scores, neg_scores):
+    """
+    Obtiene los puntajes de sentimiento por interpolación bilineal en una tabla
+    creada por 'build_inference_table'. Los puntajes fuera de la grilla se
+    acotan a sus bordes.
+
+    Args:
+        table (dict): Tabla de inferencia precalculada.
+        pos_scores (array-like): Puntajes positivos de los textos.
+        neg_scores (array-like): Puntajes negativos de los textos.
+
+    Returns:
+        numpy.array: Puntajes numéricos de sentimiento interpolados, uno por tweet.
+    """
+    i, ti = _grid_position(table['pos_grid'], pos_scores)
+    j, tj = _grid_position(table['neg_grid'], neg_scores)
+    values = table['values']
+
+    # Interpolación bilineal entre las cuatro esquinas de la celda
+    top = values[i, j] * (1 - tj) + values[i, j + 1] * tj
+    bottom = values[i + 1, j] * (1 - tj) + values[i + 1, j + 1] * tj
+    return top * (1 - ti) + bottom * ti
+
+def _grid_position(grid, scores):
+    """
+    Calcula la celda de la grilla que contiene cada puntaje y la posición
+    relativa (entre 0 y 1) del puntaje dentro de esa celda.
+
+    Args:
+        grid (numpy.array): Grilla regular de un eje de la tabla.
+        scores (array-like): Puntajes a ubicar.
+
+    Returns:
+        tuple: Índices de celda y fracciones dentro de la celda.
+    """
+    scores = np.asarray(scores, dtype=float)
+    step = grid[1] - grid[0]
+    if step == 0:
+        # Universo degenerado (mínimo == máximo): todos los puntajes caen en la primera celda
+        return np.zeros(scores.shape, dtype=int), np.zeros(scores.shape)
+
+    position = np.clip((scores - grid[0]) / step, 0, len(grid) - 1)
+    index = np.minimum(position.astype(int), len(grid) - 2)
+    return index, position - index
+
+def inference_table_error(table, mf, pos_scores, neg_scores, chunk_size=16384):
+    """
+    Mide el error absoluto máximo de la tabla de inferencia frente a la inferencia
+    exacta en los puntajes dados.
+
+    Args:
+        table (dict): Tabla de inferencia precalculada.
+        mf (dict): Diccionario de funciones de membresía usado para construir la tabla.
+        pos_scores (array-like): Puntajes positivos a evaluar.
+        neg_scores (array-like): Puntajes negativos a evaluar.
+        chunk_size (int): Tamaño de bloque usado por 'fuzzy_inference_batch'.
+
+    Returns:
+        float: Error absoluto máximo entre la tabla y la inferencia exacta.
+    """
+    exact = fuzzy_inference_batch(pos_scores, neg_scores, mf, chunk_size)
+    approx = lookup_inference_table(table, pos_scores, neg_scores)
+    return float(np.max(np.abs(exact - approx), initial=0.0))
+
+def estimate_table_error(table, mf, worst_fraction=0.01, subdivisions=16, chunk_size=16384):
+    """
+    Estima el error absoluto máximo de la tabla de inferencia frente a la inferencia exacta.
+
+    La inferencia exacta no es suave (las funciones de membresía se interpolan sobre
+    universos de 100 muestras), por lo que no hay una cota cerrada del error. Se
+    evalúa el centro de cada celda y luego, en la fracción 'worst_fraction' de celdas
+    con mayor error en el centro, una subgrilla de (subdivisions + 1)^2 puntos que
+    incluye bordes y esquinas. El resultado es una estimación (una cota inferior del
+    error máximo real), mucho más ajustada que el error en los centros.
+
+    Args:
+        table (dict): Tabla de inferencia precalculada.
+        mf (dict): Diccionario de funciones de membresía usado para construir la tabla.
+        worst_fraction (float): Fracción de celdas que se recorren con la subgrilla.
+        subdivisions (int): Subdivisiones por eje de cada celda recorrida.
+        chunk_size (int): Tamaño de bloque usado por 'fuzzy_inference_batch'.
+
+    Returns:
+        tuple: (error máximo estimado, cantidad de puntos evaluados).
+    """
+    pos_grid, neg_grid = table['pos_grid'], table['neg_grid']
+    pos_centers = (pos_grid[:-1] + pos_grid[1:]) / 2
+    neg_centers = (neg_grid[:-1] + neg_grid[1:]) / 2
+    pos_mesh, neg_mesh = np.meshgrid(pos_centers, neg_centers, indexing='ij')
+    center_errors = np.abs(fuzzy_inference_batch(pos_mesh.ravel(), neg_mesh.ravel(), mf, chunk_size)
+                           - lookup_inference_table(table, pos_mesh.ravel(), neg_mesh.ravel()))
+    if center_errors.size == 0:
+        return 0.0, 0
+
+    # Subgrilla (con bordes y esquinas) en las celdas con mayor error en el centro
+    worst = max(1, int(np.ceil(center_errors.size * worst_fraction)))
+    cells = np.argpartition(center_errors, -worst)[-worst:]
+    i, j = np.unravel_index(cells, pos_mesh.shape)
+    fractions = np.linspace(0, 1, subdivisions + 1)
+    pos_points = pos_grid[i, None] + (pos_grid[i + 1] - pos_grid[i])[:, None] * fractions
+    neg_points = neg_grid[j, None] + (neg_grid[j + 1] - neg_grid[j])[:, None] * fractions
+    pos_scores = np.repeat(pos_points, len(fractions), axis=1).ravel()
+    neg_scores = np.tile(neg_points, len(fractions)).ravel()
+
+    cell_error = inference_table_error(table, mf, pos_scores, neg_scores, chunk_size)
+    return max(float(center_errors.max()), cell_error), center_errors.size + pos_scores.size
+
+def table_matches(table, mf):
+    """
+    Indica si una tabla de inferencia fue construida para los mismos límites
+    que las funciones de membresía dadas.
+
+    Args:
+        table (dict): Tabla de inferencia precalculada.
+        mf (dict): Diccionario de funciones de membresía.
+
+    Returns:
+        bool: True si los límites de ambos ejes coinciden.
+    """
+    return (table['pos_grid'][0] == mf['x_pos'][0] and table['pos_grid'][-1] == mf['x_pos'][-1]
+            and table['neg_grid'][0] == mf['x_neg'][0] and table['neg_grid'][-1] == mf['x_neg'][-1])
+
+def save_inference_table(table, path):
+    """
+    Guarda una tabla de inferencia en un archivo '.npz' de NumPy.
+
+    Args:
+        table (dict): Tabla de inferencia precalculada.
+        path (str): Ruta del archivo de destino.
+    """
+    np.savez(path, **table)
+
+def load_inference_table(path):
+    """
+    Carga una tabla de inferencia guardada con 'save_inference_table'.
+
+    Args:
+        path (str): Ruta del archivo '.npz'.
+
+    Returns:
+        dict: Tabla de inferencia precalculada.
+    """
+    with np.load(path) as data:
+        table = {key: data[key] for key in data.files}
+    table['max_error'] = float(table['max_error'])
+    if 'error_samples' in table:
+        table['error_samples'] = int(table['error_samples'])
+    return table
+
+# Políticas para puntajes fuera del rango de una calibración fija
+OUT_OF_RANGE_POLICIES = ('clip', 'error')
+
+def fit_calibration(pos_scores, neg_scores, calibration=None):
+    """
+    Ajusta (o amplía) los límites de los puntajes con que se construyen las
+    funciones de membresía. Puede llamarse bloque a bloque para calibrar en línea.
+
+    Args:
+        pos_scores (array-like): Puntajes positivos.
+        neg_scores (array-like): Puntajes negativos.
+        calibration (dict, opcional): Calibración a ampliar con los nuevos puntajes.
+
+    Returns:
+        dict: Calibración con 'pos_min', 'pos_max', 'neg_min', 'neg_max' y 'rows'.
+    """
+    pos_scores = np.asarray(pos_scores, dtype=float)
+    neg_scores = np.asarray(neg_scores, dtype=float)
+    calibration = dict(calibration or {'pos_min': np.inf, 'pos_max': -np.inf,
+                                       'neg_min': np.inf, 'neg_max': -np.inf, 'rows': 0})
+    if len(pos_scores):
+        calibration['pos_min'] = min(calibration['pos_min'], float(pos_scores.min()))
+        calibration['pos_max'] = max(calibration['pos_max'], float(pos_scores.max()))
+        calibration['neg_min'] = min(calibration['neg_min'], float(neg_scores.min()))
+        calibration['neg_max'] = max(calibration['neg_max'], float(neg_scores.max()))
+        calibration['rows'] += len(pos_scores)
+    return calibration
+
+def merge_calibrations(calibrations):
+    """
+    Combina calibraciones ajustadas por separado (por ejemplo, una por fragmento del
+    dataset) en la que se obtendría ajustando todos los puntajes juntos.
+
+    Args:
+        calibrations (iterable): Calibraciones creadas con 'fit_calibration'.
+
+    Returns:
+        dict: Calibración con los límites globales y la suma de 'rows'.
+    """
+    merged = fit_calibration([], [])
+    for calibration in calibrations:
+        if not calibration['rows']:
+            continue
+        merged['pos_min'] = min(merged['pos_min'], calibration['pos_min'])
+        merged['pos_max'] = max(merged['pos_max'], calibration['pos_max'])
+        merged['neg_min'] = min(merged['neg_min'], calibration['neg_min'])
+        merged['neg_max'] = max(merged['neg_max'], calibration['neg_max'])
+        merged['rows'] += calibration['rows']
+    return merged
+
+def calibrated_membership_functions(calibration):
+    """
+    Crea las funciones de membresía de una calibración (ver 'create_membership_functions').
+
+    Args:
+        calibration (dict): Calibración creada con 'fit_calibration'.
+
+    Returns:
+        dict: Funciones de membresía y universos de discurso.
+    """
+    return create_membership_functions(calibration['pos_min'], calibration['pos_max'],
+                                       calibration['neg_min'], calibration['neg_max'])
+
+def apply_calibration_range(pos_scores, neg_scores, calibration, policy='clip'):
+    """
+    Aplica la política de valores fuera de rango antes de inferir con una calibración fija.
+
+    Fuera de su universo las funciones de membresía valen cero, por lo que un puntaje
+    fuera de rango no activaría ninguna regla. Con 'clip' se lleva al límite más cercano
+    (un tweet más positivo que todos los calibrados recibe el resultado del máximo);
+    con 'error' se rechaza el bloque.
+
+    Args:
+        pos_scores (array-like): Puntajes positivos.
+        neg_scores (array-like): Puntajes negativos.
+        calibration (dict): Calibración creada con 'fit_calibration'.
+        policy (str): 'clip' o 'error'.
+
+    Returns:
+        tuple: (puntajes positivos, puntajes negativos, cantidad de tweets fuera de rango).
+
+    Raises:
+        ValueError: Si la política es 'error' y hay puntajes fuera de rango, o si la política no existe.
+    """
+    if policy not in OUT_OF_RANGE_POLICIES:
+        raise ValueError(f"Política fuera de rango desconocida: {policy}")
+    pos_scores = np.asarray(pos_scores, dtype=float)
+    neg_scores = np.asarray(neg_scores, dtype=float)
+    outside = ((pos_scores < calibration['pos_min']) | (pos_scores > calibration['pos_max'])
+               | (neg_scores < calibration['neg_min']) | (neg_scores > calibration['neg_max']))
+    count = int(outside.sum())
+    if count and policy == 'error':
+        raise ValueError(f"{count} tweets tienen puntajes fuera del rango calibrado "
+                         f"(positivo {calibration['pos_min']}..{calibration['pos_max']}, "
+                         f"negativo {calibration['neg_min']}..{calibration['neg_max']}).")
+    return (np.clip(pos_scores, calibration['pos_min'], calibration['pos_max']),
+            np.clip(neg_scores, calibration['neg_min'], calibration['neg_max']), count)
+
+def save_calibration(calibration, path):
+    """
+    Guarda una calibración en un archivo JSON.
+
+    Args:
+        calibration (dict): Calibración creada con 'fit_calibration'.
+        path (str): Ruta del archivo de destino.
+    """
+    with open(path, 'w') as f:
+        json.dump(calibration, f, indent=2)
+
+def load_calibration(path):
+    """
+    Carga una calibración guardada con 'save_calibration'.
+
+    Args:
+        path (str): Ruta del archivo JSON.
+
+    Returns:
+        dict: Calibración.
+    """
+    with open(path) as f:
+        return json.load(f)
+
+def fuzzy_inference_analytic(pos_scores, neg_scores, mf, chunk_size=65536):
+    """
+    Aplica el sistema de inferencia difusa sin discretizar los universos de discurso.
+
+    La fuzzificación evalúa exactamente las funciones triangulares en cada puntaje
+    (en lugar de interpolar sobre 100 muestras) y la defuzzificación calcula en forma
+    cerrada el centroide de la unión de los triángulos de salida recortados
+    ('defuzzify_analytic'). El resultado es el centroide exacto del sistema continuo,
+    por lo que difiere levemente del obtenido con 'fuzzy_inference' y 'defuzzify'.
+
+    Args:
+        pos_scores (array-like): Puntajes positivos de los textos.
+        neg_scores (array-like): Puntajes negativos de los textos.
+        mf (dict): Diccionario de funciones de membresía y universos creado por 'create_membership_functions'.
+        chunk_size (int): Cantidad máxima de tweets procesados por bloque.
+
+    Returns:
+        numpy.array: Puntajes numéricos de sentimiento, uno por tweet.
+    """
+    pos_scores = np.asarray(pos_scores, dtype=float)
+    neg_scores = np.asarray(neg_scores, dtype=float)
+    triangles = mf['triangles']
+    output_triangles = [triangles['op_negative'], triangles['op_neutral'], triangles['op_positive']]
+    sentiment_scores = np.empty(len(pos_scores))
+
+    for start in range(0, len(pos_scores), chunk_size):
+        stop = start + chunk_size
+        # Fuzzificación analítica de los puntajes de entrada
+        pos_levels = [fuzz.trimf(pos_scores[start:stop], triangles[name])
+                      for name in ('pos_lo', 'pos_md', 'pos_hi')]
+        neg_levels = [fuzz.trimf(neg_scores[start:stop], triangles[name])
+                      for name in ('neg_lo', 'neg_md', 'neg_hi')]
+        strengths = fire_rules_batch(pos_levels, neg_levels)
+        sentiment_scores[start:stop] = defuzzify_analytic(strengths, output_triangles,
+                                                          mf['x_op'][0], mf['x_op'][-1])
+
+    return sentiment_scores
+
+def defuzzify_analytic(strengths, triangles, x_min, x_max):
+    """
+    Calcula en forma cerrada el centroide de la unión (máximo) de conjuntos
+    triangulares recortados a sus fuerzas de activación.
+
+    La función agregada es lineal a trozos. Sus quiebres solo pueden estar en los
+    vértices de los triángulos, en los puntos donde un lado alcanza la altura de
+    recorte de algún conjunto o en las intersecciones entre lados de distintos
+    triángulos. Entre dos quiebres consecutivos el área y el momento de un tramo
+    lineal se integran exactamente.
+
+    Args:
+        strengths (list): Fuerza de activación de cada conjunto de salida (un arreglo por conjunto).
+        triangles (list): Vértices [a, b, c] de cada conjunto de salida, en el mismo orden.
+        x_min (float): Límite inferior del universo de salida.
+        x_max (float): Límite superior del universo de salida.
+
+    Returns:
+        numpy.array: Puntajes numéricos de sentimiento, uno por tweet.
+
+    Raises:
+        EmptyMembershipError: Si algún tweet no activa ningún conjunto de salida.
+    """
+    strengths = [np.asarray(strength, dtype=float) for strength in strengths]
+    n = len(strengths[0])
+
+    # Lados no degenerados de los triángulos como rectas y = m*x + q
+    lines = []
+    fixed_points = [x_min, x_max]
+    for a, b, c in triangles:
+        fixed_points.extend([a, b, c])
+        if a < b:
+            lines.append((1.0 / (b - a), -a / (b - a)))
+        if b < c:
+            lines.append((-1.0 / (c - b), c / (c - b)))
+
+    # Intersecciones entre lados (no dependen de las fuerzas de activación)
+    for i, (m1, q1) in enumerate(lines):
+        for m2, q2 in lines[i + 1:]:
+            if m1 != m2:
+                fixed_points.append((q2 - q1) / (m1 - m2))
+
+    # Puntos donde cada lado alcanza la altura de recorte de cada conjunto
+    columns = [np.full(n, point, dtype=float) for point in sorted(set(fixed_points))]
+    for m, q in lines:
+        for strength in strengths:
+            columns.append((strength - q) / m)
+
+    breakpoints = np.clip(np.column_stack(columns), x_min, x_max)
+    breakpoints.sort(axis=1)
+
+    # Valor de la función agregada en cada quiebre
+    values = np.zeros_like(breakpoints)
+    for strength, (a, b, c) in zip(strengths, triangles):
+        clipped = np.fmin(strength[:, None], _triangle_values(breakpoints, a, b, c))
+        np.fmax(values, clipped, out=values)
+
+    x1, x2 = breakpoints[:, :-1], breakpoints[:, 1:]
+    y1, y2 = values[:, :-1], values[:, 1:]
+    dx = x2 - x1
+
+    # Integrales exactas de f(x) y x*f(x) para f lineal en cada tramo
+    area = (0.5 * dx * (y1 + y2)).sum(axis=1)
+    moment = (dx / 6.0 * (y1 * (2 * x1 + x2) + y2 * (x1 + 2 * x2))).sum(axis=1)
+
+    if np.any(area == 0):
+        raise EmptyMembershipError()
+    return moment / area
+
+def _triangle_values(x, a, b, c):
+    """
+    Evalúa una función de membresía triangular [a, b, c] en un arreglo de cualquier forma.
+
+    Args:
+        x (numpy.array): Puntos donde evaluar la función.
+        a (float): Vértice izquierdo.
+        b (float): Vértice central (pertenencia 1).
+        c (float): Vértice derecho.
+
+    Returns:
+        numpy.array: Grados de pertenencia, con la misma forma que 'x'.
+    """
+    y = np.ones_like(x)
+    if a < b:
+        y = np.fmin(y, (x - a) / (b - a))
+    else:
+        y[x < a] = 0.0
+    if b < c:
+        y = np.fmin(y, (c - x) / (c - b))
+    else:
+        y[x > c] = 0.0
+    return np.clip(y, 0.0, 1.0)
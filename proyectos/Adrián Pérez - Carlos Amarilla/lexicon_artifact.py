@@ -0,0 +1,378 @@
+# lexicon_artifact.py
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import numpy as np
+
+# Archivo por defecto del léxico compilado
+DEFAULT_ARTIFACT_PATH = 'lexicon.bin'
+
+# Identificador del formato y alineación de los arreglos dentro del archivo
+MAGIC = b'SWNLEX01'
+ALIGNMENT = 64
+
+# Categorías de WordNet usadas por 'calculate_sentiment_scores'
+WORDNET_POS = ('n', 'v', 'a', 'r')
+
+def _hash_string(text):
+    """
+    Calcula un hash estable de 64 bits para una cadena.
+
+    Args:
+        text (str): Cadena a resumir.
+
+    Returns:
+        int: Hash sin signo de 64 bits.
+    """
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def _string_table(strings):
+    """
+    Codifica una lista de cadenas como un bloque de bytes UTF-8 y sus desplazamientos.
+
+    Args:
+        strings (list): Cadenas a codificar.
+
+    Returns:
+        tuple: (bytes concatenados como uint8, desplazamientos int64 de longitud len(strings) + 1).
+    """
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+def _hash_table(strings):
+    """
+    Construye una tabla de búsqueda ordenada por hash para una lista de cadenas.
+
+    Args:
+        strings (list): Cadenas a indexar.
+
+    Returns:
+        tuple: (hashes ordenados uint64, posición de cada hash en la lista original int64).
+    """
+    hashes = np.array([_hash_string(s) for s in strings], dtype=np.uint64)
+    order = np.argsort(hashes, kind='stable').astype(np.int64)
+    return hashes[order], order
+
+def _csr(lists, dtype=np.int64):
+    """
+    Codifica una lista de listas en formato CSR (valores planos y desplazamientos).
+
+    Args:
+        lists (list): Listas de enteros.
+        dtype (numpy.dtype): Tipo de los valores.
+
+    Returns:
+        tuple: (valores planos, desplazamientos int64 de longitud len(lists) + 1).
+    """
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(values) for values in lists])
+    flat = np.fromiter((v for values in lists for v in values), dtype=dtype, count=int(offsets[-1]))
+    return flat, offsets
+
+def write_artifact(path, arrays, meta):
+    """
+    Escribe arreglos de NumPy en un único archivo binario apto para 'mmap'.
+
+    Formato: MAGIC, longitud del encabezado (uint64), encabezado JSON con la
+    descripción de cada arreglo y luego los datos de cada arreglo alineados a 64 bytes.
+
+    Args:
+        path (str): Archivo de destino.
+        arrays (dict): Arreglos a guardar, por nombre.
+        meta (dict): Metadatos adicionales (versiones, cantidades).
+    """
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        arrays[name] = array
+        offset = -(-offset // ALIGNMENT) * ALIGNMENT
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += array.nbytes
+
+    header = json.dumps({'meta': meta, 'arrays': layout}).encode('utf-8')
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(np.uint64(len(header)).tobytes())
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(array.tobytes())
+    os.replace(tmp_path, path)
+
+def build_artifact(path=DEFAULT_ARTIFACT_PATH, words=None):
+    """
+    Compila en un único archivo todo lo que necesita 'calculate_sentiment_scores'
+    para desambiguar y puntuar palabras: synsets candidatos de cada (palabra, pos),
+    firmas de glosa como identificadores de token y puntajes de SentiWordNet.
+
+    Los candidatos se obtienen con 'fast_lesk.LeskIndex', por lo que conservan el
+    orden y el filtrado de 'nltk.wsd.lesk'.
+
+    Args:
+        path (str): Archivo de destino.
+        words (iterable, opcional): Palabras a incluir además de los lemas de WordNet
+                                    (por ejemplo, el vocabulario de un corpus con sus formas flexionadas).
+
+    Returns:
+        dict: Metadatos del artefacto construido.
+    """
+    import nltk
+    from nltk.corpus import wordnet, sentiwordnet as swn
+    from fast_lesk import LeskIndex, index_version
+
+    vocabulary = {word for word in wordnet.all_lemma_names() if word.isalpha()}
+    if words is not None:
+        vocabulary.update(words)
+
+    index = LeskIndex()
+    keys = []
+    key_candidates = []
+    synset_ids = {}
+    signatures = []
+    for word in sorted(vocabulary):
+        for pos in WORDNET_POS:
+            candidates = []
+            for name, signature in index.candidates(word, pos):
+                if name not in synset_ids:
+                    synset_ids[name] = len(synset_ids)
+                    signatures.append(signature)
+                candidates.append(synset_ids[name])
+            keys.append(f"{word}\t{pos}")
+            key_candidates.append(candidates)
+
+    synset_names = list(synset_ids)
+
+    # Puntajes de SentiWordNet (NaN si el synset no tiene puntajes)
+    pos_scores = np.full(len(synset_names), np.nan)
+    neg_scores = np.full(len(synset_names), np.nan)
+    for i, name in enumerate(synset_names):
+        try:
+            swn_synset = swn.senti_synset(name)
+            pos_scores[i] = swn_synset.pos_score()
+            neg_scores[i] = swn_synset.neg_score()
+        except Exception:
+            continue
+
+    # Vocabulario de tokens de las glosas y firmas como identificadores
+    token_ids = {}
+    signature_ids = []
+    for signature in signatures:
+        signature_ids.append(sorted(token_ids.setdefault(token, len(token_ids)) for token in signature))
+    tokens = list(token_ids)
+
+    arrays = {}
+    arrays['key_blob'], arrays['key_offsets'] = _string_table(keys)
+    arrays['key_hashes'], arrays['key_order'] = _hash_table(keys)
+    arrays['candidates'], arrays['candidate_offsets'] = _csr(key_candidates, np.int32)
+    arrays['synset_blob'], arrays['synset_offsets'] = _string_table(synset_names)
+    arrays['pos_scores'] = pos_scores
+    arrays['neg_scores'] = neg_scores
+    arrays['token_blob'], arrays['token_offsets'] = _string_table(tokens)
+    arrays['token_hashes'], arrays['token_order'] = _hash_table(tokens)
+    arrays['gloss_tokens'], arrays['gloss_offsets'] = _csr(signature_ids, np.int32)
+
+    meta = {
+        'version': list(index_version()),
+        'keys': len(keys),
+        'synsets': len(synset_names),
+        'tokens': len(tokens),
+        'nltk': nltk.__version__,
+    }
+    write_artifact(path, arrays, meta)
+    return meta
+
+class CompiledLexicon:
+    """
+    Léxico compilado por 'build_artifact', abierto con 'mmap' en modo de solo lectura.
+
+    Los arreglos se leen directamente del archivo mapeado, por lo que abrirlo no
+    requiere cargar WordNet ni SentiWordNet y varios procesos que abren el mismo
+    archivo comparten una única copia física en la caché de páginas del sistema.
+    """
+
+    def __init__(self, path=DEFAULT_ARTIFACT_PATH):
+        """
+        Args:
+            path (str): Archivo del léxico compilado.
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{path}' no es un léxico compilado válido.")
+        header_length = int(np.frombuffer(self._mmap, dtype=np.uint64, count=1, offset=len(MAGIC))[0])
+        header_start = len(MAGIC) + 8
+        header = json.loads(self._mmap[header_start:header_start + header_length].decode('utf-8'))
+        data_start = -(-(header_start + header_length) // ALIGNMENT) * ALIGNMENT
+
+        self.meta = header['meta']
+        for name, spec in header['arrays'].items():
+            shape = spec['shape']
+            count = int(np.prod(shape)) if shape else 1
+            array = np.frombuffer(self._mmap, dtype=np.dtype(spec['dtype']), count=count,
+                                  offset=data_start + spec['offset'])
+            setattr(self, name, array.reshape(shape))
+
+        # Cachés locales de búsquedas ya resueltas (cadena -> índice)
+        self._keys = {}
+        self._tokens = {}
+
+    @staticmethod
+    def _find(text, hashes, order, blob, offsets):
+        """
+        Busca una cadena en una tabla de hashes ordenada.
+
+        Returns:
+            int: Posición de la cadena en su tabla original, o -1 si no está.
+        """
+        target = _hash_string(text)
+        encoded = text.encode('utf-8')
+        position = int(np.searchsorted(hashes, np.uint64(target)))
+        while position < len(hashes) and int(hashes[position]) == target:
+            i = int(order[position])
+            if blob[offsets[i]:offsets[i + 1]].tobytes() == encoded:
+                return i
+            position += 1
+        return -1
+
+    def key_index(self, word, pos):
+        """
+        Obtiene el índice de la entrada (palabra, pos) en el artefacto.
+
+        Returns:
+            int: Índice de la entrada, o -1 si la palabra no fue compilada.
+        """
+        key = f"{word}\t{pos}"
+        index = self._keys.get(key)
+        if index is None:
+            index = self._find(key, self.key_hashes, self.key_order, self.key_blob, self.key_offsets)
+            self._keys[key] = index
+        return index
+
+    def token_id(self, token):
+        """
+        Obtiene el identificador de un token en el vocabulario de las glosas.
+
+        Returns:
+            int: Identificador del token, o -1 si no aparece en ninguna glosa.
+        """
+        token_id = self._tokens.get(token)
+        if token_id is None:
+            token_id = self._find(token, self.token_hashes, self.token_order, self.token_blob, self.token_offsets)
+            self._tokens[token] = token_id
+        return token_id
+
+    def senses(self, word, pos):
+        """
+        Obtiene los synsets candidatos de una palabra, en el orden de WordNet.
+
+        Args:
+            word (str): Palabra.
+            pos (str): Etiqueta POS de WordNet.
+
+        Returns:
+            list or None: Índices de los synsets, o None si la palabra no fue compilada.
+        """
+        key = self.key_index(word, pos)
+        if key < 0:
+            return None
+        return self.candidates[self.candidate_offsets[key]:self.candidate_offsets[key + 1]].tolist()
+
+    def lesk(self, context_sentence, ambiguous_word, pos):
+        """
+        Algoritmo de Lesk sobre las firmas compiladas, con el mismo criterio que
+        'fast_lesk.LeskIndex.lesk_name' (ante empates gana el primer candidato).
+
+        Args:
+            context_sentence (iterable): Palabras del contexto.
+            ambiguous_word (str): Palabra a desambiguar.
+            pos (str): Etiqueta POS de WordNet.
+
+        Returns:
+            int or None: Índice del synset elegido, -1 si la palabra no tiene synsets
+                         para esa categoría, o None si la palabra no está compilada.
+        """
+        key = self.key_index(ambiguous_word, pos)
+        if key < 0:
+            return None
+        start, stop = self.candidate_offsets[key], self.candidate_offsets[key + 1]
+        if start == stop:
+            return -1
+
+        context = {self.token_id(token) for token in context_sentence}
+        context.discard(-1)
+
+        best_synset, best_overlap = -1, -1
+        for synset in self.candidates[start:stop].tolist():
+            gloss = self.gloss_tokens[self.gloss_offsets[synset]:self.gloss_offsets[synset + 1]].tolist()
+            overlap = len(context.intersection(gloss))
+            if overlap > best_overlap:
+                best_synset, best_overlap = synset, overlap
+        return best_synset
+
+    def synset_name(self, synset):
+        """
+        Devuelve el nombre de un synset del artefacto (por ejemplo 'good.a.01').
+        """
+        return self.synset_blob[self.synset_offsets[synset]:self.synset_offsets[synset + 1]].tobytes().decode('utf-8')
+
+    def senti_scores(self, synset):
+        """
+        Devuelve los puntajes de SentiWordNet de un synset del artefacto.
+
+        Returns:
+            tuple or None: (puntaje positivo, puntaje negativo), o None si el synset
+                           no tiene puntajes en SentiWordNet.
+        """
+        pos_score = float(self.pos_scores[synset])
+        if pos_score != pos_score:  # NaN
+            return None
+        return pos_score, float(self.neg_scores[synset])
+
+    def close(self):
+        """
+        Libera el mapeo del archivo.
+        """
+        self._mmap.close()
+
+def corpus_vocabulary(csv_path):
+    """
+    Obtiene las palabras de un dataset tal como llegan a la desambiguación.
+
+    Args:
+        csv_path (str): Ruta del dataset con la columna 'sentence'.
+
+    Returns:
+        set: Palabras distintas del corpus preprocesado y tokenizado.
+    """
+    import pandas as pd
+    from nltk.tokenize import word_tokenize
+    from preprocessing import preprocess_text
+
+    words = set()
+    for text in pd.read_csv(csv_path)['sentence'].fillna('').astype(str):
+        words.update(word_tokenize(preprocess_text(text)))
+    return words
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Compila el léxico de WordNet/SentiWordNet en un archivo binario.")
+    parser.add_argument('--output', default=DEFAULT_ARTIFACT_PATH,
+                        help=f"Archivo de destino (por defecto: {DEFAULT_ARTIFACT_PATH}).")
+    parser.add_argument('--corpus', default=None,
+                        help="Dataset CSV cuyas palabras (incluidas las formas flexionadas) se agregan al léxico.")
+    args = parser.parse_args()
+
+    words = corpus_vocabulary(args.corpus) if args.corpus else None
+    meta = build_artifact(args.output, words)
+    print(f"Léxico compilado en '{args.output}': {meta['keys']} entradas, "
+          f"{meta['synsets']} synsets, {meta['tokens']} tokens de glosas.")
@@ -0,0 +1,122 @@
+# load_test.py
+
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+from service import DEFAULT_HOST, DEFAULT_PORT
+
+def load_texts(csv_path='sentiment140.csv'):
+    """
+    Carga los textos del dataset que se enviarán al servicio.
+
+    Args:
+        csv_path (str): Dataset CSV con la columna 'sentence'.
+
+    Returns:
+        list: Textos del dataset.
+    """
+    import pandas as pd
+
+    return pd.read_csv(csv_path)['sentence'].fillna('').astype(str).tolist()
+
+async def run_client(host, port, texts, requests, window, latencies, offset):
+    """
+    Cliente que envía 'requests' solicitudes por una conexión, con hasta 'window'
+    solicitudes en curso a la vez, y registra la latencia de cada una.
+
+    Args:
+        host (str): Dirección del servicio.
+        port (int): Puerto del servicio.
+        texts (list): Textos a enviar (se recorren en ciclo).
+        requests (int): Cantidad de solicitudes.
+        window (int): Solicitudes en curso simultáneas.
+        latencies (list): Latencias en segundos (se agregan al final).
+        offset (int): Posición inicial en 'texts'.
+
+    Returns:
+        int: Cantidad de respuestas con error.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    sent_at = {}
+    slots = asyncio.Semaphore(window)
+    errors = 0
+
+    async def receive():
+        nonlocal errors
+        for _ in range(requests):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent_at.pop(response['id']))
+            errors += 'error' in response
+            slots.release()
+
+    receiver = asyncio.create_task(receive())
+    for i in range(requests):
+        await slots.acquire()
+        sent_at[i] = time.perf_counter()
+        text = texts[(offset + i) % len(texts)]
+        writer.write((json.dumps({'id': i, 'text': text}) + '\n').encode('utf-8'))
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+    return errors
+
+async def run_load_test(host, port, texts, clients, requests, window):
+    """
+    Ejecuta varios clientes concurrentes y mide el rendimiento del servicio.
+
+    Args:
+        host (str): Dirección del servicio.
+        port (int): Puerto del servicio.
+        texts (list): Textos a enviar.
+        clients (int): Conexiones concurrentes.
+        requests (int): Solicitudes por conexión.
+        window (int): Solicitudes en curso simultáneas por conexión.
+
+    Returns:
+        dict: Solicitudes, errores, duración, rendimiento y percentiles de latencia en ms.
+    """
+    latencies = []
+    start = time.perf_counter()
+    errors = await asyncio.gather(*(run_client(host, port, texts, requests, window, latencies, c * requests)
+                                    for c in range(clients)))
+    elapsed = time.perf_counter() - start
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'errors': sum(errors),
+        'seconds': elapsed,
+        'throughput': len(latencies) / elapsed,
+        'latency_ms': {name: float(np.percentile(latencies_ms, q))
+                       for name, q in (('p50', 50), ('p95', 95), ('p99', 99), ('max', 100))},
+    }
+
+def main(argv=None):
+    """
+    Prueba de carga del servicio de 'service.py', que debe estar en ejecución.
+
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos.
+    """
+    parser = argparse.ArgumentParser(description="Prueba de carga del servicio de sentimiento.")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--input', default='sentiment140.csv', help="Dataset con los textos a enviar.")
+    parser.add_argument('--clients', type=int, default=16, help="Conexiones concurrentes (por defecto: 16).")
+    parser.add_argument('--requests', type=int, default=1000, help="Solicitudes por conexión (por defecto: 1000).")
+    parser.add_argument('--window', type=int, default=8,
+                        help="Solicitudes en curso por conexión (por defecto: 8).")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run_load_test(args.host, args.port, load_texts(args.input),
+                                       args.clients, args.requests, args.window))
+    latency = result['latency_ms']
+    print(f"{result['requests']} solicitudes ({result['errors']} con error) en {result['seconds']:.2f} s: "
+          f"{result['throughput']:.1f} solicitudes/s")
+    print(f"Latencia: p50 {latency['p50']:.2f} ms, p95 {latency['p95']:.2f} ms, "
+          f"p99 {latency['p99']:.2f} ms, máxima {latency['max']:.2f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -1,46 +1,58 @@
 # main.py
 
-import pandas as pd
+import argparse
+import os
+import sys
+import tempfile
 import time
-from preprocessing import preprocess_text
-from sentiment_lexicon import calculate_sentiment_scores
-from fuzzy_logic import (
-    create_membership_functions,
-    fuzzy_inference,
-    defuzzify,
-    get_sentiment_label
-)
-from benchmark import calculate_benchmarks
-import nltk
-
-# Mostrar la versión de NLTK instalada
-print("Versión de NLTK:", nltk.__version__)
-
-# Descargar recursos de NLTK necesarios si no están disponibles
-nltk.download('punkt')
-nltk.download('wordnet')
-nltk.download('punkt_tab')
-nltk.download('sentiwordnet')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('averaged_perceptron_tagger_eng')
-
-def load_and_preprocess():
+import profiling
+from preprocessing import preprocess_texts
+
+# Las bibliotecas pesadas (pandas, NumPy, scikit-fuzzy y los corpus de NLTK) se
+# importan dentro de la etapa que las usa, para que 'import main' sea inmediato
+# y ningún proceso cargue lo que no necesita.
+
+def load_and_preprocess(input_path='sentiment140.csv'):
     """
     Carga el dataset Sentiment140, realiza el preprocesamiento del texto
     y prepara el DataFrame para su posterior análisis.
 
+    Args:
+        input_path (str): Ruta del dataset CSV con columnas 'sentence' y 'sentiment'.
+
     Returns:
         df (pd.DataFrame): DataFrame preprocesado con columnas 'text', 'target' y 'clean_text'.
     """
+    import pandas as pd
+
     # Leer el dataset y seleccionar las columnas relevantes
-    df = pd.read_csv('sentiment140.csv')
+    df = pd.read_csv(input_path)
     df = df[['sentence', 'sentiment']]
     
     # Mostrar los valores únicos en la columna 'sentiment'
     print("Valores únicos en 'sentiment':", df['sentiment'].unique())
     
-    # Mapear los valores numéricos de 'sentiment' a etiquetas de texto
-    df['sentiment'] = df['sentiment'].map({0: 'negative', 1: 'positive', 2: 'neutral'})
+    return prepare_dataset(df)
+
+def prepare_dataset(df):
+    """
+    Prepara un bloque del dataset: mapea las etiquetas, renombra las columnas y
+    preprocesa el texto.
+
+    Args:
+        df (pd.DataFrame): DataFrame con columnas 'sentence' y 'sentiment'.
+
+    Returns:
+        df (pd.DataFrame): DataFrame preprocesado con columnas 'text', 'target' y 'clean_text'.
+    """
+    import pandas as pd
+    from fuzzy_logic import SENTIMENT_LABELS
+
+    df = df[['sentence', 'sentiment']].copy()
+
+    # Mapear los valores numéricos de 'sentiment' a etiquetas de texto (como categorías)
+    df['sentiment'] = pd.Categorical(df['sentiment'].map({0: 'negative', 1: 'positive', 2: 'neutral'}),
+                                     categories=SENTIMENT_LABELS)
     
     # Renombrar columnas para consistencia
     df.rename(columns={'sentence': 'text', 'sentiment': 'target'}, inplace=True)
@@ -50,55 +62,195 @@ def load_and_preprocess():
     df['text'] = df['text'].astype(str)
     
     # Aplicar preprocesamiento al texto
-    df['clean_text'] = df['text'].apply(preprocess_text)
+    df['clean_text'] = preprocess_texts(df['text'])
     
     return df
 
-def calculate_scores(df):
+def calculate_scores(df, workers=1, lexicon_path=None, pool=None, cache=None, scorer='nltk'):
     """
     Calcula los puntajes de sentimiento positivos y negativos para cada texto preprocesado.
 
+    Cada texto distinto se puntúa una sola vez y su resultado se copia en las filas
+    duplicadas (retuits, saludos repetidos, textos vacíos tras el preprocesamiento).
+    Con más de un proceso de trabajo, los textos se reparten en bloques entre
+    procesos que cargan los recursos de NLTK una sola vez; los puntajes son
+    idénticos a los del cálculo en un solo proceso.
+
     Args:
         df (pd.DataFrame): DataFrame con la columna 'clean_text'.
+        workers (int): Cantidad de procesos de trabajo (1 para calcular en el proceso actual).
+        lexicon_path (str, opcional): Léxico compilado que debe cargar cada proceso de trabajo.
+        pool (multiprocessing.Pool, opcional): Procesos ya inicializados a reutilizar
+                                               (ver 'sentiment_lexicon.create_pool').
+        cache (score_cache.ScoreCache, opcional): Caché persistente de puntajes; solo se
+                                                  calculan los textos que no estén guardados.
+        scorer (str): Motor de puntuación (ver 'sentiment_lexicon.get_scorer'): 'nltk' y 'array'
+                      dan los mismos puntajes; 'first-sense' y 'mean-sense' los aproximan.
 
     Returns:
         df (pd.DataFrame): DataFrame con nuevas columnas 'positive_score' y 'negative_score'.
     """
+    import numpy as np
+    import pandas as pd
+    from sentiment_lexicon import get_scorer, score_texts_parallel, APPROXIMATE_SCORERS
+    from fast_lesk import save_index
+
+    def score(texts):
+        # Aplicar la función de cálculo de puntajes a cada texto
+        if workers > 1:
+            return score_texts_parallel(texts, workers, lexicon_path, pool=pool, scorer=scorer)
+        return get_scorer(scorer)(texts)
+
     start_time = time.time()
-    # Aplicar la función de cálculo de puntajes a cada texto
-    df[['positive_score', 'negative_score']] = df['clean_text'].apply(
-        lambda text: pd.Series(calculate_sentiment_scores(text))
+    # Puntuar una sola vez cada texto distinto y repetir el resultado en sus duplicados
+    codes, texts = pd.factorize(df['clean_text'])
+    texts = texts.tolist()
+    print_dedup_ratio("Textos", len(texts), len(df))
+    if cache is not None:
+        from score_cache import cached_scores
+        hits, misses = cache.hits, cache.misses
+        scores = cached_scores(texts, cache, score)
+        print(f"Caché de puntajes: {cache.hits - hits} textos distintos encontrados, "
+              f"{cache.misses - misses} calculados.")
+    else:
+        scores = score(texts)
+    # Los puntajes exactos son sumas de múltiplos de 0.125: float32 los representa sin
+    # pérdida. Los promedios de 'mean-sense' no lo son y se conservan en float64.
+    dtype = np.float64 if scorer in APPROXIMATE_SCORERS else np.float32
+    scores = np.array(scores, dtype=dtype).reshape(-1, 2)
+    df[['positive_score', 'negative_score']] = pd.DataFrame(
+        scores[codes], columns=['positive_score', 'negative_score'], index=df.index
     )
     end_time = time.time()
     print(f"Tiempo total para calcular puntajes de sentimiento: {end_time - start_time:.2f} segundos")
+    # Guardar las firmas de glosas nuevas para las próximas ejecuciones
+    save_index()
     return df
 
-def apply_fuzzy_logic(df):
+def print_dedup_ratio(name, unique, total):
+    """
+    Muestra cuántos valores distintos hay entre las filas procesadas.
+
+    Args:
+        name (str): Qué se deduplicó (por ejemplo "Textos").
+        unique (int): Cantidad de valores distintos.
+        total (int): Cantidad de filas.
+    """
+    duplicated = 1 - unique / total if total else 0.0
+    print(f"{name} distintos: {unique} de {total} ({duplicated:.1%} duplicados).")
+
+def apply_fuzzy_logic(df, engine='batch', table_path=None, table_resolution=512,
+                      calibration=None, out_of_range='clip'):
     """
     Aplica la lógica difusa a los puntajes de sentimiento para obtener el
     puntaje de inferencia y la etiqueta de sentimiento correspondiente.
 
+    Motores de inferencia disponibles:
+    - 'batch': procesa todos los tweets con operaciones vectorizadas de NumPy
+      ('fuzzy_inference_batch'). El tiempo de ejecución de cada tweet es el
+      tiempo total dividido entre la cantidad de tweets.
+    - 'table': interpola cada puntaje en una tabla precalculada de la superficie
+      de inferencia ('build_inference_table'). Si 'table_path' apunta a una tabla
+      construida para los mismos límites se reutiliza; si no, se construye y se guarda.
+    - 'analytic': evalúa exactamente las funciones triangulares y calcula el
+      centroide en forma cerrada, sin discretizar los universos ('fuzzy_inference_analytic').
+    - 'scalar': procesa cada tweet por separado con 'fuzzy_inference' y 'defuzzify'.
+
     Args:
         df (pd.DataFrame): DataFrame con columnas 'positive_score' y 'negative_score'.
+        engine (str): Motor de inferencia a utilizar ('batch', 'analytic', 'table' o 'scalar').
+        table_path (str, opcional): Archivo '.npz' donde cargar o guardar la tabla de inferencia.
+        table_resolution (int): Puntos por eje de la tabla de inferencia.
+        calibration (dict, opcional): Calibración fija (ver 'fuzzy_logic.fit_calibration');
+                                      si se indica, las funciones de membresía se construyen
+                                      con sus límites en lugar de los del dataset.
+        out_of_range (str): Política para puntajes fuera de la calibración ('clip' o 'error').
 
     Returns:
         df (pd.DataFrame): DataFrame con nuevas columnas 'sentiment_score',
                            'sentiment_label' y 'execution_time'.
     """
+    from fuzzy_logic import create_membership_functions, calibrated_membership_functions
+
+    if calibration is not None:
+        mf = calibrated_membership_functions(calibration)
+        table = get_inference_table(mf, table_path, table_resolution) if engine == 'table' else None
+        return infer_calibrated(df, mf, calibration, engine, table, out_of_range)
+
     # Verificar que hay al menos dos clases de sentimiento en el dataset
     if df['target'].nunique() < 2:
         print("El dataset no tiene suficientes clases de sentimiento para aplicar la lógica difusa.")
         return df
     
     # Obtener los valores mínimos y máximos de los puntajes positivos y negativos
-    pos_min = df['positive_score'].min()
-    pos_max = df['positive_score'].max()
-    neg_min = df['negative_score'].min()
-    neg_max = df['negative_score'].max()
+    pos_min = float(df['positive_score'].min())
+    pos_max = float(df['positive_score'].max())
+    neg_min = float(df['negative_score'].min())
+    neg_max = float(df['negative_score'].max())
     
     # Crear las funciones de membresía difusas basadas en los puntajes
     mf = create_membership_functions(pos_min, pos_max, neg_min, neg_max)
-    
+
+    table = get_inference_table(mf, table_path, table_resolution) if engine == 'table' else None
+    return infer_sentiment(df, mf, engine, table)
+
+def infer_sentiment(df, mf, engine='batch', table=None):
+    """
+    Infiere el puntaje y la etiqueta de sentimiento de cada tweet con funciones
+    de membresía ya construidas (ver 'apply_fuzzy_logic' para los motores disponibles).
+
+    Los motores vectorizados infieren una sola vez cada par de puntajes distinto y
+    copian el resultado en las filas repetidas; 'scalar' sigue procesando cada fila
+    para medir el tiempo real de cada tweet.
+
+    Args:
+        df (pd.DataFrame): DataFrame con columnas 'positive_score' y 'negative_score'.
+        mf (dict): Diccionario de funciones de membresía creado por 'create_membership_functions'.
+        engine (str): Motor de inferencia a utilizar ('batch', 'analytic', 'table' o 'scalar').
+        table (dict, opcional): Tabla de inferencia precalculada, necesaria para el motor 'table'.
+
+    Returns:
+        df (pd.DataFrame): DataFrame con nuevas columnas 'sentiment_score',
+                           'sentiment_label' y 'execution_time'.
+    """
+    import numpy as np
+    import pandas as pd
+    from fuzzy_logic import (
+        fuzzy_inference,
+        fuzzy_inference_batch,
+        fuzzy_inference_analytic,
+        defuzzify,
+        get_sentiment_label,
+        lookup_inference_table,
+        SENTIMENT_LABELS
+    )
+
+    if engine in ('batch', 'analytic', 'table'):
+        start_time = time.perf_counter()
+        # Inferir una sola vez cada par de puntajes distinto
+        pairs, codes = np.unique(df[['positive_score', 'negative_score']].to_numpy(dtype=float),
+                                 axis=0, return_inverse=True)
+        codes = codes.reshape(-1)
+        if engine == 'batch':
+            # Inferencia y defuzzificación de todos los tweets a la vez
+            sentiment_scores = fuzzy_inference_batch(pairs[:, 0], pairs[:, 1], mf)
+        elif engine == 'analytic':
+            # Inferencia sobre universos continuos y centroide exacto
+            sentiment_scores = fuzzy_inference_analytic(pairs[:, 0], pairs[:, 1], mf)
+        else:
+            # Interpolación en la superficie de inferencia precalculada
+            sentiment_scores = lookup_inference_table(table, pairs[:, 0], pairs[:, 1])
+        sentiment_labels = np.array([get_sentiment_label(score) for score in sentiment_scores], dtype=object)
+        end_time = time.perf_counter()
+        print_dedup_ratio("Pares de puntajes", len(pairs), len(df))
+        df['sentiment_score'] = sentiment_scores[codes]
+        df['sentiment_label'] = pd.Categorical(sentiment_labels[codes], categories=SENTIMENT_LABELS)
+        # Tiempo de ejecución promedio por tweet
+        df['execution_time'] = (end_time - start_time) / len(df)
+        return df
+    elif engine != 'scalar':
+        raise ValueError(f"Motor de inferencia desconocido: {engine}")
+
     # Definir una función interna para procesar cada tweet
     def process_tweet(row):
         """
@@ -110,23 +262,86 @@ def apply_fuzzy_logic(df):
         Returns:
             pd.Series: Serie con 'sentiment_score', 'sentiment_label' y 'execution_time'.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         # Aplicar la inferencia difusa a los puntajes
         aggregated, x_op = fuzzy_inference(row['positive_score'], row['negative_score'], mf)
         # Defuzzificar el resultado para obtener el puntaje de sentimiento
         sentiment_score = defuzzify(aggregated, x_op)
         # Obtener la etiqueta de sentimiento basada en el puntaje
         sentiment_label = get_sentiment_label(sentiment_score)
-        end_time = time.time()
+        end_time = time.perf_counter()
         # Calcular el tiempo de ejecución para este tweet
         execution_time = end_time - start_time
         return pd.Series([sentiment_score, sentiment_label, execution_time])
     
     # Aplicar la función de procesamiento a cada fila del DataFrame
     df[['sentiment_score', 'sentiment_label', 'execution_time']] = df.apply(process_tweet, axis=1)
+    df['sentiment_label'] = pd.Categorical(df['sentiment_label'], categories=SENTIMENT_LABELS)
     
     return df
 
+def infer_calibrated(df, mf, calibration, engine='batch', table=None, out_of_range='clip'):
+    """
+    Infiere el sentimiento con una calibración fija, aplicando antes la política de
+    valores fuera de rango. Los puntajes guardados en el DataFrame no se modifican.
+
+    Args:
+        df (pd.DataFrame): DataFrame con columnas 'positive_score' y 'negative_score'.
+        mf (dict): Funciones de membresía de la calibración.
+        calibration (dict): Calibración (ver 'fuzzy_logic.fit_calibration').
+        engine (str): Motor de inferencia (ver 'apply_fuzzy_logic').
+        table (dict, opcional): Tabla de inferencia, necesaria para el motor 'table'.
+        out_of_range (str): 'clip' o 'error' (ver 'fuzzy_logic.apply_calibration_range').
+
+    Returns:
+        df (pd.DataFrame): DataFrame con nuevas columnas 'sentiment_score',
+                           'sentiment_label' y 'execution_time'.
+    """
+    from fuzzy_logic import apply_calibration_range
+
+    pos_scores, neg_scores, outside = apply_calibration_range(
+        df['positive_score'], df['negative_score'], calibration, out_of_range)
+    if outside:
+        print(f"{outside} tweets con puntajes fuera del rango calibrado se llevaron al límite más cercano.")
+    inferred = infer_sentiment(df.assign(positive_score=pos_scores, negative_score=neg_scores),
+                               mf, engine, table)
+    for column in ('sentiment_score', 'sentiment_label', 'execution_time'):
+        df[column] = inferred[column]
+    return df
+
+def get_inference_table(mf, table_path=None, resolution=512):
+    """
+    Obtiene la tabla de inferencia para las funciones de membresía dadas,
+    reutilizando la guardada en 'table_path' si corresponde a los mismos límites.
+
+    Args:
+        mf (dict): Diccionario de funciones de membresía.
+        table_path (str, opcional): Archivo '.npz' donde cargar o guardar la tabla.
+        resolution (int): Puntos por eje si es necesario construir la tabla.
+
+    Returns:
+        dict: Tabla de inferencia precalculada.
+    """
+    from fuzzy_logic import build_inference_table, table_matches, save_inference_table, load_inference_table
+
+    if table_path and os.path.exists(table_path):
+        table = load_inference_table(table_path)
+        # Las tablas sin 'error_samples' solo medían el error en los centros de las celdas
+        if table_matches(table, mf) and len(table['pos_grid']) == resolution and 'error_samples' in table:
+            print(f"Tabla de inferencia cargada desde '{table_path}' "
+                  f"(error máximo estimado: {table['max_error']:.6f}).")
+            return table
+
+    start_time = time.perf_counter()
+    table = build_inference_table(mf, resolution)
+    end_time = time.perf_counter()
+    print(f"Tabla de inferencia de {resolution}x{resolution} construida en {end_time - start_time:.2f} segundos "
+          f"(error máximo estimado: {table['max_error']:.6f} en {table['error_samples']} puntos).")
+    if table_path:
+        save_inference_table(table, table_path)
+        print(f"Tabla de inferencia guardada en '{table_path}'.")
+    return table
+
 def perform_benchmarks(df):
     """
     Calcula y muestra los benchmarks de rendimiento, incluyendo:
@@ -137,25 +352,367 @@ def perform_benchmarks(df):
     Args:
         df (pd.DataFrame): DataFrame con columnas 'sentiment_label' y 'execution_time'.
     """
+    from benchmark import calculate_benchmarks
     calculate_benchmarks(df)
 
-def save_results(df):
+def save_results(df, output_path='resultado_sentimiento.csv', output_format=None):
     """
-    Guarda los resultados del análisis de sentimiento en un archivo CSV.
+    Guarda los resultados del análisis de sentimiento en un archivo CSV, Parquet o Arrow IPC
+    (ver 'result_writer.ResultWriter').
 
     Args:
         df (pd.DataFrame): DataFrame con los resultados a guardar.
+        output_path (str): Ruta del archivo de salida.
+        output_format (str, opcional): 'csv', 'parquet' o 'arrow'; por defecto según la extensión.
+    """
+    from result_writer import ResultWriter
+
+    with ResultWriter(output_path, output_format) as writer:
+        writer.write(df)
+    print(f"Resultados guardados en '{output_path}'.")
+
+def open_score_cache(path, max_entries, scorer='nltk'):
     """
-    # Seleccionar y renombrar las columnas para el archivo de salida
-    df_output = df[['text', 'target', 'positive_score', 'negative_score',
-                    'sentiment_score', 'sentiment_label', 'execution_time']]
-    df_output.columns = ['oracion_original', 'label_original', 'puntaje_positivo',
-                         'puntaje_negativo', 'resultado_inferencia', 'sentimiento', 'tiempo_ejecucion']
-    # Guardar el DataFrame en un archivo CSV sin índice
-    df_output.to_csv('resultado_sentimiento.csv', index=False)
-    print("Resultados guardados en 'resultado_sentimiento.csv'.")
+    Abre el caché persistente de puntajes con la versión actual del puntuador y de
+    los datos de NLTK; si cambió, los puntajes guardados se descartan.
 
-def main():
+    Args:
+        path (str): Archivo SQLite del caché.
+        max_entries (int): Cantidad máxima de textos guardados.
+        scorer (str): Motor de puntuación; los modos aproximados usan otra versión.
+
+    Returns:
+        score_cache.ScoreCache: Caché abierto; debe cerrarse al terminar.
+    """
+    from sentiment_lexicon import scorer_version
+    from score_cache import ScoreCache
+
+    cache = ScoreCache(path, scorer_version(scorer), max_entries)
+    print(f"Caché de puntajes '{path}': {len(cache)} textos guardados.")
+    return cache
+
+def run_streaming(args, cache=None):
+    """
+    Ejecuta el análisis leyendo el dataset por bloques de 'args.chunk_size' filas,
+    de modo que la memoria usada no depende del tamaño de la entrada.
+
+    Primera pasada: cada bloque se preprocesa y puntúa, se acumulan los mínimos y
+    máximos globales de los puntajes y el bloque se guarda en un archivo temporal.
+    Segunda pasada: con las funciones de membresía construidas a partir de los
+    límites globales, cada bloque se infiere y se agrega al CSV de salida. Los
+    resultados son los mismos que los de la ejecución sobre el dataset completo.
+
+    Args:
+        args (argparse.Namespace): Opciones de línea de comandos (ver 'parse_args').
+        cache (score_cache.ScoreCache, opcional): Caché persistente de puntajes.
+    """
+    import pandas as pd
+    from sentiment_lexicon import create_pool
+    from fuzzy_logic import create_membership_functions
+    from benchmark import summarize_benchmarks, merge_benchmark_summaries, print_benchmarks
+    from result_writer import ResultWriter
+
+    workers = args.workers or os.cpu_count()
+    pool = create_pool(workers, args.lexicon) if workers > 1 else None
+    pos_min = neg_min = float('inf')
+    pos_max = neg_max = float('-inf')
+    sentiment_values = set()
+    targets = set()
+    total_rows = 0
+
+    with tempfile.TemporaryDirectory(prefix='sentimiento_') as tmp_dir:
+        chunk_paths = []
+        try:
+            # Primera pasada: preprocesar, puntuar y acumular los límites globales
+            for chunk in pd.read_csv(args.input, chunksize=args.chunk_size):
+                sentiment_values.update(chunk['sentiment'].dropna().unique().tolist())
+                df = prepare_dataset(chunk)
+                df = calculate_scores(df, workers=workers, lexicon_path=args.lexicon, pool=pool, cache=cache,
+                                      scorer=args.scorer)
+                if df.empty:
+                    continue
+                pos_min = min(pos_min, float(df['positive_score'].min()))
+                pos_max = max(pos_max, float(df['positive_score'].max()))
+                neg_min = min(neg_min, float(df['negative_score'].min()))
+                neg_max = max(neg_max, float(df['negative_score'].max()))
+                targets.update(df['target'].dropna().unique())
+                total_rows += len(df)
+
+                chunk_path = os.path.join(tmp_dir, f"chunk_{len(chunk_paths):06d}.pkl")
+                df.to_pickle(chunk_path)
+                chunk_paths.append(chunk_path)
+                print(f"Bloque {len(chunk_paths)} puntuado ({total_rows} tweets en total).")
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        print("Valores únicos en 'sentiment':", sorted(sentiment_values))
+        if total_rows == 0:
+            print("El dataframe está vacío. Verifica el archivo CSV y su formato.")
+            return
+        if len(targets) < 2:
+            print("El dataset no tiene suficientes clases de sentimiento para aplicar la lógica difusa.")
+            return
+
+        # Segunda pasada: inferir con los límites globales y escribir bloque a bloque
+        mf = create_membership_functions(pos_min, pos_max, neg_min, neg_max)
+        table = (get_inference_table(mf, args.table_path, args.table_resolution)
+                 if args.fuzzy_engine == 'table' else None)
+        summary = None
+        with ResultWriter(args.output, args.output_format) as writer:
+            for chunk_path in chunk_paths:
+                df = infer_sentiment(pd.read_pickle(chunk_path), mf, args.fuzzy_engine, table)
+                # Cada bloque se agrega al archivo (un grupo de filas en Parquet) apenas se infiere
+                writer.write(df)
+                summary = merge_benchmark_summaries(summary, summarize_benchmarks(df))
+                os.remove(chunk_path)
+        print(f"Resultados guardados en '{args.output}'.")
+
+    print_benchmarks(summary)
+
+def run_sharded(args, calibration=None):
+    """
+    Ejecuta el análisis en modo distribuido por fragmentos (ver 'sharding'), con
+    'args.nodes' procesos locales en lugar de nodos:
+    1. Divide el dataset en fragmentos de 'args.shard_size' filas y escribe el manifiesto.
+    2. Cada nodo preprocesa y puntúa fragmentos, y guarda sus puntajes y sus límites.
+    3. Los límites de todos los fragmentos se reducen a la calibración global.
+    4. Cada nodo infiere fragmentos con las funciones de membresía globales.
+    5. Los resultados se unen en el orden del dataset original.
+    Los resultados son los mismos que los de la ejecución sobre el dataset completo.
+    Con una calibración fija se omite la reducción.
+
+    Args:
+        args (argparse.Namespace): Opciones de línea de comandos (ver 'parse_args').
+        calibration (dict, opcional): Calibración fija (ver 'fuzzy_logic.fit_calibration').
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    import sharding
+    from sentiment_lexicon import init_worker, cache_sizes
+    from fuzzy_logic import calibrated_membership_functions
+    from benchmark import print_benchmarks
+
+    # Procesos de trabajo de cada nodo para puntuar (por defecto se reparten los núcleos)
+    workers = args.workers or max(1, os.cpu_count() // args.nodes)
+    with tempfile.TemporaryDirectory(prefix='fragmentos_') as tmp_dir:
+        shard_dir = args.shard_dir or tmp_dir
+        manifest = sharding.split_input(args.input, shard_dir, args.shard_size)
+        if not manifest['shards']:
+            print("El dataframe está vacío. Verifica el archivo CSV y su formato.")
+            return
+        shard_ids = [shard['id'] for shard in manifest['shards']]
+        count = len(shard_ids)
+
+        # 'spawn' inicia cada nodo como un proceso nuevo, sin estado heredado del coordinador
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(args.nodes, mp_context=context, initializer=init_worker,
+                                 initargs=(args.lexicon, profiling.enabled, dict(cache_sizes))) as nodes:
+            # Mapeo: preprocesar y puntuar cada fragmento
+            for stats in nodes.map(sharding.score_shard, [shard_dir] * count, shard_ids,
+                                   [args.scorer] * count, [args.lexicon] * count, [workers] * count):
+                if stats['profile'] is not None:
+                    profiling.merge(stats['profile'])
+                print(f"Fragmento {stats['shard']} puntuado ({stats['rows']} tweets).")
+
+            # Reducción: límites globales de los puntajes
+            if calibration is None:
+                global_calibration = sharding.reduce_calibration(shard_dir)
+                print("Valores únicos en 'sentiment':", global_calibration['sentiment_values'])
+                if len(global_calibration['targets']) < 2:
+                    print("El dataset no tiene suficientes clases de sentimiento para aplicar la lógica difusa.")
+                    return
+                mf = calibrated_membership_functions(global_calibration)
+            else:
+                mf = calibrated_membership_functions(calibration)
+
+            # La tabla de inferencia se construye una sola vez y los nodos la cargan
+            table_path = args.table_path
+            if args.fuzzy_engine == 'table':
+                table_path = table_path or os.path.join(shard_dir, 'inference_table.npz')
+                get_inference_table(mf, table_path, args.table_resolution)
+
+            # Mapeo: inferir cada fragmento
+            for shard_id, rows in zip(shard_ids, nodes.map(
+                    sharding.infer_shard, [shard_dir] * count, shard_ids, [args.fuzzy_engine] * count,
+                    [table_path] * count, [args.table_resolution] * count, [calibration] * count,
+                    [args.out_of_range] * count)):
+                print(f"Fragmento {shard_id} inferido ({rows} tweets).")
+
+        summary = sharding.merge_outputs(shard_dir, args.output, args.output_format)
+    print_benchmarks(summary)
+
+def load_checked_calibration(path, scorer='nltk'):
+    """
+    Carga una calibración y advierte si fue ajustada con otra versión del puntuador.
+
+    Args:
+        path (str): Archivo JSON de la calibración.
+        scorer (str): Motor de puntuación en uso.
+
+    Returns:
+        dict: Calibración.
+    """
+    from fuzzy_logic import load_calibration
+    from sentiment_lexicon import scorer_version
+
+    calibration = load_calibration(path)
+    if calibration.get('scorer_version') != scorer_version(scorer):
+        print(f"Advertencia: la calibración '{path}' se ajustó con otra versión del puntuador o de NLTK.")
+    return calibration
+
+def run_calibration(args, cache=None):
+    """
+    Ajusta la calibración de las funciones de membresía: lee el dataset por bloques,
+    calcula los puntajes y amplía los límites con cada bloque, y guarda el resultado
+    en 'args.calibration' para inferir después sin recorrer todo el dataset.
+
+    Args:
+        args (argparse.Namespace): Opciones de línea de comandos (ver 'parse_args').
+        cache (score_cache.ScoreCache, opcional): Caché persistente de puntajes.
+    """
+    import pandas as pd
+    from sentiment_lexicon import create_pool, scorer_version
+    from fuzzy_logic import fit_calibration, save_calibration
+
+    workers = args.workers or os.cpu_count()
+    pool = create_pool(workers, args.lexicon) if workers > 1 else None
+    calibration = None
+    try:
+        for chunk in pd.read_csv(args.input, chunksize=args.chunk_size):
+            df = calculate_scores(prepare_dataset(chunk), workers=workers, lexicon_path=args.lexicon,
+                                  pool=pool, cache=cache, scorer=args.scorer)
+            calibration = fit_calibration(df['positive_score'], df['negative_score'], calibration)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    if calibration is None or calibration['rows'] == 0:
+        print("El dataframe está vacío. Verifica el archivo CSV y su formato.")
+        return
+    calibration['scorer_version'] = scorer_version(args.scorer)
+    save_calibration(calibration, args.calibration)
+    print(f"Calibración guardada en '{args.calibration}' ({calibration['rows']} tweets): "
+          f"positivo {calibration['pos_min']}..{calibration['pos_max']}, "
+          f"negativo {calibration['neg_min']}..{calibration['neg_max']}.")
+
+def run_streaming_calibrated(args, calibration, cache=None):
+    """
+    Ejecuta el análisis en una sola pasada con una calibración fija: cada bloque se
+    preprocesa, puntúa, infiere y escribe apenas se lee, sin archivos temporales.
+
+    Args:
+        args (argparse.Namespace): Opciones de línea de comandos (ver 'parse_args').
+        calibration (dict): Calibración (ver 'fuzzy_logic.fit_calibration').
+        cache (score_cache.ScoreCache, opcional): Caché persistente de puntajes.
+    """
+    import pandas as pd
+    from sentiment_lexicon import create_pool
+    from fuzzy_logic import calibrated_membership_functions
+    from benchmark import summarize_benchmarks, merge_benchmark_summaries, print_benchmarks
+    from result_writer import ResultWriter
+
+    workers = args.workers or os.cpu_count()
+    mf = calibrated_membership_functions(calibration)
+    table = (get_inference_table(mf, args.table_path, args.table_resolution)
+             if args.fuzzy_engine == 'table' else None)
+    pool = create_pool(workers, args.lexicon) if workers > 1 else None
+    summary = None
+    try:
+        with ResultWriter(args.output, args.output_format) as writer:
+            for chunk in pd.read_csv(args.input, chunksize=args.chunk_size):
+                df = calculate_scores(prepare_dataset(chunk), workers=workers, lexicon_path=args.lexicon,
+                                      pool=pool, cache=cache, scorer=args.scorer)
+                if df.empty:
+                    continue
+                df = infer_calibrated(df, mf, calibration, args.fuzzy_engine, table, args.out_of_range)
+                writer.write(df)
+                summary = merge_benchmark_summaries(summary, summarize_benchmarks(df))
+                print(f"Bloque inferido y guardado ({writer.rows} tweets en total).")
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    if summary is None:
+        print("El dataframe está vacío. Verifica el archivo CSV y su formato.")
+        return
+    print(f"Resultados guardados en '{args.output}'.")
+    print_benchmarks(summary)
+
+def parse_args(argv=None):
+    """
+    Interpreta los argumentos de línea de comandos del programa.
+
+    Args:
+        argv (list, opcional): Lista de argumentos; por defecto se usan los de 'sys.argv'.
+
+    Returns:
+        argparse.Namespace: Opciones seleccionadas.
+    """
+    parser = argparse.ArgumentParser(description="Análisis de sentimiento con reglas difusas.")
+    parser.add_argument('command', nargs='?', choices=['run', 'setup', 'calibrate'], default='run',
+                        help="'run' ejecuta el análisis (por defecto); 'setup' descarga los recursos de NLTK; "
+                             "'calibrate' ajusta los límites de las funciones de membresía y los guarda en "
+                             "--calibration.")
+    parser.add_argument('--input', default='sentiment140.csv',
+                        help="Dataset CSV de entrada (por defecto: sentiment140.csv).")
+    parser.add_argument('--output', default='resultado_sentimiento.csv',
+                        help="Archivo CSV de resultados (por defecto: resultado_sentimiento.csv).")
+    parser.add_argument('--output-format', choices=['csv', 'parquet', 'arrow'], default=None,
+                        help="Formato del archivo de resultados; por defecto según la extensión de --output "
+                             "(.parquet, .arrow o CSV). Parquet y Arrow necesitan pyarrow.")
+    parser.add_argument('--stream', action='store_true',
+                        help="Procesa el dataset por bloques con memoria acotada.")
+    parser.add_argument('--chunk-size', type=int, default=100000,
+                        help="Filas por bloque en el modo --stream (por defecto: 100000).")
+    parser.add_argument('--nodes', type=int, default=0,
+                        help="Ejecuta el análisis en modo distribuido por fragmentos, con N procesos locales "
+                             "como nodos (ver 'sharding.py'; por defecto desactivado).")
+    parser.add_argument('--shard-size', type=int, default=100000,
+                        help="Filas por fragmento con --nodes (por defecto: 100000).")
+    parser.add_argument('--shard-dir', default=None,
+                        help="Directorio donde conservar los fragmentos, el manifiesto y los resultados "
+                             "parciales de --nodes (por defecto, uno temporal).")
+    parser.add_argument('--calibration', default=None,
+                        help="Archivo JSON de calibración: 'calibrate' lo escribe y 'run' infiere con sus límites "
+                             "fijos, bloque a bloque con --stream y en una sola pasada.")
+    parser.add_argument('--out-of-range', choices=['clip', 'error'], default='clip',
+                        help="Con --calibration, qué hacer con puntajes fuera del rango calibrado: llevarlos al "
+                             "límite más cercano (por defecto) o detener el análisis.")
+    parser.add_argument('--fuzzy-engine', choices=['batch', 'analytic', 'table', 'scalar'], default='batch',
+                        help="Motor de inferencia difusa (por defecto: batch).")
+    parser.add_argument('--table-path', default=None,
+                        help="Archivo .npz donde cargar o guardar la tabla de inferencia (motor 'table').")
+    parser.add_argument('--table-resolution', type=int, default=512,
+                        help="Puntos por eje de la tabla de inferencia (por defecto: 512).")
+    parser.add_argument('--lexicon', default=None,
+                        help="Léxico compilado con 'lexicon_artifact.py' para puntuar sin cargar los corpus de NLTK.")
+    parser.add_argument('--scorer', choices=['nltk', 'array', 'first-sense', 'mean-sense'], default='nltk',
+                        help="Motor de puntuación: 'nltk' recorre cada token; 'array' codifica el corpus con "
+                             "enteros y resuelve una sola vez cada palabra y contexto distintos (mismos puntajes); "
+                             "'first-sense' y 'mean-sense' aproximan sin Lesk con el primer sentido o el promedio "
+                             "de todos los sentidos (más rápidos, resultados distintos).")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Procesos para calcular los puntajes (0 = todos los núcleos; por defecto: 1).")
+    parser.add_argument('--cache', nargs='?', const='score_cache.sqlite', default=None,
+                        help="Guarda los puntajes en un caché persistente y en las siguientes ejecuciones solo "
+                             "calcula los textos nuevos (por defecto: score_cache.sqlite).")
+    parser.add_argument('--cache-max-entries', type=int, default=5_000_000,
+                        help="Textos máximos en el caché; se eliminan los menos usados (por defecto: 5000000).")
+    parser.add_argument('--memo-sizes', type=int, nargs=2, metavar=('LESK', 'SWN'), default=None,
+                        help="Entradas máximas de los cachés de memoización de resultados de Lesk y "
+                             "puntajes de SentiWordNet (0 desactiva; por defecto: 262144 65536).")
+    parser.add_argument('--profile', action='store_true',
+                        help="Mide llamadas y tiempos de las funciones internas y muestra un reporte al terminar "
+                             "(equivale a SENTIMENT_PROFILE=1).")
+    parser.add_argument('--compare-engines', action='store_true',
+                        help="Compara el centroide discretizado con el analítico sobre los puntajes calculados.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """
     Función principal que coordina el flujo del análisis de sentimiento:
     - Carga y preprocesa el dataset.
@@ -163,21 +720,83 @@ def main():
     - Aplica la lógica difusa para inferir el sentimiento.
     - Realiza benchmarks de rendimiento.
     - Guarda los resultados en un archivo CSV.
+
+    Con el comando 'setup' solo descarga los recursos de NLTK; la ejecución normal
+    verifica que estén instalados sin conectarse a internet y, si faltan, termina
+    con código de salida 1.
+
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos (ver 'parse_args').
     """
-    # Cargar y preprocesar el dataset
-    df = load_and_preprocess()
-    # Verificar que el DataFrame no está vacío
-    if df.empty:
-        print("El dataframe está vacío. Verifica el archivo CSV y su formato.")
+    from resources import check_resources, download_resources
+
+    args = parse_args(argv)
+    if args.command == 'setup':
+        if not download_resources():
+            sys.exit(1)
         return
-    # Calcular los puntajes de sentimiento
-    df = calculate_scores(df)
-    # Aplicar la lógica difusa
-    df = apply_fuzzy_logic(df)
-    # Realizar benchmarks
-    perform_benchmarks(df)
-    # Guardar los resultados en un archivo CSV
-    save_results(df)
+    # Verificar los recursos de NLTK sin conectarse a internet; sin ellos no se puntúa
+    # nada y la ejecución debe terminar con error
+    if not check_resources():
+        sys.exit(1)
+    # Instrumentación opcional (--profile o SENTIMENT_PROFILE=1), sin costo si está desactivada
+    if args.profile or profiling.env_enabled():
+        profiling.enable()
+    cache = None
+    try:
+        if args.memo_sizes:
+            from sentiment_lexicon import configure_caches
+            configure_caches(*args.memo_sizes)
+        if args.lexicon:
+            from sentiment_lexicon import load_compiled_lexicon
+            load_compiled_lexicon(args.lexicon)
+        if args.cache and args.nodes and args.command == 'run':
+            # Varios nodos no pueden escribir a la vez en el mismo archivo SQLite
+            print("El caché de puntajes no se usa en modo distribuido (--nodes).")
+        elif args.cache:
+            cache = open_score_cache(args.cache, args.cache_max_entries, args.scorer)
+        if args.command == 'calibrate':
+            if not args.calibration:
+                print("Indica el archivo de calibración a escribir con --calibration.")
+                return
+            run_calibration(args, cache)
+            return
+        calibration = load_checked_calibration(args.calibration, args.scorer) if args.calibration else None
+        if args.nodes:
+            run_sharded(args, calibration)
+            return
+        if args.stream and calibration is not None:
+            run_streaming_calibrated(args, calibration, cache)
+            return
+        if args.stream:
+            run_streaming(args, cache)
+            return
+        # Cargar y preprocesar el dataset
+        df = load_and_preprocess(args.input)
+        # Verificar que el DataFrame no está vacío
+        if df.empty:
+            print("El dataframe está vacío. Verifica el archivo CSV y su formato.")
+            return
+        # Calcular los puntajes de sentimiento
+        workers = args.workers or os.cpu_count()
+        df = calculate_scores(df, workers=workers, lexicon_path=args.lexicon, cache=cache,
+                              scorer=args.scorer)
+        # Aplicar la lógica difusa
+        df = apply_fuzzy_logic(df, engine=args.fuzzy_engine, table_path=args.table_path,
+                               table_resolution=args.table_resolution, calibration=calibration,
+                               out_of_range=args.out_of_range)
+        # Realizar benchmarks
+        perform_benchmarks(df)
+        if args.compare_engines:
+            from benchmark import compare_fuzzy_engines
+            compare_fuzzy_engines(df)
+        # Guardar los resultados en un archivo CSV
+        save_results(df, args.output, args.output_format)
+    finally:
+        if cache is not None:
+            cache.close()
+        # Reporte de la instrumentación (solo si está activada)
+        profiling.print_report()
 
 # Ejecutar la función principal si el script es ejecutado directamente
 if __name__ == '__main__':
@@ -44,3 +44,100 @@ def preprocess_text(text):
 
     # Eliminar espacios en blanco adicionales al inicio y al final
     return text.strip()
+
+# Patrones precompilados para el preprocesamiento en bloque
+URL_MENTION_PATTERN = re.compile(r'http\S+|www\.\S+|@\w+')
+CONTRACTION_PATTERN = re.compile(r"can't|won't|n't")
+NON_LETTER_PATTERN = re.compile(r'[^A-Za-z\s]+')
+
+# Formas completas de las contracciones, en una sola pasada
+CONTRACTIONS = {
+    "can't": "cannot",
+    "won't": "will not",
+    "n't": " not"
+}
+
+# Palabras que el tokenizador Treebank de NLTK separa en dos aunque no tengan
+# apóstrofo (contracciones de MacIntyre: "cannot" -> "can" + "not", etc.)
+SPLIT_WORDS = {
+    'cannot': ['can', 'not'],
+    'gimme': ['gim', 'me'],
+    'gonna': ['gon', 'na'],
+    'gotta': ['got', 'ta'],
+    'lemme': ['lem', 'me'],
+    'wanna': ['wan', 'na'],
+}
+
+def _expand_contraction(match):
+    """
+    Devuelve la forma completa de la contracción encontrada por 'CONTRACTION_PATTERN'.
+    """
+    return CONTRACTIONS[match.group()]
+
+def clean_text(text):
+    """
+    Versión con patrones precompilados de 'preprocess_text', con idéntico resultado.
+
+    Las tres sustituciones de contracciones se hacen en una sola pasada: ninguna
+    forma completa contiene apóstrofos, por lo que no pueden crear nuevas
+    contracciones, y en cada posición la alternativa más larga ("can't", "won't")
+    se prueba antes que "n't", igual que el orden de los 'str.replace' originales.
+    La eliminación de '#' queda incluida en la de caracteres que no son letras.
+
+    Args:
+        text (str): Texto original que se desea preprocesar.
+
+    Returns:
+        str: Texto preprocesado y limpio.
+    """
+    text = URL_MENTION_PATTERN.sub('', text)
+    if "'" in text:
+        text = CONTRACTION_PATTERN.sub(_expand_contraction, text)
+    return NON_LETTER_PATTERN.sub('', text).lower().strip()
+
+def tokenize_clean_text(text):
+    """
+    Tokeniza un texto ya preprocesado con el mismo resultado que 'nltk.word_tokenize'.
+
+    Tras 'preprocess_text' el texto solo contiene letras ASCII en minúsculas y
+    espacios en blanco. Sobre ese alfabeto Punkt no encuentra fines de oración
+    (requieren '.', '?' o '!') y, de las reglas del tokenizador Treebank, solo
+    tienen efecto la normalización de espacios y las contracciones sin apóstrofo
+    de 'SPLIT_WORDS'; el resto necesita comillas, signos de puntuación o dígitos.
+
+    Args:
+        text (str): Texto preprocesado.
+
+    Returns:
+        list: Lista de tokens.
+    """
+    tokens = text.split()
+    if not SPLIT_WORDS.keys().isdisjoint(tokens):
+        tokens = [part for token in tokens for part in SPLIT_WORDS.get(token, (token,))]
+    return tokens
+
+def preprocess_texts(texts):
+    """
+    Preprocesa en bloque una lista o Serie de textos (ver 'clean_text').
+
+    Args:
+        texts (iterable): Textos originales.
+
+    Returns:
+        list: Textos preprocesados, en el mismo orden.
+    """
+    return [clean_text(text) for text in texts]
+
+def preprocess_and_tokenize(texts):
+    """
+    Preprocesa y tokeniza en bloque una lista o Serie de textos. Equivale a aplicar
+    'preprocess_text' y luego 'nltk.word_tokenize' a cada texto.
+
+    Args:
+        texts (iterable): Textos originales.
+
+    Returns:
+        tuple: (textos preprocesados, listas de tokens), en el mismo orden que 'texts'.
+    """
+    clean_texts = preprocess_texts(texts)
+    return clean_texts, [tokenize_clean_text(text) for text in clean_texts]
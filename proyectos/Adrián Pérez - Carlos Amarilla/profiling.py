@@ -0,0 +1,229 @@
+# profiling.py
+
+import functools
+import importlib
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+
+# Variable de entorno que activa la instrumentación (por ejemplo SENTIMENT_PROFILE=1)
+PROFILE_ENV_VAR = 'SENTIMENT_PROFILE'
+
+def _count_rows(result):
+    """Cantidad de filas procesadas por una función vectorizada."""
+    return [('filas', len(result))]
+
+def _count_candidates(result):
+    """Cantidad de synsets candidatos evaluados por Lesk."""
+    return [('candidatos', len(result))]
+
+def _count_missing(result):
+    """Llamadas que no devolvieron resultado (palabra sin synsets o synset sin puntajes)."""
+    return [('sin resultado', 1)] if result is None else []
+
+def _count_compiled_lesk(result):
+    """Palabras resueltas por el léxico compilado y palabras que vuelven a NLTK."""
+    if result is None:
+        return [('no compilada', 1)]
+    return [('sin synsets', 1)] if result < 0 else []
+
+# Funciones instrumentadas: (módulo, atributo, función que cuenta sobre el resultado).
+# Los atributos con punto se instrumentan sobre la clase u objeto del módulo.
+HOOKS = (
+    ('sentiment_lexicon', 'word_tokenize', None),
+    ('sentiment_lexicon', 'tokenize_clean_text', None),
+    ('nltk.tag', 'PerceptronTagger.tag', None),
+    ('sentiment_lexicon', 'disambiguate', _count_missing),
+    ('sentiment_lexicon', 'senti_scores', _count_missing),
+    ('sentiment_lexicon', 'score_tagged_tokens', None),
+    ('fast_lesk', 'LeskIndex.candidates', _count_candidates),
+    ('fast_lesk', 'LeskIndex.lesk_name', None),
+    ('array_scoring', 'encode_corpus', None),
+    ('array_scoring', 'context_signatures', _count_rows),
+    ('array_scoring', 'resolve_senses', _count_rows),
+    ('lexicon_artifact', 'CompiledLexicon.lesk', _count_compiled_lesk),
+    ('lexicon_artifact', 'CompiledLexicon.senti_scores', _count_missing),
+    ('fuzzy_logic', 'fuzzy_inference', None),
+    ('fuzzy_logic', 'defuzzify', None),
+    ('fuzzy_logic', 'fuzzy_inference_batch', _count_rows),
+    ('fuzzy_logic', 'aggregate_rules_batch', _count_rows),
+    ('fuzzy_logic', 'defuzzify_batch', _count_rows),
+    ('fuzzy_logic', 'fuzzy_inference_analytic', _count_rows),
+    ('fuzzy_logic', 'lookup_inference_table', _count_rows),
+    ('fuzzy_logic', 'build_inference_table', None),
+)
+
+# Estado de la instrumentación
+enabled = False
+calls = Counter()
+seconds = defaultdict(float)
+counters = Counter()
+_cache_baseline = Counter()
+_originals = []
+
+def env_enabled():
+    """
+    Indica si la variable de entorno 'SENTIMENT_PROFILE' pide activar la instrumentación.
+
+    Returns:
+        bool: True si la variable está definida con un valor distinto de '' y '0'.
+    """
+    return os.environ.get(PROFILE_ENV_VAR, '') not in ('', '0')
+
+def _instrument(label, func, observe):
+    """
+    Envuelve una función para contar sus llamadas y acumular su tiempo.
+
+    Args:
+        label (str): Nombre con que aparece en el reporte.
+        func (callable): Función original.
+        observe (callable, opcional): Devuelve pares (contador, cantidad) a partir del resultado.
+
+    Returns:
+        callable: Función instrumentada.
+    """
+    perf_counter = time.perf_counter
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            counters[f"{label}: excepciones"] += 1
+            raise
+        finally:
+            seconds[label] += perf_counter() - start
+            calls[label] += 1
+        if observe is not None:
+            for name, amount in observe(result):
+                counters[f"{label}: {name}"] += amount
+        return result
+    return wrapper
+
+def enable():
+    """
+    Activa la instrumentación reemplazando las funciones de 'HOOKS' por versiones
+    que cuentan llamadas y tiempo. Mientras está desactivada no se ejecuta ningún
+    código adicional, por lo que su costo es nulo.
+    """
+    global enabled
+    if enabled:
+        return
+    for module_name, path, observe in HOOKS:
+        owner = importlib.import_module(module_name)
+        *parents, attribute = path.split('.')
+        for parent in parents:
+            owner = getattr(owner, parent)
+        # Buscar en el diccionario de la clase para no desligar los métodos
+        original = vars(owner)[attribute] if isinstance(owner, type) else getattr(owner, attribute)
+        _originals.append((owner, attribute, original))
+        setattr(owner, attribute, _instrument(path, original, observe))
+    enabled = True
+
+def disable():
+    """
+    Desactiva la instrumentación y restaura las funciones originales.
+    """
+    global enabled
+    while _originals:
+        owner, attribute, original = _originals.pop()
+        if isinstance(owner, type) or not hasattr(type(owner), attribute):
+            setattr(owner, attribute, original)
+        else:
+            # Método ligado guardado en la instancia: volver a usar el de la clase
+            delattr(owner, attribute)
+    enabled = False
+
+def _cache_counters():
+    """
+    Aciertos y fallos acumulados de los cachés del proceso: el índice de Lesk
+    compartido y la memoización de 'sentiment_lexicon', si ya fueron creados.
+    """
+    totals = Counter()
+    index = getattr(sys.modules.get('fast_lesk'), '_default_index', None)
+    if index is not None:
+        totals['LeskIndex: aciertos'] = index.hits
+        totals['LeskIndex: fallos'] = index.misses
+    sentiment_lexicon = sys.modules.get('sentiment_lexicon')
+    if sentiment_lexicon is not None:
+        for name, stats in sentiment_lexicon.cache_stats().items():
+            totals[f"memoización {name}: aciertos"] = stats['hits']
+            totals[f"memoización {name}: fallos"] = stats['misses']
+    return totals
+
+def reset():
+    """
+    Reinicia los contadores y tiempos acumulados. Los contadores de los cachés se
+    miden desde este momento.
+    """
+    global _cache_baseline
+    calls.clear()
+    seconds.clear()
+    counters.clear()
+    _cache_baseline = _cache_counters()
+
+def snapshot():
+    """
+    Copia los contadores y tiempos acumulados, para enviarlos entre procesos.
+
+    Returns:
+        dict: Llamadas, segundos y contadores por nombre.
+    """
+    all_counters = Counter(counters)
+    for name, total in _cache_counters().items():
+        all_counters[name] += total - _cache_baseline[name]
+    return {
+        'calls': dict(calls),
+        'seconds': dict(seconds),
+        'counters': dict(all_counters),
+    }
+
+def merge(other):
+    """
+    Suma a los acumulados del proceso actual los de un 'snapshot' de otro proceso.
+
+    Args:
+        other (dict): Resultado de 'snapshot' en otro proceso.
+    """
+    calls.update(other['calls'])
+    for label, value in other['seconds'].items():
+        seconds[label] += value
+    counters.update(other['counters'])
+
+def format_report(data=None):
+    """
+    Arma el reporte de la instrumentación.
+
+    Args:
+        data (dict, opcional): Resultado de 'snapshot'; por defecto el estado actual.
+
+    Returns:
+        str: Tabla con llamadas, tiempo total y por llamada de cada función, y los contadores.
+    """
+    data = data or snapshot()
+    lines = ["Perfil del análisis (tiempos inclusivos):",
+             f"  {'función':<36} {'llamadas':>10} {'total (s)':>10} {'por llamada (us)':>17}"]
+    for label, total in sorted(data['seconds'].items(), key=lambda item: -item[1]):
+        count = data['calls'].get(label, 0)
+        per_call = total / count * 1e6 if count else 0.0
+        lines.append(f"  {label:<36} {count:>10} {total:>10.3f} {per_call:>17.2f}")
+    if data['counters']:
+        lines.append("  Contadores:")
+        for name, value in sorted(data['counters'].items()):
+            lines.append(f"    {name:<48} {value:>10}")
+        for name, hits in sorted(data['counters'].items()):
+            if name.endswith(': aciertos'):
+                prefix = name[:-len(': aciertos')]
+                total = hits + data['counters'].get(f"{prefix}: fallos", 0)
+                if total:
+                    lines.append(f"    {prefix + ': tasa de aciertos':<48} {hits / total:>10.1%}")
+    return '\n'.join(lines)
+
+def print_report():
+    """
+    Muestra el reporte de la instrumentación si está activada.
+    """
+    if enabled:
+        print(format_report())
@@ -0,0 +1,58 @@
+# resources.py
+
+# Recursos de NLTK usados por el análisis y su ruta dentro de 'nltk_data'
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'punkt_tab': 'tokenizers/punkt_tab',
+    'wordnet': 'corpora/wordnet',
+    'sentiwordnet': 'corpora/sentiwordnet',
+    'averaged_perceptron_tagger': 'taggers/averaged_perceptron_tagger',
+    'averaged_perceptron_tagger_eng': 'taggers/averaged_perceptron_tagger_eng',
+}
+
+def missing_resources():
+    """
+    Verifica localmente, sin conectarse a internet, qué recursos de NLTK faltan.
+
+    Returns:
+        list: Nombres de los recursos que no se encuentran en las rutas de 'nltk.data.path'.
+    """
+    import nltk
+
+    missing = []
+    for name, path in NLTK_RESOURCES.items():
+        try:
+            # 'find' también encuentra los recursos comprimidos ('.zip')
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(name)
+    return missing
+
+def check_resources():
+    """
+    Informa si falta algún recurso de NLTK y cómo instalarlo.
+
+    Returns:
+        bool: True si todos los recursos están disponibles.
+    """
+    missing = missing_resources()
+    if missing:
+        print(f"Faltan recursos de NLTK: {', '.join(missing)}.")
+        print("Descárgalos una sola vez con: python main.py setup")
+        return False
+    return True
+
+def download_resources():
+    """
+    Descarga los recursos de NLTK que faltan. Es el único paso que necesita conexión a internet.
+
+    Returns:
+        bool: True si al terminar todos los recursos están disponibles.
+    """
+    import nltk
+
+    # Mostrar la versión de NLTK instalada
+    print("Versión de NLTK:", nltk.__version__)
+    for name in missing_resources():
+        nltk.download(name)
+    return check_resources()
@@ -0,0 +1,208 @@
+# result_writer.py
+
+import os
+
+# Columnas del DataFrame del análisis y su nombre en el archivo de resultados
+OUTPUT_COLUMNS = {
+    'text': 'oracion_original',
+    'target': 'label_original',
+    'positive_score': 'puntaje_positivo',
+    'negative_score': 'puntaje_negativo',
+    'sentiment_score': 'resultado_inferencia',
+    'sentiment_label': 'sentimiento',
+    'execution_time': 'tiempo_ejecucion',
+}
+
+# Formatos de salida y extensiones con que se reconocen
+OUTPUT_FORMATS = {
+    'csv': ('.csv',),
+    'parquet': ('.parquet', '.pq'),
+    'arrow': ('.arrow', '.feather', '.ipc'),
+}
+
+def output_format(path, fmt=None):
+    """
+    Determina el formato de un archivo de resultados.
+
+    Args:
+        path (str): Ruta del archivo.
+        fmt (str, opcional): Formato pedido explícitamente ('csv', 'parquet' o 'arrow').
+
+    Returns:
+        str: Formato indicado o, si no se indica, el que corresponde a la extensión (CSV por defecto).
+    """
+    if fmt:
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Formato de salida desconocido: {fmt}")
+        return fmt
+    extension = os.path.splitext(path)[1].lower()
+    for name, extensions in OUTPUT_FORMATS.items():
+        if extension in extensions:
+            return name
+    return 'csv'
+
+def output_frame(df):
+    """
+    Selecciona y renombra las columnas del archivo de resultados.
+
+    Args:
+        df (pd.DataFrame): DataFrame con los resultados del análisis.
+
+    Returns:
+        pd.DataFrame: Columnas de 'OUTPUT_COLUMNS' con sus nombres de salida.
+    """
+    df_output = df[list(OUTPUT_COLUMNS)]
+    df_output.columns = list(OUTPUT_COLUMNS.values())
+    return df_output
+
+def _import_pyarrow():
+    """
+    Importa pyarrow, que solo se necesita para los formatos columnares.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Los formatos 'parquet' y 'arrow' necesitan pyarrow: pip install pyarrow") from None
+    return pyarrow
+
+def columnar_schema():
+    """
+    Esquema de los resultados en formato columnar: puntajes y tiempos en float32 y
+    etiquetas codificadas como diccionario.
+
+    Returns:
+        pyarrow.Schema: Esquema de la tabla de resultados.
+    """
+    pa = _import_pyarrow()
+    label = pa.dictionary(pa.int8(), pa.string())
+    return pa.schema([
+        ('oracion_original', pa.string()),
+        ('label_original', label),
+        ('puntaje_positivo', pa.float32()),
+        ('puntaje_negativo', pa.float32()),
+        ('resultado_inferencia', pa.float32()),
+        ('sentimiento', label),
+        ('tiempo_ejecucion', pa.float32()),
+    ])
+
+def _label_array(values):
+    """
+    Codifica una columna de etiquetas con el diccionario fijo de 'SENTIMENT_LABELS',
+    el mismo en todos los bloques (lo exige el formato de archivo de Arrow).
+    """
+    import numpy as np
+    import pandas as pd
+    from fuzzy_logic import SENTIMENT_LABELS
+
+    pa = _import_pyarrow()
+    codes = pd.Categorical(values, categories=SENTIMENT_LABELS).codes
+    indices = pa.array(codes.astype(np.int8), mask=codes < 0)
+    return pa.DictionaryArray.from_arrays(indices, pa.array(SENTIMENT_LABELS, pa.string()))
+
+def columnar_table(df):
+    """
+    Convierte los resultados del análisis en una tabla de Arrow con 'columnar_schema'.
+
+    Args:
+        df (pd.DataFrame): DataFrame con los resultados del análisis.
+
+    Returns:
+        pyarrow.Table: Tabla con las columnas de salida.
+    """
+    pa = _import_pyarrow()
+    schema = columnar_schema()
+    df_output = output_frame(df)
+    columns = []
+    for field in schema:
+        values = df_output[field.name]
+        if pa.types.is_dictionary(field.type):
+            columns.append(_label_array(values))
+        elif field.type == pa.string():
+            columns.append(pa.array(values.astype(str).tolist(), pa.string()))
+        else:
+            columns.append(pa.array(values.to_numpy(dtype='float32'), field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+class ResultWriter:
+    """
+    Escribe los resultados del análisis por bloques en CSV, Parquet o Arrow IPC.
+
+    En Parquet cada bloque se guarda como un grupo de filas y en Arrow como un
+    lote de registros, a medida que se escriben; el archivo queda completo al
+    llamar a 'close'.
+    """
+
+    def __init__(self, path, fmt=None):
+        """
+        Args:
+            path (str): Archivo de resultados.
+            fmt (str, opcional): Formato ('csv', 'parquet' o 'arrow'); por defecto según la extensión.
+        """
+        self.path = path
+        self.format = output_format(path, fmt)
+        self.rows = 0
+        self._started = False
+        self._writer = None
+        if self.format == 'parquet':
+            _import_pyarrow()
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, columnar_schema(), compression='zstd')
+        elif self.format == 'arrow':
+            pa = _import_pyarrow()
+            self._sink = pa.OSFile(path, 'wb')
+            self._writer = pa.ipc.new_file(self._sink, columnar_schema(),
+                                           options=pa.ipc.IpcWriteOptions(compression='zstd'))
+
+    def write(self, df):
+        """
+        Agrega un bloque de resultados al archivo.
+
+        Args:
+            df (pd.DataFrame): DataFrame con los resultados del análisis.
+        """
+        if self.format == 'csv':
+            # Guardar el DataFrame en un archivo CSV sin índice
+            output_frame(df).to_csv(self.path, index=False, mode='a' if self._started else 'w',
+                                    header=not self._started)
+        else:
+            self._writer.write_table(columnar_table(df))
+        self._started = True
+        self.rows += len(df)
+
+    def close(self):
+        """
+        Termina de escribir el archivo.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            if self.format == 'arrow':
+                self._sink.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def load_results(path, fmt=None):
+    """
+    Carga un archivo de resultados escrito por 'ResultWriter'.
+
+    Args:
+        path (str): Archivo de resultados.
+        fmt (str, opcional): Formato; por defecto según la extensión.
+
+    Returns:
+        pd.DataFrame: Resultados, con las etiquetas como categorías en los formatos columnares.
+    """
+    import pandas as pd
+
+    fmt = output_format(path, fmt)
+    if fmt == 'csv':
+        return pd.read_csv(path)
+    if fmt == 'parquet':
+        return pd.read_parquet(path)
+    pa = _import_pyarrow()
+    with pa.memory_map(path) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
@@ -0,0 +1,161 @@
+# score_cache.py
+
+import hashlib
+import sqlite3
+
+# Archivo por defecto del caché de puntajes
+DEFAULT_CACHE_PATH = 'score_cache.sqlite'
+
+# Cantidad máxima de textos guardados por defecto
+DEFAULT_MAX_ENTRIES = 5_000_000
+
+# Parámetros por consulta (SQLite admite al menos 999)
+QUERY_BATCH = 900
+
+def text_key(text):
+    """
+    Calcula la clave de un texto preprocesado en el caché.
+
+    Args:
+        text (str): Texto preprocesado ('clean_text').
+
+    Returns:
+        bytes: Resumen BLAKE2b de 16 bytes del texto en UTF-8.
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+class ScoreCache:
+    """
+    Caché persistente en SQLite que asocia el resumen de cada texto preprocesado a
+    sus puntajes (positive_score, negative_score).
+
+    Las entradas guardan la ejecución en que se usaron por última vez; al superar
+    'max_entries' se eliminan las menos usadas recientemente. Si la versión del
+    puntuador o de los datos de NLTK cambia, el caché se vacía al abrirlo.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, version='', max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            path (str): Archivo SQLite del caché.
+            version (str): Versión del puntuador y de los datos (ver 'sentiment_lexicon.scorer_version').
+            max_entries (int): Cantidad máxima de textos guardados.
+        """
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS scores (key BLOB PRIMARY KEY, "
+                                "positive REAL NOT NULL, negative REAL NOT NULL, "
+                                "last_used INTEGER NOT NULL) WITHOUT ROWID")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS scores_last_used ON scores (last_used)")
+
+        with self.connection:
+            if self._get_meta('version') != version:
+                # Puntajes calculados con otro código o con otros datos de NLTK
+                self.connection.execute("DELETE FROM scores")
+                self._set_meta('version', version)
+            # Reloj lógico: cada apertura del caché es una ejecución nueva
+            self.clock = int(self._get_meta('clock') or 0) + 1
+            self._set_meta('clock', str(self.clock))
+
+    def _get_meta(self, name):
+        row = self.connection.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, name, value):
+        self.connection.execute("INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value))
+
+    def get_many(self, keys):
+        """
+        Busca en bloque los puntajes de varias claves y marca como usadas las encontradas.
+
+        Args:
+            keys (list): Claves calculadas con 'text_key'.
+
+        Returns:
+            dict: Puntajes (positive_score, negative_score) de las claves encontradas.
+        """
+        found = {}
+        keys = list(keys)
+        with self.connection:
+            for start in range(0, len(keys), QUERY_BATCH):
+                batch = keys[start:start + QUERY_BATCH]
+                placeholders = ','.join('?' * len(batch))
+                rows = self.connection.execute(
+                    f"SELECT key, positive, negative FROM scores WHERE key IN ({placeholders})", batch)
+                found.update((key, (positive, negative)) for key, positive, negative in rows)
+                self.connection.execute(
+                    f"UPDATE scores SET last_used = ? WHERE key IN ({placeholders})", [self.clock, *batch])
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items):
+        """
+        Guarda los puntajes de varias claves.
+
+        Args:
+            items (iterable): Pares (clave, (positive_score, negative_score)).
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO scores (key, positive, negative, last_used) VALUES (?, ?, ?, ?)",
+                ((key, float(pos), float(neg), self.clock) for key, (pos, neg) in items))
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM scores").fetchone()[0]
+
+    def evict(self):
+        """
+        Elimina las entradas menos usadas recientemente hasta respetar 'max_entries'.
+
+        Returns:
+            int: Cantidad de entradas eliminadas.
+        """
+        excess = len(self) - self.max_entries
+        if excess <= 0:
+            return 0
+        with self.connection:
+            self.connection.execute("DELETE FROM scores WHERE key IN "
+                                    "(SELECT key FROM scores ORDER BY last_used LIMIT ?)", (excess,))
+        return excess
+
+    def close(self):
+        """
+        Aplica el límite de tamaño y cierra la base de datos.
+        """
+        self.evict()
+        self.connection.close()
+
+def cached_scores(texts, cache, score):
+    """
+    Obtiene los puntajes de una lista de textos consultando primero el caché y
+    calculando solo los textos que no están (una vez por texto distinto).
+
+    Args:
+        texts (list): Textos preprocesados.
+        cache (ScoreCache): Caché de puntajes.
+        score (callable): Función que recibe una lista de textos y devuelve sus puntajes
+                          (por ejemplo 'sentiment_lexicon.score_texts').
+
+    Returns:
+        list: Lista de tuplas (pos_score, neg_score), en el mismo orden que 'texts'.
+    """
+    keys = [text_key(text) for text in texts]
+    found = cache.get_many(dict.fromkeys(keys))
+
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in found and key not in missing:
+            missing[key] = text
+    if missing:
+        new_scores = score(list(missing.values()))
+        computed = dict(zip(missing, new_scores))
+        cache.put_many(computed.items())
+        found.update(computed)
+
+    return [found[key] for key in keys]
@@ -1,14 +1,38 @@
 # sentiment_lexicon.py
 
+import functools
+import multiprocessing
+import os
 import nltk
+import profiling
 from nltk.tokenize import word_tokenize
-from nltk.corpus import wordnet, sentiwordnet as swn
-from nltk.wsd import lesk
-from nltk.stem import WordNetLemmatizer
-from nltk import pos_tag
+from nltk.corpus import sentiwordnet as swn
+from nltk.corpus.reader.wordnet import ADJ, VERB, NOUN, ADV
+from nltk.tag import PerceptronTagger
+from fast_lesk import get_index
+from lexicon_artifact import CompiledLexicon
+from preprocessing import tokenize_clean_text
 
-# Inicializar el lematizador de WordNet
-lemmatizer = WordNetLemmatizer()
+# Etiquetador POS compartido (ver 'get_tagger')
+tagger = None
+
+# Léxico compilado en uso (ver 'load_compiled_lexicon'); None para usar NLTK directamente
+compiled_lexicon = None
+
+# Tamaños por defecto de los cachés de memoización (ver 'configure_caches')
+DEFAULT_CACHE_SIZES = {'lesk': 262144, 'sentiwordnet': 65536}
+
+# Puntajes aproximados sin contexto por (palabra, etiqueta, modo) (ver 'approximate_scores')
+approximate_lexicon = {}
+
+# Motores de puntuación aproximados (sin Lesk) y su modo
+APPROXIMATE_SCORERS = {'first-sense': 'first', 'mean-sense': 'mean'}
+
+# Versión del cálculo de puntajes: debe incrementarse si cambia el resultado de 'score_texts'
+SCORER_VERSION = 1
+
+# Recursos de NLTK de los que dependen los puntajes
+SCORER_RESOURCES = ('corpora/wordnet', 'corpora/sentiwordnet', 'taggers/averaged_perceptron_tagger_eng')
 
 def get_wordnet_pos(treebank_tag):
     """
@@ -21,21 +45,53 @@ def get_wordnet_pos(treebank_tag):
         str or None: Etiqueta POS correspondiente en WordNet ('n', 'v', 'a', 'r') o None si no coincide.
     """
     if treebank_tag.startswith('J'):
-        return wordnet.ADJ  # Adjetivo
+        return ADJ  # Adjetivo
     elif treebank_tag.startswith('V'):
-        return wordnet.VERB  # Verbo
+        return VERB  # Verbo
     elif treebank_tag.startswith('N'):
-        return wordnet.NOUN  # Sustantivo
+        return NOUN  # Sustantivo
     elif treebank_tag.startswith('R'):
-        return wordnet.ADV  # Adverbio
+        return ADV  # Adverbio
     else:
         return None  # Si no es una categoría relevante
 
+def get_tagger():
+    """
+    Obtiene el etiquetador POS de perceptrón, creándolo una sola vez por proceso.
+
+    'nltk.pos_tag' crea y carga un 'PerceptronTagger' nuevo en cada llamada; reutilizar
+    una única instancia produce las mismas etiquetas sin repetir esa carga.
+
+    Returns:
+        PerceptronTagger: Etiquetador POS de NLTK para inglés.
+    """
+    global tagger
+    if tagger is None:
+        tagger = PerceptronTagger()
+    return tagger
+
+def tag_token_lists(token_lists):
+    """
+    Etiqueta en bloque varias oraciones con el etiquetador compartido, como
+    'nltk.pos_tag_sents' pero sin crear un etiquetador nuevo por bloque.
+
+    Args:
+        token_lists (list): Listas de tokens, una por texto.
+
+    Returns:
+        list: Listas de pares (token, etiqueta), idénticas a las de 'nltk.pos_tag'.
+    """
+    tag = get_tagger().tag
+    return [tag(tokens) for tokens in token_lists]
+
 def calculate_sentiment_scores(text):
     """
     Calcula los puntajes de sentimiento positivos y negativos de un texto dado,
     utilizando SentiWordNet y desambiguación de sentido con el algoritmo de Lesk.
 
+    La desambiguación usa el índice de firmas de glosas de 'fast_lesk', que elige
+    los mismos synsets que 'nltk.wsd.lesk' sin recalcular las definiciones en cada llamada.
+
     Args:
         text (str): Texto preprocesado para el cual se calcularán los puntajes de sentimiento.
 
@@ -44,8 +100,34 @@ def calculate_sentiment_scores(text):
     """
     # Tokenizar el texto en palabras
     tokens = word_tokenize(text)
+    return score_tokens(tokens)
+
+def score_tokens(tokens):
+    """
+    Calcula los puntajes de sentimiento positivos y negativos de un texto ya tokenizado
+    (ver 'calculate_sentiment_scores').
+
+    Args:
+        tokens (list): Tokens del texto.
+
+    Returns:
+        tuple: Una tupla (pos_score, neg_score) con los puntajes positivos y negativos acumulados.
+    """
     # Etiquetar cada token con su categoría gramatical (POS tagging)
-    pos_tags = pos_tag(tokens)
+    pos_tags = get_tagger().tag(tokens)
+    return score_tagged_tokens(tokens, pos_tags)
+
+def score_tagged_tokens(tokens, pos_tags):
+    """
+    Calcula los puntajes de sentimiento de un texto ya tokenizado y etiquetado.
+
+    Args:
+        tokens (list): Tokens del texto.
+        pos_tags (list): Pares (token, etiqueta Treebank) de los mismos tokens.
+
+    Returns:
+        tuple: Una tupla (pos_score, neg_score) con los puntajes positivos y negativos acumulados.
+    """
     # Inicializar los puntajes acumulados
     pos_score = 0.0
     neg_score = 0.0
@@ -54,27 +136,400 @@ def calculate_sentiment_scores(text):
     for i, (word, tag) in enumerate(pos_tags):
         # Obtener la etiqueta POS de WordNet correspondiente
         wn_tag = get_wordnet_pos(tag)
-        if wn_tag not in (wordnet.NOUN, wordnet.ADJ, wordnet.ADV, wordnet.VERB):
+        if wn_tag not in (NOUN, ADJ, ADV, VERB):
             continue  # Si no es una categoría relevante, pasar al siguiente token
 
-        # Lematizar la palabra con la etiqueta POS de WordNet
-        lemma = lemmatizer.lemmatize(word, pos=wn_tag)
-
         # Definir el contexto para la desambiguación (ventana de 10 palabras)
         context = tokens[max(0, i - 5):i + 5]
 
-        # Realizar desambiguación de sentido usando el algoritmo de Lesk
-        synset = lesk(context, word, pos=wn_tag)
+        # Desambiguar la palabra y obtener los puntajes de su synset
+        scores = synset_scores(context, word, wn_tag)
+        if scores is not None:
+            # Acumular los puntajes positivos y negativos
+            pos_score += scores[0]
+            neg_score += scores[1]
 
+    return pos_score, neg_score
+
+def synset_scores(context, word, wn_tag):
+    """
+    Desambigua una palabra con el algoritmo de Lesk y obtiene los puntajes de
+    SentiWordNet del synset elegido.
+
+    Args:
+        context (list): Palabras de la ventana de contexto.
+        word (str): Palabra a desambiguar.
+        wn_tag (str): Etiqueta POS de WordNet de la palabra.
+
+    Returns:
+        tuple or None: (puntaje positivo, puntaje negativo) del synset, o None si la
+                       palabra no tiene synsets o el synset no está en SentiWordNet.
+    """
+    synset = disambiguate(context, word, wn_tag)
+    if synset is None:
+        return None
+    return senti_scores(synset)
+
+def disambiguate(context, word, wn_tag):
+    """
+    Elige el synset de una palabra con el algoritmo de Lesk.
+
+    Si hay un léxico compilado cargado y contiene la palabra, se resuelve sobre él
+    sin acceder a los corpus de NLTK; en caso contrario se usa WordNet. Lesk solo
+    depende del conjunto de palabras del contexto, por lo que el resultado se
+    memoriza por (conjunto del contexto, palabra, etiqueta).
+
+    Args:
+        context (list): Palabras de la ventana de contexto.
+        word (str): Palabra a desambiguar.
+        wn_tag (str): Etiqueta POS de WordNet de la palabra.
+
+    Returns:
+        int, str or None: Índice del synset en el léxico compilado, nombre del synset
+                          de WordNet, o None si la palabra no tiene synsets.
+    """
+    return _cached_disambiguate(frozenset(context), word, wn_tag)
+
+def _disambiguate(context, word, wn_tag):
+    """
+    Desambiguación sin memorizar (ver 'disambiguate').
+    """
+    if compiled_lexicon is not None:
+        synset = compiled_lexicon.lesk(context, word, wn_tag)
         if synset is not None:
-            try:
-                # Obtener los puntajes de sentimiento del synset desde SentiWordNet
-                swn_synset = swn.senti_synset(synset.name())
-                # Acumular los puntajes positivos y negativos
-                pos_score += swn_synset.pos_score()
-                neg_score += swn_synset.neg_score()
-            except:
-                # Si ocurre un error al obtener los puntajes (por ejemplo, el synset no está en SentiWordNet), continuar
-                continue
+            return synset if synset >= 0 else None
 
-    return pos_score, neg_score
+    # Realizar desambiguación de sentido usando el algoritmo de Lesk
+    return get_index().lesk_name(context, word, pos=wn_tag)
+
+def senti_scores(synset):
+    """
+    Obtiene los puntajes de SentiWordNet de un synset elegido por 'disambiguate'.
+    El resultado se memoriza por synset.
+
+    Args:
+        synset (int or str): Índice en el léxico compilado o nombre del synset de WordNet.
+
+    Returns:
+        tuple or None: (puntaje positivo, puntaje negativo), o None si el synset no
+                       está en SentiWordNet.
+    """
+    return _cached_senti_scores(synset)
+
+def _senti_scores(synset):
+    """
+    Búsqueda en SentiWordNet sin memorizar (ver 'senti_scores').
+    """
+    if isinstance(synset, int):
+        return compiled_lexicon.senti_scores(synset)
+
+    try:
+        # Obtener los puntajes de sentimiento del synset desde SentiWordNet
+        swn_synset = swn.senti_synset(synset)
+        return swn_synset.pos_score(), swn_synset.neg_score()
+    except:
+        # Si ocurre un error al obtener los puntajes (por ejemplo, el synset no está en SentiWordNet), continuar
+        return None
+
+def sense_candidates(word, wn_tag):
+    """
+    Obtiene los synsets candidatos de una palabra en el orden de WordNet, los
+    mismos entre los que elige Lesk.
+
+    Args:
+        word (str): Palabra.
+        wn_tag (str): Etiqueta POS de WordNet.
+
+    Returns:
+        list: Índices del léxico compilado o nombres de synsets de WordNet.
+    """
+    if compiled_lexicon is not None:
+        senses = compiled_lexicon.senses(word, wn_tag)
+        if senses is not None:
+            return senses
+    return [name for name, _ in get_index().candidates(word, wn_tag)]
+
+def approximate_scores(word, wn_tag, mode='first'):
+    """
+    Puntajes de SentiWordNet de una palabra sin desambiguar por contexto.
+
+    Con 'first' se usa el primer sentido de WordNet (el más frecuente); con 'mean',
+    el promedio de los puntajes de todos sus sentidos que están en SentiWordNet.
+    Cada (palabra, etiqueta, modo) se calcula una sola vez por proceso.
+
+    Args:
+        word (str): Palabra.
+        wn_tag (str): Etiqueta POS de WordNet.
+        mode (str): 'first' o 'mean'.
+
+    Returns:
+        tuple or None: (puntaje positivo, puntaje negativo), o None si no hay puntajes.
+    """
+    key = (word, wn_tag, mode)
+    if key in approximate_lexicon:
+        return approximate_lexicon[key]
+
+    candidates = sense_candidates(word, wn_tag)
+    if mode == 'first':
+        scores = senti_scores(candidates[0]) if candidates else None
+    elif mode == 'mean':
+        found = [pair for pair in map(senti_scores, candidates) if pair is not None]
+        scores = (sum(pos for pos, _ in found) / len(found),
+                  sum(neg for _, neg in found) / len(found)) if found else None
+    else:
+        raise ValueError(f"Modo aproximado desconocido: {mode}")
+    approximate_lexicon[key] = scores
+    return scores
+
+def score_texts_approximate(texts, mode='first', batch_size=1000):
+    """
+    Calcula puntajes de sentimiento aproximados, sin desambiguación de Lesk: cada
+    palabra relevante aporta los puntajes de 'approximate_scores'. Es más rápido
+    que 'score_texts' pero no equivalente.
+
+    Args:
+        texts (list): Textos preprocesados.
+        mode (str): 'first' o 'mean' (ver 'approximate_scores').
+        batch_size (int): Textos tokenizados y etiquetados por bloque.
+
+    Returns:
+        list: Lista de tuplas (pos_score, neg_score), en el mismo orden que 'texts'.
+    """
+    scores = []
+    for start in range(0, len(texts), batch_size):
+        token_lists = [tokenize_clean_text(text) for text in texts[start:start + batch_size]]
+        for pos_tags in tag_token_lists(token_lists):
+            pos_score = neg_score = 0.0
+            for word, tag in pos_tags:
+                wn_tag = get_wordnet_pos(tag)
+                if wn_tag is None:
+                    continue
+                word_scores = approximate_scores(word, wn_tag, mode)
+                if word_scores is not None:
+                    pos_score += word_scores[0]
+                    neg_score += word_scores[1]
+            scores.append((pos_score, neg_score))
+    return scores
+
+def configure_caches(lesk=None, sentiwordnet=None):
+    """
+    Crea (vacíos) los cachés LRU de Lesk y de SentiWordNet. Cada proceso tiene sus
+    propios cachés.
+
+    Args:
+        lesk (int, opcional): Entradas máximas del caché de resultados de Lesk.
+        sentiwordnet (int, opcional): Entradas máximas del caché de puntajes de SentiWordNet.
+                                      En ambos, None usa el tamaño actual y 0 desactiva el caché.
+    """
+    global _cached_disambiguate, _cached_senti_scores
+    requested = {'lesk': lesk, 'sentiwordnet': sentiwordnet}
+    cache_sizes.update({name: size for name, size in requested.items() if size is not None})
+    _cached_disambiguate = functools.lru_cache(maxsize=cache_sizes['lesk'])(_disambiguate)
+    _cached_senti_scores = functools.lru_cache(maxsize=cache_sizes['sentiwordnet'])(_senti_scores)
+
+def cache_stats():
+    """
+    Estadísticas de los cachés de memoización del proceso actual.
+
+    Returns:
+        dict: Para cada caché ('lesk', 'sentiwordnet'), aciertos, fallos,
+              entradas, tamaño máximo y tasa de aciertos.
+    """
+    stats = {}
+    for name, cached in (('lesk', _cached_disambiguate), ('sentiwordnet', _cached_senti_scores)):
+        info = cached.cache_info()
+        calls = info.hits + info.misses
+        stats[name] = {'hits': info.hits, 'misses': info.misses, 'size': info.currsize,
+                       'maxsize': info.maxsize, 'hit_rate': info.hits / calls if calls else 0.0}
+    return stats
+
+def clear_caches():
+    """
+    Vacía los cachés de memoización (incluidos los puntajes aproximados) y reinicia
+    sus estadísticas.
+    """
+    approximate_lexicon.clear()
+    for cached in (_cached_disambiguate, _cached_senti_scores):
+        cached.cache_clear()
+
+# Tamaños en uso y cachés del proceso
+cache_sizes = dict(DEFAULT_CACHE_SIZES)
+configure_caches()
+
+def scorer_version(scorer='nltk'):
+    """
+    Identifica el código y los datos con que se calculan los puntajes, para invalidar
+    puntajes guardados (ver 'score_cache') cuando cambian. No carga los corpus: usa la
+    versión de NLTK y el tamaño y la fecha de modificación de cada recurso instalado.
+
+    Args:
+        scorer (str): Motor de puntuación (ver 'get_scorer'). 'nltk' y 'array' dan los
+                      mismos puntajes y comparten versión; los modos aproximados no.
+
+    Returns:
+        str: Versión del puntuador, de NLTK y de los recursos de 'SCORER_RESOURCES'.
+    """
+    parts = [f"scorer={SCORER_VERSION}", f"nltk={nltk.__version__}"]
+    if scorer in APPROXIMATE_SCORERS:
+        parts.append(f"mode={scorer}")
+    for resource in SCORER_RESOURCES:
+        pointer = nltk.data.find(resource)
+        # Los recursos pueden estar instalados como directorio o como archivo '.zip'
+        path = pointer.zipfile.filename if hasattr(pointer, 'zipfile') else pointer.path
+        stat = os.stat(path)
+        parts.append(f"{resource}={stat.st_size}:{stat.st_mtime_ns}")
+    return ';'.join(parts)
+
+def load_compiled_lexicon(path):
+    """
+    Activa un léxico compilado con 'lexicon_artifact.build_artifact' para las
+    siguientes llamadas a 'calculate_sentiment_scores'.
+
+    Args:
+        path (str): Archivo del léxico compilado.
+
+    Returns:
+        CompiledLexicon: Léxico abierto con 'mmap'.
+    """
+    global compiled_lexicon
+    compiled_lexicon = CompiledLexicon(path)
+    # Los resultados memorizados con NLTK no sirven para el léxico compilado
+    clear_caches()
+    return compiled_lexicon
+
+def score_texts(texts, batch_size=1000):
+    """
+    Calcula los puntajes de sentimiento de una lista de textos preprocesados.
+
+    Los textos se tokenizan con 'tokenize_clean_text', que sobre textos preprocesados
+    da los mismos tokens que 'word_tokenize' sin pasar por Punkt ni Treebank, y se
+    etiquetan por bloques con un único etiquetador ('tag_token_lists').
+
+    Args:
+        texts (list): Textos preprocesados.
+        batch_size (int): Textos tokenizados y etiquetados por bloque.
+
+    Returns:
+        list: Lista de tuplas (pos_score, neg_score), en el mismo orden que 'texts'.
+    """
+    scores = []
+    for start in range(0, len(texts), batch_size):
+        token_lists = [tokenize_clean_text(text) for text in texts[start:start + batch_size]]
+        tagged_lists = tag_token_lists(token_lists)
+        scores.extend(score_tagged_tokens(tokens, pos_tags)
+                      for tokens, pos_tags in zip(token_lists, tagged_lists))
+    return scores
+
+def get_scorer(name='nltk'):
+    """
+    Obtiene la función de puntuación de un motor.
+
+    Args:
+        name (str): 'nltk' ('score_texts', token por token), 'array'
+                    ('array_scoring.score_texts_array', sobre el corpus codificado con enteros),
+                    o un modo aproximado sin Lesk: 'first-sense' o 'mean-sense'
+                    ('score_texts_approximate').
+
+    Returns:
+        callable: Función que recibe una lista de textos preprocesados y devuelve sus puntajes.
+    """
+    if name in APPROXIMATE_SCORERS:
+        return functools.partial(score_texts_approximate, mode=APPROXIMATE_SCORERS[name])
+    if name == 'array':
+        from array_scoring import score_texts_array
+        return score_texts_array
+    if name != 'nltk':
+        raise ValueError(f"Motor de puntuación desconocido: {name}")
+    return score_texts
+
+def score_chunk(texts, scorer='nltk'):
+    """
+    Puntúa un bloque en un proceso de trabajo y devuelve además lo que el proceso
+    principal debe combinar: las entradas nuevas del índice de Lesk (para guardarlas
+    con 'fast_lesk.save_index') y la instrumentación acumulada durante el bloque.
+
+    Args:
+        texts (list): Textos preprocesados.
+        scorer (str): Motor de puntuación (ver 'get_scorer').
+
+    Returns:
+        tuple: (puntajes, entradas nuevas del índice, 'profiling.snapshot()' del bloque
+               o None si la instrumentación está desactivada).
+    """
+    if profiling.enabled:
+        profiling.reset()
+    scores = get_scorer(scorer)(texts)
+    return scores, get_index().take_new_entries(), profiling.snapshot() if profiling.enabled else None
+
+def init_worker(lexicon_path=None, profile=False, sizes=None):
+    """
+    Inicializa un proceso de trabajo cargando una sola vez los recursos que usa
+    'calculate_sentiment_scores' (léxico compilado, tokenizador, etiquetador,
+    WordNet y SentiWordNet), para que cada bloque se procese con el estado ya cargado.
+
+    Args:
+        lexicon_path (str, opcional): Archivo del léxico compilado a usar en el proceso.
+        profile (bool): Si se activa la instrumentación de 'profiling' en el proceso.
+        sizes (dict, opcional): Tamaños de los cachés de memoización (ver 'configure_caches').
+    """
+    configure_caches(**(sizes or {}))
+    if lexicon_path:
+        load_compiled_lexicon(lexicon_path)
+    if profile:
+        profiling.enable()
+    # Un texto corto fuerza la carga perezosa de todos los recursos de NLTK
+    score_texts(['good morning'])
+
+def create_pool(workers, lexicon_path=None):
+    """
+    Crea un grupo de procesos de trabajo ya inicializados con 'init_worker',
+    para reutilizarlo en varias llamadas a 'score_texts_parallel'.
+
+    Args:
+        workers (int): Cantidad de procesos de trabajo.
+        lexicon_path (str, opcional): Archivo del léxico compilado a usar en cada proceso.
+
+    Returns:
+        multiprocessing.Pool: Grupo de procesos; debe cerrarse al terminar.
+    """
+    return multiprocessing.Pool(workers, initializer=init_worker,
+                                initargs=(lexicon_path, profiling.enabled, dict(cache_sizes)))
+
+def score_texts_parallel(texts, workers, lexicon_path=None, chunk_size=None, pool=None, scorer='nltk'):
+    """
+    Calcula los puntajes de sentimiento repartiendo los textos en bloques entre
+    varios procesos. El resultado es idéntico al de 'score_texts' y conserva el orden.
+
+    Args:
+        texts (list): Textos preprocesados.
+        workers (int): Cantidad de procesos de trabajo.
+        lexicon_path (str, opcional): Archivo del léxico compilado a usar en cada proceso.
+        chunk_size (int, opcional): Textos por bloque; por defecto se reparten en
+                                    unos cuatro bloques por proceso (hasta 2000 textos por bloque).
+        pool (multiprocessing.Pool, opcional): Grupo creado con 'create_pool' a reutilizar;
+                                               si no se indica, se crea uno para esta llamada.
+        scorer (str): Motor de puntuación de cada bloque (ver 'get_scorer').
+
+    Returns:
+        list: Lista de tuplas (pos_score, neg_score), en el mismo orden que 'texts'.
+    """
+    if chunk_size is None:
+        chunk_size = max(1, min(2000, -(-len(texts) // (workers * 4))))
+    chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), chunk_size)]
+    # Cada bloque devuelve también las entradas nuevas del índice de Lesk y sus contadores
+    score_block = functools.partial(score_chunk, scorer=scorer)
+
+    if pool is not None:
+        results = pool.map(score_block, chunks)
+    else:
+        with create_pool(workers, lexicon_path) as pool:
+            # 'map' devuelve los bloques en el orden de entrada
+            results = pool.map(score_block, chunks)
+
+    index = get_index()
+    for _, index_entries, chunk_profile in results:
+        index.merge(index_entries)
+        if chunk_profile is not None:
+            profiling.merge(chunk_profile)
+
+    return [scores for chunk, _, _ in results for scores in chunk]
@@ -0,0 +1,252 @@
+# service.py
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+# Dirección por defecto del servicio (solo accesible desde la máquina local)
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+class SentimentModel:
+    """
+    Estado del análisis que el servicio mantiene cargado entre solicitudes: léxico,
+    etiquetador, calibración y funciones de membresía.
+    """
+
+    def __init__(self, calibration_path, engine='batch', lexicon_path=None):
+        """
+        Args:
+            calibration_path (str): Calibración fija creada con 'python main.py calibrate'.
+            engine (str): Motor de inferencia vectorizado ('batch' o 'analytic').
+            lexicon_path (str, opcional): Léxico compilado a usar.
+        """
+        from fuzzy_logic import load_calibration, calibrated_membership_functions
+        from sentiment_lexicon import load_compiled_lexicon
+
+        if engine not in ('batch', 'analytic'):
+            raise ValueError(f"Motor de inferencia no disponible en el servicio: {engine}")
+        self.engine = engine
+        self.calibration = load_calibration(calibration_path)
+        self.mf = calibrated_membership_functions(self.calibration)
+        if lexicon_path:
+            load_compiled_lexicon(lexicon_path)
+        # Cargar los recursos de NLTK antes de aceptar solicitudes
+        self.analyze(['good morning'])
+
+    def analyze(self, texts):
+        """
+        Preprocesa, puntúa e infiere un lote de textos.
+
+        Args:
+            texts (list): Textos originales.
+
+        Returns:
+            list: Un diccionario por texto con 'positive_score', 'negative_score',
+                  'sentiment_score' y 'sentiment_label'.
+        """
+        import numpy as np
+        from preprocessing import preprocess_texts
+        from sentiment_lexicon import score_texts
+        from fuzzy_logic import (
+            apply_calibration_range,
+            fuzzy_inference_batch,
+            fuzzy_inference_analytic,
+            get_sentiment_label
+        )
+
+        scores = np.array(score_texts(preprocess_texts(texts)), dtype=float).reshape(-1, 2)
+        pos_scores, neg_scores, _ = apply_calibration_range(scores[:, 0], scores[:, 1], self.calibration)
+        if self.engine == 'batch':
+            sentiment_scores = fuzzy_inference_batch(pos_scores, neg_scores, self.mf)
+        else:
+            sentiment_scores = fuzzy_inference_analytic(pos_scores, neg_scores, self.mf)
+        return [{'positive_score': float(pos), 'negative_score': float(neg),
+                 'sentiment_score': float(score), 'sentiment_label': get_sentiment_label(score)}
+                for (pos, neg), score in zip(scores, sentiment_scores)]
+
+class MicroBatcher:
+    """
+    Agrupa las solicitudes concurrentes en lotes: un lote se procesa cuando reúne
+    'max_batch_size' textos o cuando el primero lleva 'max_latency' segundos esperando.
+    Los lotes se procesan de a uno en un hilo aparte, sin bloquear el bucle de eventos.
+    """
+
+    def __init__(self, model, max_batch_size=256, max_latency=0.01):
+        """
+        Args:
+            model (SentimentModel): Modelo ya cargado.
+            max_batch_size (int): Textos máximos por lote.
+            max_latency (float): Espera máxima en segundos para completar un lote.
+        """
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.queue = asyncio.Queue()
+        self.batches = 0
+        self.requests = 0
+
+    async def submit(self, text):
+        """
+        Encola un texto y espera su resultado.
+
+        Args:
+            text (str): Texto original.
+
+        Returns:
+            dict: Resultado de 'SentimentModel.analyze' para el texto.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, future))
+        return await future
+
+    async def run(self):
+        """
+        Bucle que arma y procesa los lotes mientras el servicio está activo.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_latency
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                results = await loop.run_in_executor(None, self.model.analyze, texts)
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+            self.batches += 1
+            self.requests += len(batch)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+async def handle_connection(reader, writer, batcher):
+    """
+    Atiende una conexión con el protocolo de líneas JSON: cada línea
+    '{"id": ..., "text": "..."}' recibe una línea con el mismo 'id' y el resultado,
+    o '{"id": ..., "error": "..."}'. Las solicitudes de una conexión se procesan
+    concurrentemente, por lo que las respuestas pueden llegar en otro orden.
+
+    Args:
+        reader (asyncio.StreamReader): Flujo de entrada de la conexión.
+        writer (asyncio.StreamWriter): Flujo de salida de la conexión.
+        batcher (MicroBatcher): Agrupador de solicitudes.
+    """
+    async def respond(request_id, text, error=None):
+        try:
+            if error is None and not isinstance(text, str):
+                error = "Falta el campo 'text'."
+            if error is not None:
+                raise ValueError(error)
+            response = {'id': request_id, **await batcher.submit(text)}
+        except Exception as error:
+            response = {'id': request_id, 'error': str(error)}
+        writer.write((json.dumps(response) + '\n').encode('utf-8'))
+        await writer.drain()
+
+    pending = set()
+    try:
+        while line := await reader.readline():
+            try:
+                request = json.loads(line)
+                request_id, text, error = request.get('id'), request.get('text'), None
+            except (ValueError, AttributeError):
+                request_id, text, error = None, None, "La línea no es un objeto JSON válido."
+            task = asyncio.create_task(respond(request_id, text, error))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+async def serve(model, host=DEFAULT_HOST, port=DEFAULT_PORT, max_batch_size=256, max_latency=0.01):
+    """
+    Inicia el servicio y atiende conexiones hasta que se interrumpe.
+
+    Args:
+        model (SentimentModel): Modelo ya cargado.
+        host (str): Dirección donde escuchar.
+        port (int): Puerto donde escuchar.
+        max_batch_size (int): Textos máximos por lote.
+        max_latency (float): Espera máxima en segundos para completar un lote.
+    """
+    batcher = MicroBatcher(model, max_batch_size, max_latency)
+    batch_task = asyncio.create_task(batcher.run())
+    server = await asyncio.start_server(lambda r, w: handle_connection(r, w, batcher), host, port)
+    print(f"Servicio de sentimiento escuchando en {host}:{port} "
+          f"(lotes de hasta {max_batch_size} textos, espera máxima {max_latency * 1000:.1f} ms).")
+    started = time.perf_counter()
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        batch_task.cancel()
+        elapsed = time.perf_counter() - started
+        if batcher.batches:
+            print(f"{batcher.requests} solicitudes en {batcher.batches} lotes "
+                  f"({batcher.requests / batcher.batches:.1f} por lote) en {elapsed:.1f} s.")
+
+def parse_args(argv=None):
+    """
+    Interpreta los argumentos de línea de comandos del servicio.
+
+    Args:
+        argv (list, opcional): Lista de argumentos; por defecto se usan los de 'sys.argv'.
+
+    Returns:
+        argparse.Namespace: Opciones seleccionadas.
+    """
+    parser = argparse.ArgumentParser(description="Servicio local de análisis de sentimiento (líneas JSON sobre TCP).")
+    parser.add_argument('--calibration', required=True,
+                        help="Calibración fija creada con 'python main.py calibrate'.")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"Dirección (por defecto: {DEFAULT_HOST}).")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"Puerto (por defecto: {DEFAULT_PORT}).")
+    parser.add_argument('--max-batch-size', type=int, default=256,
+                        help="Textos máximos por lote (por defecto: 256).")
+    parser.add_argument('--max-latency-ms', type=float, default=10.0,
+                        help="Espera máxima para completar un lote, en milisegundos (por defecto: 10).")
+    parser.add_argument('--fuzzy-engine', choices=['batch', 'analytic'], default='batch',
+                        help="Motor de inferencia (por defecto: batch).")
+    parser.add_argument('--lexicon', default=None, help="Léxico compilado a usar.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Carga el modelo una sola vez y atiende solicitudes hasta que se interrumpe (Ctrl+C).
+
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos (ver 'parse_args').
+    """
+    from resources import check_resources
+    from fast_lesk import save_index
+
+    args = parse_args(argv)
+    if not check_resources():
+        sys.exit(1)
+    model = SentimentModel(args.calibration, args.fuzzy_engine, args.lexicon)
+    try:
+        asyncio.run(serve(model, args.host, args.port, args.max_batch_size, args.max_latency_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Guardar las firmas de glosas nuevas para las próximas ejecuciones
+        save_index()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+# sharding.py
+
+import argparse
+import glob
+import json
+import os
+import sys
+
+# Archivo que describe los fragmentos de una ejecución distribuida
+MANIFEST_NAME = 'manifest.json'
+
+# Versión del formato del manifiesto
+MANIFEST_VERSION = 1
+
+# Filas por fragmento por defecto
+DEFAULT_SHARD_SIZE = 100000
+
+def shard_file(shard_id, stage):
+    """
+    Nombre del archivo de una etapa de un fragmento, relativo al directorio de fragmentos.
+
+    Args:
+        shard_id (int): Número de fragmento.
+        stage (str): 'input' (CSV original), 'scores' (puntajes), 'stats' (límites
+                     de los puntajes) u 'output' (resultados inferidos).
+
+    Returns:
+        str: Nombre del archivo.
+    """
+    extension = {'input': 'csv', 'stats': 'json'}.get(stage, 'pkl')
+    return f"shard_{shard_id:05d}.{stage}.{extension}"
+
+def _write_json(data, path):
+    """
+    Escribe un JSON de forma atómica: un archivo a medio escribir nunca se toma como terminado.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+def _write_pickle(df, path):
+    """
+    Guarda un DataFrame de forma atómica (ver '_write_json').
+    """
+    tmp_path = f"{path}.tmp"
+    df.to_pickle(tmp_path, compression=None)
+    os.replace(tmp_path, path)
+
+def load_manifest(shard_dir):
+    """
+    Carga el manifiesto de un directorio de fragmentos.
+
+    Args:
+        shard_dir (str): Directorio de fragmentos creado con 'split_input'.
+
+    Returns:
+        dict: Manifiesto.
+    """
+    with open(os.path.join(shard_dir, MANIFEST_NAME)) as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"Versión de manifiesto no soportada en '{shard_dir}': {manifest.get('version')}")
+    return manifest
+
+def split_input(input_path, shard_dir, shard_size=DEFAULT_SHARD_SIZE):
+    """
+    Divide el dataset en fragmentos CSV de 'shard_size' filas consecutivas y escribe
+    el manifiesto. Cada fragmento puede preprocesarse y puntuarse en otro nodo que
+    vea el mismo directorio; las rutas del manifiesto son relativas a 'shard_dir'.
+    Los archivos de una división anterior en el mismo directorio se eliminan.
+
+    Args:
+        input_path (str): Dataset CSV con las columnas 'sentence' y 'sentiment'.
+        shard_dir (str): Directorio donde escribir los fragmentos.
+        shard_size (int): Filas por fragmento.
+
+    Returns:
+        dict: Manifiesto con un elemento por fragmento ('id', 'rows' y 'input').
+    """
+    import pandas as pd
+
+    os.makedirs(shard_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(shard_dir, 'shard_*')) + glob.glob(os.path.join(shard_dir, MANIFEST_NAME)):
+        os.remove(path)
+
+    shards = []
+    for chunk in pd.read_csv(input_path, chunksize=shard_size):
+        if chunk.empty:
+            continue
+        shard = {'id': len(shards), 'rows': len(chunk), 'input': shard_file(len(shards), 'input')}
+        chunk.to_csv(os.path.join(shard_dir, shard['input']), index=False)
+        shards.append(shard)
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'input': os.path.abspath(input_path),
+        'shard_size': shard_size,
+        'rows': sum(shard['rows'] for shard in shards),
+        'shards': shards,
+    }
+    _write_json(manifest, os.path.join(shard_dir, MANIFEST_NAME))
+    print(f"{manifest['rows']} tweets divididos en {len(shards)} fragmentos en '{shard_dir}'.")
+    return manifest
+
+def score_shard(shard_dir, shard_id, scorer='nltk', lexicon_path=None, workers=1):
+    """
+    Etapa de mapeo de los puntajes: preprocesa y puntúa un fragmento, y guarda los
+    puntajes y sus límites (una calibración del fragmento, ver 'fuzzy_logic.fit_calibration').
+
+    Args:
+        shard_dir (str): Directorio de fragmentos.
+        shard_id (int): Número de fragmento.
+        scorer (str): Motor de puntuación (ver 'sentiment_lexicon.get_scorer').
+        lexicon_path (str, opcional): Léxico compilado para los procesos de trabajo.
+        workers (int): Procesos de trabajo del nodo para puntuar.
+
+    Returns:
+        dict: Límites de los puntajes del fragmento, con las clases de sentimiento encontradas.
+    """
+    import pandas as pd
+    import profiling
+    from main import prepare_dataset, calculate_scores
+    from fuzzy_logic import fit_calibration
+
+    profiling.reset()
+    chunk = pd.read_csv(os.path.join(shard_dir, shard_file(shard_id, 'input')))
+    sentiment_values = chunk['sentiment'].dropna().unique().tolist()
+    df = calculate_scores(prepare_dataset(chunk), workers=workers, lexicon_path=lexicon_path, scorer=scorer)
+    _write_pickle(df, os.path.join(shard_dir, shard_file(shard_id, 'scores')))
+
+    stats = fit_calibration(df['positive_score'], df['negative_score'])
+    stats['shard'] = shard_id
+    stats['sentiment_values'] = sorted(sentiment_values)
+    stats['targets'] = sorted(df['target'].dropna().unique().tolist())
+    _write_json(stats, os.path.join(shard_dir, shard_file(shard_id, 'stats')))
+    stats['profile'] = profiling.snapshot() if profiling.enabled else None
+    return stats
+
+def reduce_calibration(shard_dir):
+    """
+    Etapa de reducción: combina los límites de todos los fragmentos en la calibración
+    global y la guarda en el manifiesto. Las funciones de membresía construidas con
+    ella son las mismas que las de una ejecución sobre el dataset completo.
+
+    Args:
+        shard_dir (str): Directorio de fragmentos.
+
+    Returns:
+        dict: Calibración global, con 'sentiment_values' y 'targets' de todos los fragmentos.
+
+    Raises:
+        FileNotFoundError: Si algún fragmento todavía no fue puntuado.
+    """
+    from fuzzy_logic import merge_calibrations
+
+    manifest = load_manifest(shard_dir)
+    stats = []
+    for shard in manifest['shards']:
+        path = os.path.join(shard_dir, shard_file(shard['id'], 'stats'))
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"El fragmento {shard['id']} no fue puntuado: falta '{path}'.")
+        with open(path) as f:
+            stats.append(json.load(f))
+
+    calibration = merge_calibrations(stats)
+    calibration['sentiment_values'] = sorted({value for shard in stats for value in shard['sentiment_values']})
+    calibration['targets'] = sorted({target for shard in stats for target in shard['targets']})
+    manifest['calibration'] = calibration
+    _write_json(manifest, os.path.join(shard_dir, MANIFEST_NAME))
+    return calibration
+
+def infer_shard(shard_dir, shard_id, engine='batch', table_path=None, table_resolution=512,
+                calibration=None, out_of_range='clip'):
+    """
+    Etapa de mapeo de la inferencia: infiere un fragmento ya puntuado con la
+    calibración global del manifiesto (o con una calibración fija) y guarda los resultados.
+
+    Args:
+        shard_dir (str): Directorio de fragmentos.
+        shard_id (int): Número de fragmento.
+        engine (str): Motor de inferencia (ver 'main.apply_fuzzy_logic').
+        table_path (str, opcional): Tabla de inferencia para el motor 'table'.
+        table_resolution (int): Puntos por eje de la tabla si hay que construirla.
+        calibration (dict, opcional): Calibración fija; si no se indica, se usa la de
+                                      'reduce_calibration' y la política de rango no se aplica.
+        out_of_range (str): Política para puntajes fuera de una calibración fija ('clip' o 'error').
+
+    Returns:
+        int: Cantidad de tweets inferidos.
+    """
+    import pandas as pd
+    from main import infer_sentiment, infer_calibrated, get_inference_table
+    from fuzzy_logic import calibrated_membership_functions
+
+    fixed = calibration is not None
+    if not fixed:
+        calibration = load_manifest(shard_dir).get('calibration')
+        if calibration is None:
+            raise ValueError(f"Falta la calibración global en '{shard_dir}': ejecuta primero la reducción.")
+    mf = calibrated_membership_functions(calibration)
+    table = get_inference_table(mf, table_path, table_resolution) if engine == 'table' else None
+
+    df = pd.read_pickle(os.path.join(shard_dir, shard_file(shard_id, 'scores')), compression=None)
+    if fixed:
+        df = infer_calibrated(df, mf, calibration, engine, table, out_of_range)
+    else:
+        df = infer_sentiment(df, mf, engine, table)
+    _write_pickle(df, os.path.join(shard_dir, shard_file(shard_id, 'output')))
+    return len(df)
+
+def merge_outputs(shard_dir, output_path, output_format=None):
+    """
+    Une los resultados de todos los fragmentos en el orden del dataset original.
+
+    Args:
+        shard_dir (str): Directorio de fragmentos.
+        output_path (str): Archivo de resultados.
+        output_format (str, opcional): 'csv', 'parquet' o 'arrow'; por defecto según la extensión.
+
+    Returns:
+        dict: Resumen de benchmarks de todos los fragmentos (ver 'benchmark.summarize_benchmarks').
+    """
+    import pandas as pd
+    from benchmark import summarize_benchmarks, merge_benchmark_summaries
+    from result_writer import ResultWriter
+
+    summary = None
+    with ResultWriter(output_path, output_format) as writer:
+        for shard in load_manifest(shard_dir)['shards']:
+            df = pd.read_pickle(os.path.join(shard_dir, shard_file(shard['id'], 'output')), compression=None)
+            writer.write(df)
+            summary = merge_benchmark_summaries(summary, summarize_benchmarks(df))
+    print(f"Resultados de {writer.rows} tweets guardados en '{output_path}'.")
+    return summary
+
+def parse_args(argv=None):
+    """
+    Interpreta los argumentos para ejecutar cada etapa por separado, por ejemplo
+    en distintas máquinas que comparten el directorio de fragmentos.
+
+    Args:
+        argv (list, opcional): Lista de argumentos; por defecto se usan los de 'sys.argv'.
+
+    Returns:
+        argparse.Namespace: Opciones seleccionadas.
+    """
+    parser = argparse.ArgumentParser(description="Etapas de la ejecución distribuida por fragmentos.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    split = subparsers.add_parser('split', help="Divide el dataset en fragmentos y escribe el manifiesto.")
+    split.add_argument('shard_dir', help="Directorio de fragmentos.")
+    split.add_argument('--input', default='sentiment140.csv', help="Dataset CSV de entrada.")
+    split.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE,
+                       help=f"Filas por fragmento (por defecto: {DEFAULT_SHARD_SIZE}).")
+
+    score = subparsers.add_parser('score', help="Preprocesa y puntúa fragmentos.")
+    score.add_argument('shard_dir', help="Directorio de fragmentos.")
+    score.add_argument('shards', type=int, nargs='+', help="Números de fragmento.")
+    score.add_argument('--scorer', choices=['nltk', 'array', 'first-sense', 'mean-sense'], default='nltk')
+    score.add_argument('--lexicon', default=None, help="Léxico compilado a usar.")
+    score.add_argument('--workers', type=int, default=1, help="Procesos de trabajo del nodo.")
+
+    reduce = subparsers.add_parser('reduce', help="Combina los límites de los fragmentos en la calibración global.")
+    reduce.add_argument('shard_dir', help="Directorio de fragmentos.")
+
+    infer = subparsers.add_parser('infer', help="Infiere fragmentos con la calibración global.")
+    infer.add_argument('shard_dir', help="Directorio de fragmentos.")
+    infer.add_argument('shards', type=int, nargs='+', help="Números de fragmento.")
+    infer.add_argument('--fuzzy-engine', choices=['batch', 'analytic', 'table', 'scalar'], default='batch')
+    infer.add_argument('--table-path', default=None, help="Tabla de inferencia para el motor 'table'.")
+    infer.add_argument('--table-resolution', type=int, default=512)
+    infer.add_argument('--calibration', default=None,
+                       help="Calibración fija a usar en lugar de la global (no hace falta 'reduce').")
+    infer.add_argument('--out-of-range', choices=['clip', 'error'], default='clip',
+                       help="Con --calibration, qué hacer con puntajes fuera del rango calibrado.")
+
+    merge = subparsers.add_parser('merge', help="Une los resultados de los fragmentos en orden.")
+    merge.add_argument('shard_dir', help="Directorio de fragmentos.")
+    merge.add_argument('--output', default='resultado_sentimiento.csv', help="Archivo de resultados.")
+    merge.add_argument('--output-format', choices=['csv', 'parquet', 'arrow'], default=None)
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Ejecuta una etapa de la ejecución distribuida (ver 'parse_args'). 'python main.py
+    --nodes N' ejecuta todas las etapas en una sola máquina.
+
+    Args:
+        argv (list, opcional): Argumentos de línea de comandos.
+    """
+    args = parse_args(argv)
+    if args.command == 'split':
+        split_input(args.input, args.shard_dir, args.shard_size)
+    elif args.command == 'score':
+        from resources import check_resources
+        from sentiment_lexicon import load_compiled_lexicon
+
+        if not check_resources():
+            sys.exit(1)
+        if args.lexicon:
+            load_compiled_lexicon(args.lexicon)
+        for shard_id in args.shards:
+            stats = score_shard(args.shard_dir, shard_id, args.scorer, args.lexicon, args.workers)
+            print(f"Fragmento {shard_id} puntuado ({stats['rows']} tweets).")
+    elif args.command == 'reduce':
+        calibration = reduce_calibration(args.shard_dir)
+        print(f"Calibración global ({calibration['rows']} tweets): "
+              f"positivo {calibration['pos_min']}..{calibration['pos_max']}, "
+              f"negativo {calibration['neg_min']}..{calibration['neg_max']}.")
+    elif args.command == 'infer':
+        from fuzzy_logic import load_calibration
+
+        calibration = load_calibration(args.calibration) if args.calibration else None
+        for shard_id in args.shards:
+            rows = infer_shard(args.shard_dir, shard_id, args.fuzzy_engine, args.table_path, args.table_resolution,
+                               calibration, args.out_of_range)
+            print(f"Fragmento {shard_id} inferido ({rows} tweets).")
+    else:
+        from benchmark import print_benchmarks
+
+        print_benchmarks(merge_outputs(args.shard_dir, args.output, args.output_format))
+
+if __name__ == '__main__':
+    main()